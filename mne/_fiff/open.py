@@ -55,6 +55,44 @@ def _fiff_get_fid(fname):
     return fid
 
 
+def _fiff_get_memmap(fname):
+    """Memory-map an uncompressed FIF file, or return None if not possible."""
+    if _file_like(fname):
+        return None
+    fname = str(fname)
+    if op.splitext(fname)[1].lower() == ".gz" or op.getsize(fname) == 0:
+        return None
+    logger.debug("Using memory-mapped I/O")
+    return np.memmap(fname, dtype=np.uint8, mode="r")
+
+
+class _FiffMemmap:
+    """Hold the memory map of a FIF file, created on first use.
+
+    Copies and unpickled instances start without a map, so that copying a
+    Raw instance (or sending it to a worker process) never copies the file.
+    """
+
+    def __init__(self):
+        self._mm = None
+        self._mapped = False
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+    def get(self, fname):
+        """Get the map of the file, or None if it cannot be mapped."""
+        if not self._mapped:
+            self._mm = _fiff_get_memmap(fname)
+            self._mapped = True
+        return self._mm
+
+    def close(self):
+        """Release the map (it is created again on the next use)."""
+        self._mm = None
+        self._mapped = False
+
+
 def _get_next_fname(fid, fname, tree):
     """Get the next filename in split files."""
     nodes_list = dir_tree_find(tree, FIFF.FIFFB_REF)
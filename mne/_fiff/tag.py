@@ -439,6 +439,43 @@ for key, dtype in _simple_dict.items():
     _call_dict_names[key] = dtype
 
 
+# Types whose payload can be viewed in place as a 2D array
+_memmap_dict = dict(_simple_dict)
+_memmap_dict.update(
+    {
+        FIFF.FIFFT_COMPLEX_FLOAT: ">c8",
+        FIFF.FIFFT_COMPLEX_DOUBLE: ">c16",
+    }
+)
+
+
+def _read_tag_memmap(mm, ent, shape):
+    """Get a view of the data of a tag in a memory-mapped file.
+
+    Parameters
+    ----------
+    mm : instance of numpy.memmap
+        The FIF file mapped as bytes (see ``_fiff_get_memmap``).
+    ent : instance of Tag
+        The directory entry of the tag.
+    shape : tuple
+        The shape of the stored (row-major) matrix.
+
+    Returns
+    -------
+    data : ndarray | None
+        A read-only view of the tag data (in file byte order), or None if
+        the tag type is not a simple type or the tag data are truncated.
+    """
+    if ent.type not in _memmap_dict:
+        return None
+    dtype = np.dtype(_memmap_dict[ent.type])
+    offset = ent.pos + 16  # skip the tag header
+    if np.prod(shape) * dtype.itemsize != ent.size or offset + ent.size > len(mm):
+        return None
+    return np.ndarray(shape, dtype=dtype, buffer=mm, offset=offset)
+
+
 def read_tag(fid, pos=None, shape=None, rlims=None):
     """Read a Tag from a file at a given position.
 
@@ -8,6 +8,7 @@ from scipy.fft import irfft, rfft
 
 from .utils import (
     _check_option,
+    _custom_lru_cache,
     _explain_exception,
     fill_doc,
     get_config,
@@ -167,7 +168,7 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     -----
     This function is designed to be used with fft_multiply_repeated().
     """
-    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=rfft(h, n=n_fft))
+    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=_rfft_filter(h, n_fft))
     if isinstance(n_jobs, str):
         _check_option("n_jobs", n_jobs, ("cuda",))
         n_jobs = 1
@@ -194,6 +195,15 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     return n_jobs, cuda_dict
 
 
+# The same filter is often applied to many signals (e.g., each epoch or run)
+@_custom_lru_cache(10)
+def _rfft_filter(h, n_fft):
+    """Compute the (read-only) spectrum of a filter."""
+    h_fft = rfft(h, n=n_fft)
+    h_fft.flags.writeable = False
+    return h_fft
+
+
 def _fft_multiply_repeated(x, cuda_dict):
     """Do FFT multiplication by a filter function (possibly using CUDA).
 
@@ -201,8 +211,8 @@ def _fft_multiply_repeated(x, cuda_dict):
     ----------
     h_fft : 1-d array or gpuarray
         The filtering array to apply.
-    x : 1-d array
-        The array to filter.
+    x : array
+        The array to filter (along the last axis).
     n_fft : int
         The number of points in the FFT.
     cuda_dict : dict
@@ -210,7 +220,7 @@ def _fft_multiply_repeated(x, cuda_dict):
 
     Returns
     -------
-    x : 1-d array
+    x : array
         Filtered version of x.
     """
     # do the fourier-domain operations
@@ -368,7 +378,7 @@ def _fft_resample(x, new_len, npads, to_removes, cuda_dict=None, pad="reflect_li
 
 # this has to go in mne.cuda instead of mne.filter to avoid import errors
 def _smart_pad(x, n_pad, pad="reflect_limited"):
-    """Pad vector x."""
+    """Pad x along the last axis."""
     n_pad = np.asarray(n_pad)
     assert n_pad.shape == (2,)
     if (n_pad == 0).all():
@@ -377,16 +387,18 @@ def _smart_pad(x, n_pad, pad="reflect_limited"):
         raise RuntimeError("n_pad must be non-negative")
     if pad == "reflect_limited":
         # need to pad with zeros if len(x) <= npad
-        l_z_pad = np.zeros(max(n_pad[0] - len(x) + 1, 0), dtype=x.dtype)
-        r_z_pad = np.zeros(max(n_pad[1] - len(x) + 1, 0), dtype=x.dtype)
+        shape = x.shape[:-1]
+        l_z_pad = np.zeros(shape + (max(n_pad[0] - x.shape[-1] + 1, 0),), x.dtype)
+        r_z_pad = np.zeros(shape + (max(n_pad[1] - x.shape[-1] + 1, 0),), x.dtype)
         return np.concatenate(
             [
                 l_z_pad,
-                2 * x[0] - x[n_pad[0] : 0 : -1],
+                2 * x[..., :1] - x[..., n_pad[0] : 0 : -1],
                 x,
-                2 * x[-1] - x[-2 : -n_pad[1] - 2 : -1],
+                2 * x[..., -1:] - x[..., -2 : -n_pad[1] - 2 : -1],
                 r_z_pad,
-            ]
+            ],
+            axis=-1,
         )
     else:
-        return np.pad(x, (tuple(n_pad),), pad)
+        return np.pad(x, ((0, 0),) * (x.ndim - 1) + (tuple(n_pad),), pad)
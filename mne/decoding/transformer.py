@@ -462,8 +462,8 @@ class FilterEstimator(TransformerMixin):
         - l_freq is not None, h_freq is None: low-pass filter
         - l_freq is None, h_freq is not None: high-pass filter
 
-    If n_jobs > 1, more memory is required as "len(picks) * n_times"
-    additional time points need to be temporarily stored in memory.
+    If n_jobs > 1, the channels are filtered in place by n_jobs threads, so
+    no additional copy of the data is stored in memory.
 
     Parameters
     ----------
@@ -61,6 +61,7 @@ from ._fiff.write import (
 from .annotations import (
     EpochAnnotationsMixin,
     _read_annotations_fif,
+    _sync_onset,
     _write_annotations,
 )
 from .baseline import _check_baseline, _log_rescale, rescale
@@ -109,6 +110,9 @@ from .utils import (
 from .utils.docs import fill_doc
 from .viz import plot_drop_log, plot_epochs, plot_epochs_image, plot_topo_image_epochs
 
+# Number of samples (channels x times) of epochs to read and process at once
+_EPOCH_BATCH_SIZE = 2**24
+
 
 def _pack_reject_params(epochs):
     reject_params = dict()
@@ -678,7 +682,11 @@ class BaseEpochs(
         if preload_at_end:
             assert self._data is None
             assert self.preload is False
-            self.load_data()  # this will do the projection
+            # this will do the projection
+            if isinstance(preload_at_end, (bool, np.bool_)):
+                self.load_data()
+            else:
+                self.to_memmap(preload_at_end)
         elif proj is True and self._projector is not None and data is not None:
             # let's make sure we project if data was provided and proj
             # requested
@@ -734,7 +742,11 @@ class BaseEpochs(
         """
         if self.preload:
             return self
-        self._data = self._get_data()
+        return self._preload_data()
+
+    def _preload_data(self, data_buffer=None):
+        """Actually preload the data."""
+        self._data = self._get_data(data_buffer=data_buffer)
         self.preload = True
         self._do_baseline = False
         self._decim_slice = slice(None, None, None)
@@ -744,6 +756,57 @@ class BaseEpochs(
         self._raw = None  # shouldn't need it anymore
         return self
 
+    @verbose
+    def to_memmap(self, fname, *, overwrite=False, verbose=None):
+        """Store the epochs data in a memory-mapped file.
+
+        Parameters
+        ----------
+        fname : path-like
+            The file to store the data in. Its contents are only valid for
+            the lifetime of this object and should not be used otherwise;
+            use :meth:`mne.Epochs.save` to save epochs to disk.
+        %(overwrite)s
+        %(verbose)s
+
+        Returns
+        -------
+        epochs : instance of Epochs
+            The epochs object, with its data memory-mapped.
+
+        Notes
+        -----
+        If the data are not preloaded, bad epochs are dropped and the
+        remaining ones are read directly into the memory-mapped file, so the
+        data never need to fit in memory at once. If the data are already
+        preloaded, they are copied into the file and the in-memory array is
+        released.
+
+        Afterward, :meth:`~mne.Epochs.get_data`, :meth:`~mne.Epochs.average`,
+        :meth:`~mne.Epochs.drop_bad`, :meth:`~mne.Epochs.crop`,
+        :meth:`~mne.Epochs.decimate`, and indexing with slices or contiguous
+        ranges of epochs operate on the file without copying the data into
+        memory. Epochs obtained by indexing thus share the file with the
+        original instance, so modifying the data of one inplace (e.g., using
+        :meth:`~mne.Epochs.apply_baseline` or :meth:`~mne.Epochs.drop_bad`)
+        also modifies the other.
+
+        This function operates in-place.
+
+        .. versionadded:: 1.7
+        """
+        from .io.base import _allocate_data
+
+        fname = _check_fname(fname, overwrite=overwrite, name="fname")
+        if self.preload:
+            data = _allocate_data(fname, self._data.shape, self._data.dtype)
+            data[:] = self._data
+            self._data = data
+        else:
+            self._preload_data(fname)
+        logger.info(f"Epochs data stored in memory-mapped file {fname}")
+        return self
+
     @verbose
     def apply_baseline(self, baseline=(None, 0), *, verbose=None):
         """Baseline correct epochs.
@@ -914,6 +977,8 @@ class BaseEpochs(
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
         """Aux Function: detrend, baseline correct, offset, decim.
 
+        Works on a single epoch or on a (n_epochs, n_channels, n_times) block.
+
         Note: operates inplace
         """
         if (epoch is None) or isinstance(epoch, str):
@@ -924,7 +989,9 @@ class BaseEpochs(
             # We explicitly detrend just data channels (not EMG, ECG, EOG which
             # are processed by baseline correction)
             use_picks = _pick_data_channels(self.info, exclude=())
-            epoch[use_picks] = detrend(epoch[use_picks], self.detrend, axis=1)
+            epoch[..., use_picks, :] = detrend(
+                epoch[..., use_picks, :], self.detrend, axis=-1
+            )
 
         # Baseline correct
         if self._do_baseline:
@@ -938,7 +1005,7 @@ class BaseEpochs(
             )
 
         # Decimate if necessary (i.e., epoch not preloaded)
-        epoch = epoch[:, self._decim_slice]
+        epoch = epoch[..., self._decim_slice]
 
         # handle offset
         if self._offset is not None:
@@ -1561,6 +1628,61 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _get_epochs_from_raw(self, idxs, verbose=None):
+        """Get several epochs from disk.
+
+        Returns a list with one entry per index, each of which is what
+        ``_get_epoch_from_raw`` would return. Arrays can share memory, so
+        they must not be modified inplace.
+        """
+        return [self._get_epoch_from_raw(idx) for idx in idxs]
+
+    def _iter_epochs_from_raw(self, use_idx, project=True):
+        """Load and process epochs from disk in batches.
+
+        Epochs are read with ``_get_epochs_from_raw`` and then detrended,
+        baseline corrected, decimated and (if ``project``) projected as one
+        (n_epochs, n_channels, n_times) block per batch.
+
+        Yields
+        ------
+        idx : int
+            The epoch index.
+        epoch_noproj : ndarray | str | None
+            The processed epoch before projection (or the rejection reason).
+        epoch : ndarray | str | None
+            The processed epoch after projection.
+        """
+        n_raw_times = len(self._raw_times)
+        n_batch = max(_EPOCH_BATCH_SIZE // (len(self.ch_names) * n_raw_times), 1)
+        detrend_picks = self._detrend_picks
+        for bi in range(0, len(use_idx), n_batch):
+            idxs = use_idx[bi : bi + n_batch]
+            epochs = self._get_epochs_from_raw(idxs)
+            full = [
+                ii
+                for ii, epoch in enumerate(epochs)
+                if isinstance(epoch, np.ndarray) and epoch.shape[-1] == n_raw_times
+            ]
+            out = [None] * len(epochs)
+            if len(full):
+                dtype = np.result_type(*(epochs[ii].dtype for ii in full))
+                block = np.empty((len(full),) + epochs[full[0]].shape, dtype)
+                for jj, ii in enumerate(full):
+                    block[jj] = epochs[ii]
+                block = self._detrend_offset_decim(block, detrend_picks)
+                block_proj = self._project_epoch(block) if project else block
+                for jj, ii in enumerate(full):
+                    out[ii] = (block[jj], block_proj[jj])
+            for ii, (idx, epoch) in enumerate(zip(idxs, epochs)):
+                if out[ii] is None:  # too short or rejected, process one by one
+                    if isinstance(epoch, np.ndarray):
+                        epoch = epoch.copy()
+                    epoch = self._detrend_offset_decim(epoch, detrend_picks)
+                    out[ii] = (epoch, self._project_epoch(epoch) if project else epoch)
+                yield (idx,) + out[ii]
+                out[ii] = None
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1569,7 +1691,8 @@ class BaseEpochs(
             return epoch
         proj = self._do_delayed_proj or self.proj
         if self._projector is not None and proj is True:
-            epoch = np.dot(self._projector, epoch)
+            # matmul broadcasts over a leading epochs dimension, too
+            epoch = self._projector @ epoch
         return epoch
 
     def _handle_empty(self, on_empty, meth):
@@ -1593,6 +1716,7 @@ class BaseEpochs(
         tmax=None,
         copy=False,
         on_empty="warn",
+        data_buffer=None,
         verbose=None,
     ):
         """Load all data, dropping bad epochs along the way.
@@ -1610,9 +1734,12 @@ class BaseEpochs(
             Start time of data to get in seconds.
         tmax : int | float | None
             End time of data to get in seconds.
+        data_buffer : path-like | None
+            If path-like, data that need to be read from disk are stored in a
+            memory-mapped file with this name instead of in memory.
         %(verbose)s
         """
-        from .io.base import _get_ch_factors
+        from .io.base import _allocate_data, _get_ch_factors
 
         if copy is not None:
             _validate_type(copy, bool, "copy")
@@ -1697,19 +1824,16 @@ class BaseEpochs(
                 )
 
             # we need to load from disk, drop, and return data
-            detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
+            epochs = self._iter_epochs_from_raw(
+                use_idx, project=not self._do_delayed_proj
+            )
+            for ii, (_, _, epoch_out) in enumerate(epochs):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
-                if self._do_delayed_proj:
-                    epoch_out = epoch_noproj
-                else:
-                    epoch_out = self._project_epoch(epoch_noproj)
                 if ii == 0:
-                    data = np.empty(
+                    data = _allocate_data(
+                        data_buffer,
                         (n_events, len(self.ch_names), len(self.times)),
-                        dtype=epoch_out.dtype,
+                        epoch_out.dtype,
                     )
                 data[ii] = epoch_out
         else:
@@ -1719,8 +1843,8 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
-            if not self.preload:
-                detrend_picks = self._detrend_picks
+            if not self.preload:  # from disk
+                epochs = self._iter_epochs_from_raw(np.arange(n_events))
             for idx, sel in enumerate(self.selection):
                 if self.preload:  # from memory
                     if self._do_delayed_proj:
@@ -1729,12 +1853,8 @@ class BaseEpochs(
                     else:
                         epoch_noproj = None
                         epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
-                    )
-                    epoch = self._project_epoch(epoch_noproj)
+                else:
+                    _, epoch_noproj, epoch = next(epochs)
 
                 epoch_out = epoch_noproj if self._do_delayed_proj else epoch
                 is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
@@ -1749,10 +1869,10 @@ class BaseEpochs(
                 if out or self.preload:
                     # faster to pre-allocate, then trim as necessary
                     if n_out == 0 and not self.preload:
-                        data = np.empty(
+                        data = _allocate_data(
+                            data_buffer,
                             (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
-                            order="C",
+                            epoch_out.dtype,
                         )
                     data[n_out] = epoch_out
                     n_out += 1
@@ -3118,8 +3238,13 @@ class Epochs(BaseEpochs):
         Defaults to ``(None, 0)``, i.e. beginning of the the data until
         time point zero.
     %(picks_all)s
-    preload : bool
+    preload : bool | path-like
         %(epochs_preload)s
+        If path-like, the epochs are loaded into a memory-mapped file with
+        this name (see :meth:`mne.Epochs.to_memmap`).
+
+        .. versionchanged:: 1.7
+           Support for memory-mapped files.
     %(reject_epochs)s
     %(flat)s
     %(proj_epochs)s
@@ -3327,6 +3452,78 @@ class Epochs(BaseEpochs):
         )
         return data
 
+    @verbose
+    def _get_epochs_from_raw(self, idxs, verbose=None):
+        """Load several epochs from disk.
+
+        This is equivalent to calling ``_get_epoch_from_raw`` for each index,
+        but overlapping or nearby epochs are read from the raw instance in a
+        single call, and the returned epochs are views of those reads.
+        """
+        if self._raw is None:
+            # This should never happen, as raw=None only if preload=True
+            raise ValueError(
+                "An error has occurred, no valid raw file found. "
+                "Please report this to the mne-python "
+                "developers."
+            )
+        idxs = np.atleast_1d(idxs)
+        raw = self._raw
+        sfreq = raw.info["sfreq"]
+        n_raw_times = len(self._raw_times)
+        event_samps = self.events[idxs, 0]
+        # same sample computations as in _get_epoch_from_raw
+        starts = np.round(event_samps + self._raw_times[0] * sfreq).astype(int)
+        starts -= raw.first_samp
+        stops = starts + n_raw_times
+        reject_tmin = self.reject_tmin
+        if reject_tmin is None:
+            reject_tmin = self._raw_times[0]
+        reject_starts = np.round(event_samps + reject_tmin * sfreq).astype(int)
+        reject_starts -= raw.first_samp
+        reject_tmax = self.reject_tmax
+        if reject_tmax is None:
+            reject_tmax = self._raw_times[-1]
+        reject_stops = stops - int(round((self._raw_times[-1] - reject_tmax) * sfreq))
+
+        out = [None] * len(idxs)
+        good = starts >= 0
+        # reject based on annotations
+        annot = raw.annotations
+        if self.reject_by_annotation and len(annot) > 0:
+            bad = np.array(
+                [desc.lower().startswith("bad") for desc in annot.description]
+            )
+            onset = _sync_onset(raw, annot.onset)[bad]
+            offset = onset + annot.duration[bad]
+            description = annot.description[bad]
+            overlaps = (onset < reject_stops[:, np.newaxis] / sfreq) & (
+                offset > reject_starts[:, np.newaxis] / sfreq
+            )
+            overlaps &= good[:, np.newaxis]
+            for ii in np.where(overlaps.any(axis=1))[0]:
+                out[ii] = description[np.argmax(overlaps[ii])]
+                good[ii] = False
+
+        # coalesce overlapping or nearby windows into single reads
+        order = np.where(good)[0]
+        order = order[np.argsort(starts[order], kind="stable")]
+        groups = list()
+        for ii in order:
+            if len(groups) and starts[ii] <= groups[-1][1] + n_raw_times:
+                groups[-1][1] = max(groups[-1][1], stops[ii])
+                groups[-1][2].append(ii)
+            else:
+                groups.append([starts[ii], stops[ii], [ii]])
+        for start, stop, group in groups:
+            logger.debug(
+                f"    Getting {len(group)} epoch{_pl(group)} for {start}-{stop}"
+            )
+            data = raw._getitem((self.picks, slice(start, stop)), return_times=False)
+            for ii in group:
+                out[ii] = data[:, starts[ii] - start : stops[ii] - start]
+        return out
+
 
 @fill_doc
 class EpochsArray(BaseEpochs):
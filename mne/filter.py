@@ -4,6 +4,7 @@
 
 from collections import Counter
 from copy import deepcopy
+from fractions import Fraction
 from functools import partial
 
 import numpy as np
@@ -15,6 +16,7 @@ from ._ola import _COLA
 from .cuda import (
     _fft_multiply_repeated,
     _fft_resample,
+    _rfft_filter,
     _setup_cuda_fft_multiply_repeated,
     _setup_cuda_fft_resample,
     _smart_pad,
@@ -23,9 +25,11 @@ from .parallel import parallel_func
 from .utils import (
     _check_option,
     _check_preload,
+    _custom_lru_cache,
     _ensure_int,
     _pl,
     _validate_type,
+    get_config,
     logger,
     sum_squared,
     verbose,
@@ -35,6 +39,13 @@ from .utils import (
 # These values from Ifeachor and Jervis.
 _length_factors = dict(hann=3.1, hamming=3.3, blackman=5.0)
 
+# The maximum number of (padded) samples in a block of rows that are FIR
+# filtered at once when no block size is given
+_OLA_BLOCK_SAMPLES = 2**21
+
+# The maximum up and down factors of polyphase resampling
+_POLY_MAX_FACTOR = 1000
+
 
 def is_power2(num):
     """Test if number is a power of 2.
@@ -305,6 +316,7 @@ def _overlap_add_filter(
     n_jobs=None,
     copy=True,
     pad="reflect_limited",
+    block_size=None,
 ):
     """Filter the signal x using h with overlap-add FFTs.
 
@@ -333,6 +345,10 @@ def _overlap_add_filter(
         on x in place.
     pad : str
         Padding type for ``_smart_pad``.
+    block_size : int | None
+        The number of signals to filter at once with batched FFTs. If None,
+        the ``MNE_FILTER_BLOCK_SIZE`` config value is used if set, otherwise
+        it is chosen from the signal length to bound the memory used.
 
     Returns
     -------
@@ -354,7 +370,32 @@ def _overlap_add_filter(
         h = np.convolve(h, h[::-1])
 
     # Determine FFT length to use
-    min_fft = 2 * len(h) - 1
+    n_fft = _get_ola_n_fft(n_fft, len(h), n_x)
+
+    # Figure out if we should use CUDA
+    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
+
+    # Process blocks of rows with batched FFTs
+    picks = _picks_to_idx(len(x), picks)
+    fun = partial(
+        _2d_overlap_filter,
+        n_h=len(h),
+        n_edge=n_edge,
+        phase=phase,
+        cuda_dict=cuda_dict,
+        pad=pad,
+        n_fft=n_fft,
+    )
+    block_size = _get_ola_block_size(block_size, n_x)
+    _filter_rows_threaded(fun, x, picks, n_jobs, block_size)
+
+    x.shape = orig_shape
+    return x
+
+
+def _get_ola_n_fft(n_fft, n_h, n_x):
+    """Choose (or check) the FFT length for overlap-add filtering."""
+    min_fft = 2 * n_h - 1
     if n_fft is None:
         max_fft = n_x
         if max_fft >= min_fft:
@@ -363,9 +404,7 @@ def _overlap_add_filter(
                 np.ceil(np.log2(min_fft)), np.ceil(np.log2(max_fft)) + 1, dtype=int
             )
             cost = (
-                np.ceil(n_x / (N - len(h) + 1).astype(np.float64))
-                * N
-                * (np.log2(N) + 1)
+                np.ceil(n_x / (N - n_h + 1).astype(np.float64)) * N * (np.log2(N) + 1)
             )
 
             # add a heuristic term to prevent too-long FFT's which are slow
@@ -382,34 +421,31 @@ def _overlap_add_filter(
             "n_fft is too short, has to be at least "
             "2 * len(h) - 1 (%s), got %s" % (min_fft, n_fft)
         )
-
-    # Figure out if we should use CUDA
-    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
-
-    # Process each row separately
-    picks = _picks_to_idx(len(x), picks)
-    parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
-    if n_jobs == 1:
-        for p in picks:
-            x[p] = _1d_overlap_filter(
-                x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft
-            )
-    else:
-        data_new = parallel(
-            p_fun(x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft) for p in picks
-        )
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
-
-    x.shape = orig_shape
-    return x
-
-
-def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
-    """Do one-dimensional overlap-add FFT FIR filtering."""
+    return n_fft
+
+
+def _get_ola_block_size(block_size, n_x):
+    """Choose (or check) the number of rows to filter at once."""
+    if block_size is None:
+        block_size = get_config("MNE_FILTER_BLOCK_SIZE", None)
+        if block_size is not None:
+            block_size = int(block_size)
+    if block_size is None:
+        # the padded rows of a block and their filtered version are held in
+        # memory at once, so limit the block to _OLA_BLOCK_SAMPLES samples
+        block_size = max(_OLA_BLOCK_SAMPLES // n_x, 1)
+    block_size = _ensure_int(block_size, "block_size")
+    if block_size < 1:
+        raise ValueError(f"block_size must be at least 1, got {block_size}")
+    logger.debug("Filtering blocks of: %s rows" % block_size)
+    return block_size
+
+
+def _2d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
+    """Do overlap-add FFT FIR filtering of a block of rows."""
     # pad to reduce ringing
     x_ext = _smart_pad(x, (n_edge, n_edge), pad)
-    n_x = len(x_ext)
+    n_x = x_ext.shape[-1]
     x_filtered = np.zeros_like(x_ext)
 
     n_seg = n_fft - n_h + 1
@@ -421,19 +457,18 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     for seg_idx in range(n_segments):
         start = seg_idx * n_seg
         stop = (seg_idx + 1) * n_seg
-        seg = x_ext[start:stop]
-        seg = np.concatenate([seg, np.zeros(n_fft - len(seg))])
-
-        prod = _fft_multiply_repeated(seg, cuda_dict)
+        # all rows of the segment are transformed at once (zero-padded to
+        # n_fft by the rfft)
+        prod = _fft_multiply_repeated(x_ext[:, start:stop], cuda_dict)
 
         start_filt = max(0, start - shift)
         stop_filt = min(start - shift + n_fft, n_x)
         start_prod = max(0, shift - start)
         stop_prod = start_prod + stop_filt - start_filt
-        x_filtered[start_filt:stop_filt] += prod[start_prod:stop_prod]
+        x_filtered[:, start_filt:stop_filt] += prod[:, start_prod:stop_prod]
 
     # Remove mirrored edges that we added and cast (n_edge can be zero)
-    x_filtered = x_filtered[: n_x - 2 * n_edge].astype(x.dtype)
+    x_filtered = x_filtered[:, : n_x - 2 * n_edge].astype(x.dtype)
     return x_filtered
 
 
@@ -555,24 +590,41 @@ def _construct_fir_filter(
         Filter coefficients.
     """
     assert freq[0] == 0
-    if fir_design == "firwin2":
-        fir_design = signal.firwin2
-    else:
-        assert fir_design == "firwin"
-        fir_design = partial(_firwin_design, sfreq=sfreq)
     # issue a warning if attenuation is less than this
     min_att_db = 12 if phase == "minimum" else 20
 
     # normalize frequencies
-    freq = np.array(freq) / (sfreq / 2.0)
+    freq = np.array(freq, float) / (sfreq / 2.0)
     if freq[0] != 0 or freq[-1] != 1:
         raise ValueError(
             "freq must start at 0 and end an Nyquist (%s), got %s" % (sfreq / 2.0, freq)
         )
-    gain = np.array(gain)
+    gain = np.array(gain, float)
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
+    h, att_db, att_freq = _design_fir(
+        sfreq, freq, gain, N, phase, fir_window, fir_design
+    )
+    if att_db < min_att_db:
+        att_freq *= sfreq / 2.0
+        warn(
+            "Attenuation at stop frequency %0.2f Hz is only %0.2f dB. "
+            "Increase filter_length for higher attenuation." % (att_freq, att_db)
+        )
+    return h.copy()
+
+
+# Designing a long FIR filter and checking its attenuation can take as long as
+# applying it to a short signal (e.g., an epoch), so cache the designs
+@_custom_lru_cache(50)
+def _design_fir(sfreq, freq, gain, N, phase, fir_window, fir_design):
+    """Design an FIR filter, returning it and its attenuation."""
+    if fir_design == "firwin2":
+        fir_design = signal.firwin2
+    else:
+        assert fir_design == "firwin"
+        fir_design = partial(_firwin_design, sfreq=sfreq)
     # construct symmetric (linear phase) filter
     if phase == "minimum":
         h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
@@ -583,13 +635,8 @@ def _construct_fir_filter(
     att_db, att_freq = _filter_attenuation(h, freq, gain)
     if phase == "zero-double":
         att_db += 6
-    if att_db < min_att_db:
-        att_freq *= sfreq / 2.0
-        warn(
-            "Attenuation at stop frequency %0.2f Hz is only %0.2f dB. "
-            "Increase filter_length for higher attenuation." % (att_freq, att_db)
-        )
-    return h
+    h.flags.writeable = False
+    return h, att_db, att_freq
 
 
 def _check_zero_phase_length(N, phase, gain_nyq=0):
@@ -645,18 +692,375 @@ def _iir_filter(x, iir_params, picks, n_jobs, copy, phase="zero"):
         else:
             fun = partial(signal.lfilter, b=iir_params["b"], a=iir_params["a"], axis=-1)
             _check_coefficients((iir_params["b"], iir_params["a"]))
-    parallel, p_fun, n_jobs = parallel_func(fun, n_jobs)
-    if n_jobs == 1:
-        for p in picks:
-            x[p] = fun(x=x[p])
-    else:
-        data_new = parallel(p_fun(x=x[p]) for p in picks)
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
+    _filter_rows_threaded(fun, x, picks, n_jobs)
     x.shape = orig_shape
     return x
 
 
+def _filter_rows_threaded(fun, x, picks, n_jobs, block_size=1):
+    """Filter rows of x in place, splitting them across threads.
+
+    The FFTs and multiply-adds of FIR filtering and the SciPy IIR filtering
+    functions release the GIL, so threads writing directly into ``x`` scale
+    across cores without pickling or copying the data for each job. Each
+    thread passes ``block_size`` rows at a time to ``fun``.
+    """
+    parallel, p_fun, n_jobs = parallel_func(
+        _filter_rows,
+        n_jobs,
+        prefer="threads",
+        require="sharedmem",
+        max_jobs=len(picks),
+    )
+    if n_jobs == 1:
+        _filter_rows(fun, x, picks, block_size)
+    else:
+        parallel(
+            p_fun(fun, x, rows, block_size) for rows in np.array_split(picks, n_jobs)
+        )
+
+
+def _filter_rows(fun, x, rows, block_size):
+    for start in range(0, len(rows), block_size):
+        block = rows[start : start + block_size]
+        x[block] = fun(x=x[block])
+
+
+###############################################################################
+# Chunked (streaming) filtering
+
+# Padding modes whose edge values only depend on the samples near each edge,
+# so they can be computed without having the whole signal in memory
+_stream_pads = ("reflect_limited", "reflect", "symmetric", "edge", "constant")
+
+
+class _FIRStreamer:
+    """Apply an FIR filter to consecutive chunks of a signal.
+
+    The output is equivalent to :func:`_overlap_add_filter` applied to the
+    entire signal (including the edge padding), but only a buffer of
+    approximately ``n_fft + len(h)`` samples per channel is held in memory.
+
+    Parameters
+    ----------
+    h : 1d array
+        Filter impulse response.
+    n_times : int
+        The total number of samples that will be fed.
+    picks : array of int
+        The channels (rows) to filter. Others are passed through unchanged.
+    phase : str
+        The filter phase, see :func:`_overlap_add_filter`.
+    pad : str
+        Padding type for ``_smart_pad``. Must be one of ``_stream_pads``.
+    n_block : int
+        The approximate number of samples per chunk, used to choose n_fft.
+    n_fft : int | None
+        Length of the FFT. If None, the best size is determined
+        automatically.
+    """
+
+    def __init__(self, h, n_times, picks, phase, pad, n_block, n_fft=None):
+        _check_option("pad", pad, _stream_pads, extra="when streaming")
+        _check_zero_phase_length(len(h), phase)
+        self._n_times = _ensure_int(n_times, "n_times")
+        self._picks = picks
+        self._pad = pad
+        self._n_edge = max(min(len(h), self._n_times) - 1, 0)
+        self._scale = None
+        if len(h) == 1:
+            self._scale = h[0] ** 2 if phase == "zero-double" else h[0]
+        if phase == "zero-double":
+            h = np.convolve(h, h[::-1])
+        self._n_fft = _get_ola_n_fft(n_fft, len(h), n_block + 2 * self._n_edge)
+        self._n_seg = self._n_fft - len(h) + 1
+        self._h_fft = _rfft_filter(h, self._n_fft)
+        # number of initial samples of the convolution to discard
+        self._n_skip = ((len(h) - 1) // 2 if phase.startswith("zero") else 0) + (
+            self._n_edge
+        )
+        self._n_in = self._n_out = 0
+        # Buffers: the unemitted input (all channels), the (padded) input to
+        # the convolution, the overlap-add accumulator, the last samples
+        # needed for end padding, and the finished filtered samples
+        self._x = self._ext = self._acc = self._tail = self._y = None
+
+    def feed(self, x):
+        """Feed a chunk of data and return the data that are finished.
+
+        Parameters
+        ----------
+        x : ndarray, shape (n_channels, n_samples)
+            The next chunk of the signal.
+
+        Returns
+        -------
+        out : ndarray, shape (n_channels, n_out)
+            The filtered data that are ready, ``n_out`` can be zero.
+        """
+        x = _check_filterable(x)
+        if self._n_in + x.shape[-1] > self._n_times:
+            raise ValueError(
+                "Fed more samples (%d) than expected (%d)"
+                % (self._n_in + x.shape[-1], self._n_times)
+            )
+        self._n_in += x.shape[-1]
+        if self._scale is not None:
+            out = x.copy()
+            out[self._picks] *= self._scale
+            self._n_out += out.shape[-1]
+            return out
+        x_picks = x[self._picks]
+        if self._x is None:
+            self._x = x.copy()
+            self._tail = x_picks
+            self._ext = np.empty((len(x_picks), 0))
+            self._acc = np.zeros((len(x_picks), self._n_fft))
+            self._y = np.empty((len(x_picks), 0))
+        else:
+            self._x = np.concatenate([self._x, x], axis=-1)
+            self._tail = np.concatenate([self._tail, x_picks], axis=-1)
+        n_head = self._n_edge + 1
+        # wait until we can do the padding at the start of the signal
+        if self._n_in - x.shape[-1] < n_head:
+            if self._n_in < n_head:
+                return self._x[:, :0].copy()
+            x_picks = self._pad_edge(self._tail[:, :n_head], (self._n_edge, 0))
+            x_picks = np.concatenate([x_picks, self._tail], axis=-1)
+        self._tail = self._tail[:, -n_head:]
+        self._ext = np.concatenate([self._ext, x_picks], axis=-1)
+        last = self._n_in == self._n_times
+        if last:
+            pad = self._pad_edge(self._tail, (0, self._n_edge))
+            self._ext = np.concatenate([self._ext, pad], axis=-1)
+        while self._ext.shape[-1] >= self._n_seg or (last and self._ext.shape[-1]):
+            seg = self._ext[:, : self._n_seg]
+            self._ext = self._ext[:, self._n_seg :]
+            x_fft = fft.rfft(seg, n=self._n_fft, axis=-1)
+            x_fft *= self._h_fft
+            self._acc += fft.irfft(x_fft, n=self._n_fft, axis=-1)
+            self._add_y(self._acc[:, : self._n_seg])
+            self._acc[:, : -self._n_seg] = self._acc[:, self._n_seg :]
+            self._acc[:, -self._n_seg :] = 0.0
+        if last:
+            self._add_y(self._acc)
+        n_use = min(self._y.shape[-1], self._n_times - self._n_out)
+        out = self._x[:, :n_use].copy()
+        out[self._picks] = self._y[:, :n_use]
+        self._x = self._x[:, n_use:]
+        self._y = self._y[:, n_use:]
+        self._n_out += n_use
+        return out
+
+    def _pad_edge(self, x, n_pad):
+        n_use = n_pad[0] if n_pad[0] else -n_pad[1]
+        if n_use == 0:
+            return x[:, :0]
+        x = _smart_pad(x, n_pad, self._pad)
+        return x[:, :n_use] if n_pad[0] else x[:, n_use:]
+
+    def _add_y(self, y):
+        n_skip = min(self._n_skip, y.shape[-1])
+        self._n_skip -= n_skip
+        self._y = np.concatenate([self._y, y[:, n_skip:]], axis=-1)
+
+
+class _IIRStreamer:
+    """Apply a causal IIR filter to consecutive chunks of a signal."""
+
+    def __init__(self, iir_params, n_times, picks):
+        self._n_times = _ensure_int(n_times, "n_times")
+        self._n_in = 0
+        self._picks = picks
+        n_picks = len(picks)
+        if "sos" in iir_params:
+            _check_coefficients(iir_params["sos"])
+            self._fun = partial(signal.sosfilt, iir_params["sos"], axis=-1)
+            self._zi = np.zeros((len(iir_params["sos"]), n_picks, 2))
+        else:
+            b, a = iir_params["b"], iir_params["a"]
+            _check_coefficients((b, a))
+            self._fun = partial(signal.lfilter, b, a, axis=-1)
+            self._zi = np.zeros((n_picks, max(len(a), len(b)) - 1))
+
+    def feed(self, x):
+        """Feed a chunk of data and return the filtered chunk."""
+        x = _check_filterable(x)
+        self._n_in += x.shape[-1]
+        if self._n_in > self._n_times:
+            raise ValueError(
+                "Fed more samples (%d) than expected (%d)" % (self._n_in, self._n_times)
+            )
+        out = x.copy()
+        out[self._picks], self._zi = self._fun(x[self._picks], zi=self._zi)
+        return out
+
+
+# Padding modes of scipy.signal.resample_poly that can be computed from the
+# samples near each edge
+_poly_stream_pads = ("reflect", "symmetric", "edge", "constant")
+
+
+class _PolyphaseStreamer:
+    """Resample consecutive chunks of a signal with a polyphase filter.
+
+    The output is equivalent to :func:`scipy.signal.resample_poly` applied to
+    the entire signal (truncated to the length from ``_resamp_ratio_len``),
+    but only the input samples needed for the next output samples
+    (approximately ``len(h) / up``) are held in memory besides the chunks.
+
+    Parameters
+    ----------
+    up : int
+        Factor to upsample by.
+    down : int
+        Factor to downsample by.
+    window : str | tuple | ndarray
+        The window to use for designing the anti-aliasing filter (or the
+        filter itself), see :func:`scipy.signal.resample_poly`.
+    pad : str
+        Padding type, one of ``_poly_stream_pads``.
+    n_times : int
+        The total number of samples that will be fed.
+    n_out : int | None
+        The total number of output samples. If None, it is computed from
+        ``up / down``, otherwise it can differ by one sample when ``up / down``
+        approximates the resampling ratio.
+    """
+
+    def __init__(self, up, down, window, pad, n_times, n_out=None):
+        _check_option("pad", pad, _poly_stream_pads, extra="when streaming")
+        self._n_times = _ensure_int(n_times, "n_times")
+        gcd = np.gcd(up, down)
+        self._up, self._down = up // gcd, down // gcd
+        self._pad = pad
+        self._h, n_pre_remove = _polyphase_filter(self._up, self._down, window)
+        # pad each edge by a multiple of down, so that output samples of
+        # upfirdn applied to any buffer starting at a multiple of down are
+        # aligned with those of the padded signal
+        self._n_pad = ((-(-len(self._h) // self._up)) // self._down + 2) * self._down
+        # the next and the last (exclusive) output sample of the padded signal
+        self._k = self._n_pad * self._up // self._down + n_pre_remove
+        if n_out is None:
+            n_out = _resamp_ratio_len(self._up, self._down, self._n_times)[1]
+        self._k_stop = self._k + n_out
+        self._n_in = 0
+        # Buffers: the input until the start can be padded, the padded signal
+        # starting at sample self._start, and the last samples needed for the
+        # end padding
+        self._head = self._x = self._tail = None
+        self._start = 0
+
+    def feed(self, x):
+        """Feed a chunk of data and return the resampled data that are ready.
+
+        Parameters
+        ----------
+        x : ndarray, shape (n_channels, n_samples)
+            The next chunk of the signal.
+
+        Returns
+        -------
+        out : ndarray, shape (n_channels, n_out)
+            The resampled data that are ready, ``n_out`` can be zero.
+        """
+        x = _check_filterable(x, "resampled", "resample")
+        if self._n_in + x.shape[-1] > self._n_times:
+            raise ValueError(
+                "Fed more samples (%d) than expected (%d)"
+                % (self._n_in + x.shape[-1], self._n_times)
+            )
+        self._n_in += x.shape[-1]
+        last = self._n_in == self._n_times
+        n_edge = self._n_pad + 1
+        if self._x is None:  # wait until we can do the padding at the start
+            self._head = (
+                x if self._head is None else np.concatenate([self._head, x], axis=-1)
+            )
+            if self._head.shape[-1] < n_edge and not last:
+                return x[:, :0].copy()
+            x, self._head = self._head, None
+            pad = self._pad_edge(x[:, :n_edge], (self._n_pad, 0))
+            self._x = np.concatenate([pad, x], axis=-1)
+            self._tail = x[:, -n_edge:]
+        else:
+            self._x = np.concatenate([self._x, x], axis=-1)
+            self._tail = np.concatenate([self._tail, x], axis=-1)[:, -n_edge:]
+        if last:
+            pad = self._pad_edge(self._tail, (0, self._n_pad))
+            self._x = np.concatenate([self._x, pad], axis=-1)
+        up, down = self._up, self._down
+        # output sample k needs the padded signal up to sample k * down // up
+        n_have = self._start + self._x.shape[-1]
+        k_stop = min(self._k_stop, (n_have - 1) * up // down + 1)
+        assert k_stop == self._k_stop or not last
+        out = self._x[:, :0].copy()
+        if k_stop > self._k:
+            start = self._first_needed(self._k)
+            stop = (k_stop - 1) * down // up + 1
+            y = signal.upfirdn(
+                self._h,
+                self._x[:, start - self._start : stop - self._start],
+                up,
+                down,
+                axis=-1,
+            )
+            k_start = start * up // down
+            out = y[:, self._k - k_start : k_stop - k_start]
+            self._k = k_stop
+        start = self._first_needed(self._k)
+        self._x = self._x[:, start - self._start :]
+        self._start = start
+        return out
+
+    def _first_needed(self, k):
+        """Get the first (multiple of down) sample needed for output k."""
+        start = max(k * self._down - len(self._h) + 1, 0) // self._up
+        return max(start // self._down * self._down, self._start)
+
+    def _pad_edge(self, x, n_pad):
+        x = np.pad(x, ((0, 0), n_pad), self._pad)
+        return x[:, : n_pad[0]] if n_pad[0] else x[:, x.shape[-1] - n_pad[1] :]
+
+
+def _polyphase_filter(up, down, window):
+    """Design the filter of scipy.signal.resample_poly.
+
+    Returns the filter (including the leading zeros that center the output
+    samples) and the number of output samples to remove at the start.
+    """
+    if isinstance(window, (list, np.ndarray)):
+        h = np.array(window, float)
+        half_len = (h.size - 1) // 2
+    else:
+        max_rate = max(up, down)
+        half_len = 10 * max_rate
+        h = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=window)
+    h *= up
+    n_pre_pad = down - half_len % down
+    h = np.concatenate([np.zeros(n_pre_pad), h])
+    return h, (half_len + n_pre_pad) // down
+
+
+def _make_streamer(filt, phase, picks, pad, n_block, n_times):
+    """Create a chunked filtering object for one contiguous data segment."""
+    if isinstance(filt, dict):
+        return _IIRStreamer(filt, n_times, picks)
+    return _FIRStreamer(filt, n_times, picks, phase, pad, n_block)
+
+
+def _check_streamable(method, phase, pad):
+    """Check that the filtering parameters can be used in chunks."""
+    if method == "iir":
+        if phase != "forward":
+            raise ValueError(
+                'IIR filtering to a file in chunks requires phase="forward", '
+                f"got {repr(phase)}"
+            )
+    else:
+        _check_option("pad", pad, _stream_pads, extra="when streaming")
+
+
 def estimate_ringing_samples(system, max_try=100000):
     """Estimate filter ringing.
 
@@ -673,6 +1077,15 @@ def estimate_ringing_samples(system, max_try=100000):
     n : int
         The approximate ringing.
     """
+    idx, converged = _estimate_ringing(system, max_try)
+    if not converged:
+        warn("Could not properly estimate ringing for the filter")
+    return idx
+
+
+@_custom_lru_cache(50)
+def _estimate_ringing(system, max_try):
+    """Estimate filter ringing, returning whether the estimate converged."""
     if isinstance(system, tuple):  # TF
         kind = "ba"
         b, a = system
@@ -702,9 +1115,18 @@ def estimate_ringing_samples(system, max_try=100000):
             idx = (ii - 1) * n_per_chunk + last_good
             break
     else:
-        warn("Could not properly estimate ringing for the filter")
-        idx = n_per_chunk * n_chunks_max
-    return idx
+        return n_per_chunk * n_chunks_max, False
+    return idx, True
+
+
+def _design_iir(kind, kwargs):
+    """Design an IIR filter with iirfilter or iirdesign (cached)."""
+    return deepcopy(_design_iir_cached(kind, kwargs))
+
+
+@_custom_lru_cache(50)
+def _design_iir_cached(kind, kwargs):
+    return getattr(signal, kind)(**kwargs)
 
 
 _ftype_dict = {
@@ -921,7 +1343,7 @@ def construct_iir_filter(
             for key in ("rp", "rs"):
                 if key in iir_params:
                     kwargs[key] = iir_params[key]
-            system = signal.iirfilter(**kwargs)
+            system = _design_iir("iirfilter", kwargs)
             if phase in ("zero", "zero-double"):
                 ptype, pmul = "(effective, after forward-backward)", 2
             else:
@@ -943,14 +1365,15 @@ def construct_iir_filter(
                     "N"
                     ") entries"
                 )
-            system = signal.iirdesign(
-                Wp,
-                Ws,
-                iir_params["gpass"],
-                iir_params["gstop"],
+            kwargs = dict(
+                wp=Wp,
+                ws=Ws,
+                gpass=iir_params["gpass"],
+                gstop=iir_params["gstop"],
                 ftype=ftype,
                 output=output,
             )
+            system = _design_iir("iirdesign", kwargs)
 
     if system is None:
         raise RuntimeError("coefficients could not be created from iir_params")
@@ -1084,9 +1507,14 @@ def filter_data(
         * ``l_freq is not None and h_freq is None``: high-pass filter
         * ``l_freq is None and h_freq is not None``: low-pass filter
 
-    .. note:: If n_jobs > 1, more memory is required as
-              ``len(picks) * n_times`` additional time points need to
-              be temporarily stored in memory.
+    .. note:: If n_jobs > 1, the channels are filtered in place by
+              ``n_jobs`` threads, so no additional copy of the data is
+              stored in memory.
+
+    The last 50 filter designs and the spectra of the last 10 FIR filters
+    applied with FFTs are cached in memory, so that filtering many signals
+    with the same parameters only designs the filter once. Use
+    :func:`mne.utils.clear_caches` to free them.
 
     For more information, see the tutorials
     :ref:`disc-filtering` and :ref:`tut-filter-resample` and
@@ -1245,6 +1673,10 @@ def create_filter(
 
     Where ``Fstop = Fp - trans_bandwidth``.
 
+    The last 50 FIR and IIR filter designs are cached in memory and reused when
+    a filter with the same parameters is created again. Use
+    :func:`mne.utils.clear_caches` to free them.
+
     .. versionadded:: 0.14
     """
     sfreq = float(sfreq)
@@ -1615,24 +2047,12 @@ def notch_filter(
 
     # Only have to deal with notch_widths for non-autodetect
     if freqs is not None:
-        if notch_widths is None:
-            notch_widths = freqs / 200.0
-        elif np.any(notch_widths < 0):
-            raise ValueError("notch_widths must be >= 0")
-        else:
-            notch_widths = np.atleast_1d(notch_widths)
-            if len(notch_widths) == 1:
-                notch_widths = notch_widths[0] * np.ones_like(freqs)
-            elif len(notch_widths) != len(freqs):
-                raise ValueError(
-                    "notch_widths must be None, scalar, or the " "same length as freqs"
-                )
+        notch_widths = _check_notch_widths(freqs, notch_widths)
 
     if method in ("fir", "iir"):
         # Speed this up by computing the fourier coefficients once
         tb_2 = trans_bandwidth / 2.0
-        lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
-        highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+        lows, highs = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
         xf = filter_data(
             x,
             Fs,
@@ -1668,6 +2088,64 @@ def notch_filter(
     return xf
 
 
+def _check_notch_widths(freqs, notch_widths):
+    if notch_widths is None:
+        notch_widths = freqs / 200.0
+    elif np.any(notch_widths < 0):
+        raise ValueError("notch_widths must be >= 0")
+    else:
+        notch_widths = np.atleast_1d(notch_widths)
+        if len(notch_widths) == 1:
+            notch_widths = notch_widths[0] * np.ones_like(freqs)
+        elif len(notch_widths) != len(freqs):
+            raise ValueError(
+                "notch_widths must be None, scalar, or the " "same length as freqs"
+            )
+    return notch_widths
+
+
+def _notch_stop_bands(freqs, notch_widths, trans_bandwidth):
+    tb_2 = trans_bandwidth / 2.0
+    lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
+    highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+    return lows, highs
+
+
+def _create_notch_filter(
+    sfreq,
+    freqs,
+    filter_length,
+    notch_widths,
+    trans_bandwidth,
+    method,
+    iir_params,
+    phase,
+    fir_window,
+    fir_design,
+):
+    """Design the band-stop filter used by notch_filter (FIR or IIR only)."""
+    iir_params, method = _check_method(method, iir_params)
+    freqs = np.atleast_1d(freqs)
+    notch_widths = _check_notch_widths(freqs, notch_widths)
+    lows, highs = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
+    tb_2 = trans_bandwidth / 2.0
+    filt = create_filter(
+        None,
+        sfreq,
+        highs,
+        lows,
+        filter_length,
+        tb_2,
+        tb_2,
+        method,
+        iir_params,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    return filt, method
+
+
 def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     from .time_frequency.multitaper import _compute_mt_params
 
@@ -1900,10 +2378,11 @@ def resample(
     down=1.0,
     npad=100,
     axis=-1,
-    window="boxcar",
+    window="auto",
     n_jobs=None,
-    pad="reflect_limited",
+    pad="auto",
     *,
+    method="fft",
     verbose=None,
 ):
     """Resample an array.
@@ -1923,10 +2402,13 @@ def resample(
         Axis along which to resample (default is the last axis).
     %(window_resample)s
     %(n_jobs_cuda)s
-    %(pad)s
-        The default is ``'reflect_limited'``.
+        ``'cuda'`` is only supported for ``method="fft"``.
+    %(pad_resample_auto)s
 
         .. versionadded:: 0.15
+    %(method_resample)s
+
+        .. versionadded:: 1.7
     %(verbose)s
 
     Returns
@@ -1936,16 +2418,18 @@ def resample(
 
     Notes
     -----
-    This uses (hopefully) intelligent edge padding and frequency-domain
+    When using ``method="fft"`` (default),
+    this uses (hopefully) intelligent edge padding and frequency-domain
     windowing improve scipy.signal.resample's resampling method, which
     we have adapted for our use here. Choices of npad and window have
     important consequences, and the default choices should work well
     for most natural signals.
 
-    Resampling arguments are broken into "up" and "down" components for future
-    compatibility in case we decide to use an upfirdn implementation. The
-    current implementation is functionally equivalent to passing
-    up=up/down and down=1.
+    When using ``method="polyphase"``, the ratio ``up / down`` is converted
+    to a fraction of integers, and :func:`scipy.signal.resample_poly` is
+    used. Its cost grows linearly with the signal length, so it is
+    typically much faster for long signals and large downsampling factors.
+    ``npad`` is not used in this case.
     """
     # check explicitly for backwards compatibility
     if not isinstance(axis, int):
@@ -1957,6 +2441,8 @@ def resample(
         )
         raise TypeError(err)
 
+    _check_option("method", method, ("fft", "polyphase"))
+
     # make sure our arithmetic will work
     x = _check_filterable(x, "resampled", "resample")
     ratio, final_len = _resamp_ratio_len(up, down, x.shape[axis])
@@ -1971,6 +2457,28 @@ def resample(
     if x_len == 0:
         warn("x has zero length along last axis, returning a copy of x")
         return x.copy()
+    x_flat = x.reshape((-1, x_len))
+    if method == "polyphase":
+        y = _resample_polyphase(x_flat, ratio, final_len, window, pad, n_jobs)
+    else:
+        y = _resample_fft(x_flat, ratio, final_len, npad, window, pad, n_jobs)
+
+    # Restore the original array shape (modified for resampling)
+    y.shape = orig_shape[:-1] + (y.shape[1],)
+    if axis != orig_last_axis:
+        y = y.swapaxes(axis, orig_last_axis)
+    assert y.shape[axis] == final_len
+
+    return y
+
+
+def _resample_fft(x_flat, ratio, final_len, npad, window, pad, n_jobs):
+    """Resample the rows of x_flat with (padded and windowed) FFTs."""
+    if isinstance(window, str) and window == "auto":
+        window = "boxcar"
+    if isinstance(pad, str) and pad == "auto":
+        pad = "reflect_limited"
+    x_len = x_flat.shape[-1]
     bad_msg = 'npad must be "auto" or an integer'
     if isinstance(npad, str):
         if npad != "auto":
@@ -1987,7 +2495,6 @@ def resample(
     del npad
 
     # prep for resampling now
-    x_flat = x.reshape((-1, x_len))
     orig_len = x_len + npads.sum()  # length after padding
     new_len = max(int(round(ratio * orig_len)), 1)  # length after resampling
     to_removes = [int(round(ratio * npads[0]))]
@@ -2015,7 +2522,7 @@ def resample(
     # use of the 'flat' window is recommended for minimal ringing
     parallel, p_fun, n_jobs = parallel_func(_fft_resample, n_jobs)
     if n_jobs == 1:
-        y = np.zeros((len(x_flat), new_len - to_removes.sum()), dtype=x.dtype)
+        y = np.zeros((len(x_flat), new_len - to_removes.sum()), dtype=x_flat.dtype)
         for xi, x_ in enumerate(x_flat):
             y[xi] = _fft_resample(x_, new_len, npads, to_removes, cuda_dict, pad)
     else:
@@ -2023,14 +2530,48 @@ def resample(
             p_fun(x_, new_len, npads, to_removes, cuda_dict, pad) for x_ in x_flat
         )
         y = np.array(y)
+    return y
 
-    # Restore the original array shape (modified for resampling)
-    y.shape = orig_shape[:-1] + (y.shape[1],)
-    if axis != orig_last_axis:
-        y = y.swapaxes(axis, orig_last_axis)
-    assert y.shape[axis] == final_len
 
-    return y
+def _prep_polyphase(ratio, window, n_times):
+    """Get the integer up and down factors and the window for resample_poly."""
+    if isinstance(window, str) and window == "auto":
+        window = ("kaiser", 5.0)  # SciPy's default
+    # the filter has 20 * max(up, down) + 1 taps, so bound both factors
+    if ratio <= 1:
+        frac = Fraction(ratio).limit_denominator(_POLY_MAX_FACTOR)
+    else:
+        frac = 1 / Fraction(1 / ratio).limit_denominator(_POLY_MAX_FACTOR)
+    up, down = frac.numerator, frac.denominator
+    # the last output sample must be off by less than half a sample
+    if abs(up / down - ratio) * n_times >= 0.5:
+        raise ValueError(
+            f"The resampling ratio {ratio} cannot be approximated accurately "
+            f"enough for {n_times} samples by up / down with up and down at "
+            f"most {_POLY_MAX_FACTOR} (best: {up} / {down}), use "
+            'method="fft" instead of method="polyphase"'
+        )
+    logger.info(f"Polyphase resampling with up={up}, down={down}")
+    return up, down, window
+
+
+def _resample_polyphase(x_flat, ratio, final_len, window, pad, n_jobs):
+    """Resample the rows of x_flat with scipy.signal.resample_poly."""
+    _validate_type(
+        n_jobs, (None, "int-like"), "n_jobs", extra="when method='polyphase'"
+    )
+    if isinstance(pad, str) and pad == "auto":
+        pad = "reflect"
+    up, down, window = _prep_polyphase(ratio, window, x_flat.shape[-1])
+    kwargs = dict(up=up, down=down, window=window, padtype=pad, axis=-1)
+    parallel, p_fun, n_jobs = parallel_func(signal.resample_poly, n_jobs)
+    if n_jobs == 1:
+        y = signal.resample_poly(x_flat, **kwargs)
+    else:
+        y = np.array(parallel(p_fun(x_, **kwargs) for x_ in x_flat))
+    # resample_poly rounds the number of samples up, we round to the nearest
+    # (which is never more, since up / down is accurate to half a sample)
+    return y[:, :final_len]
 
 
 def _resample_stim_channels(stim_data, up, down):
@@ -2516,6 +3057,9 @@ class FilterMixin:
         pad="edge",
         *,
         verbose=None,
+        out_fname=None,
+        buffer_size_sec=None,
+        overwrite=False,
     ):
         """Filter a subset of channels.
 
@@ -2538,11 +3082,22 @@ class FilterMixin:
             .. versionadded:: 0.16.
         %(pad_fir)s
         %(verbose)s
+        %(out_fname_stream)s
+
+            .. versionadded:: 1.7
+        %(buffer_size_sec_stream)s
+
+            .. versionadded:: 1.7
+        %(overwrite)s
+            Only used when ``out_fname`` is not None.
+
+            .. versionadded:: 1.7
 
         Returns
         -------
         inst : instance of Epochs, Evoked, or Raw
-            The filtered data.
+            The filtered data. If ``out_fname`` is given, a new Raw instance
+            reading the filtered data from that file.
 
         See Also
         --------
@@ -2561,7 +3116,11 @@ class FilterMixin:
         The data are modified inplace.
 
         The object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``, unless ``out_fname`` is used for a Raw
+        instance, in which case the data are read, filtered, and written in
+        chunks so that the memory usage does not depend on the length of the
+        recording. In this mode only FIR filters and IIR filters with
+        ``phase='forward'`` can be used.
 
         ``l_freq`` and ``h_freq`` are the frequencies below which and above
         which, respectively, to filter out of the data. Thus the uses are:
@@ -2574,9 +3133,9 @@ class FilterMixin:
         ``self.info['lowpass']`` and ``self.info['highpass']`` are only
         updated with picks=None.
 
-        .. note:: If n_jobs > 1, more memory is required as
-                  ``len(picks) * n_times`` additional time points need to
-                  be temporarily stored in memory.
+        .. note:: If n_jobs > 1, the channels are filtered in place by
+                  ``n_jobs`` threads, so no additional copy of the data is
+                  stored in memory.
 
         For more information, see the tutorials
         :ref:`disc-filtering` and :ref:`tut-filter-resample` and
@@ -2587,9 +3146,39 @@ class FilterMixin:
         from .annotations import _annotations_starts_stops
         from .io import BaseRaw
 
-        _check_preload(self, "inst.filter")
         if pad is None and method != "iir":
             pad = "edge"
+        if out_fname is not None:
+            if not isinstance(self, BaseRaw):
+                raise ValueError("out_fname can only be used with Raw instances")
+            update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
+            iir_params, method = _check_method(method, iir_params)
+            _check_streamable(method, phase, pad)
+            filt = create_filter(
+                None,
+                self.info["sfreq"],
+                l_freq,
+                h_freq,
+                filter_length,
+                l_trans_bandwidth,
+                h_trans_bandwidth,
+                method,
+                iir_params,
+                phase,
+                fir_window,
+                fir_design,
+            )
+            info = self.info.copy()
+            _filt_update_info(info, update_info, l_freq, h_freq)
+            return self._stream_to_fif(
+                out_fname,
+                partial(_make_streamer, filt, phase, picks, pad),
+                info,
+                skip_by_annotation,
+                buffer_size_sec,
+                overwrite,
+            )
+        _check_preload(self, "inst.filter")
         update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
         if isinstance(self, BaseRaw):
             # Deal with annotations
@@ -2636,10 +3225,11 @@ class FilterMixin:
         self,
         sfreq,
         npad="auto",
-        window="boxcar",
+        window="auto",
         n_jobs=None,
         pad="edge",
         *,
+        method="fft",
         verbose=None,
     ):
         """Resample data.
@@ -2656,11 +3246,15 @@ class FilterMixin:
         %(npad)s
         %(window_resample)s
         %(n_jobs_cuda)s
-        %(pad)s
+            ``'cuda'`` is only supported for ``method="fft"``.
+        %(pad_resample)s
             The default is ``'edge'``, which pads with the edge values of each
             vector.
 
             .. versionadded:: 0.15
+        %(method_resample)s
+
+            .. versionadded:: 1.7
         %(verbose)s
 
         Returns
@@ -2691,7 +3285,14 @@ class FilterMixin:
 
         _check_preload(self, "inst.resample")
         self._data = resample(
-            self._data, sfreq, o_sfreq, npad, window=window, n_jobs=n_jobs, pad=pad
+            self._data,
+            sfreq,
+            o_sfreq,
+            npad,
+            window=window,
+            n_jobs=n_jobs,
+            pad=pad,
+            method=method,
         )
         lowpass = self.info.get("lowpass")
         lowpass = np.inf if lowpass is None else lowpass
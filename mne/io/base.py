@@ -18,6 +18,7 @@ from contextlib import nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import partial
 
 import numpy as np
 
@@ -73,6 +74,12 @@ from ..filter import (
     FilterMixin,
     _check_fun,
     _check_resamp_noop,
+    _check_streamable,
+    _create_notch_filter,
+    _make_streamer,
+    _poly_stream_pads,
+    _PolyphaseStreamer,
+    _prep_polyphase,
     _resamp_ratio_len,
     _resample_stim_channels,
     notch_filter,
@@ -80,7 +87,12 @@ from ..filter import (
 )
 from ..html_templates import _get_html_template
 from ..parallel import parallel_func
-from ..time_frequency.spectrum import Spectrum, SpectrumMixin, _validate_method
+from ..time_frequency.spectrum import (
+    Spectrogram,
+    Spectrum,
+    SpectrumMixin,
+    _validate_method,
+)
 from ..utils import (
     SizeMixin,
     TimeMixin,
@@ -367,7 +379,14 @@ class BaseRaw(
 
     @verbose
     def _read_segment(
-        self, start=0, stop=None, sel=None, data_buffer=None, *, verbose=None
+        self,
+        start=0,
+        stop=None,
+        sel=None,
+        data_buffer=None,
+        *,
+        n_jobs=None,
+        verbose=None,
     ):
         """Read a chunk of raw data.
 
@@ -385,8 +404,7 @@ class BaseRaw(
             numpy array to fill with data read, must have the correct shape.
             If str, a np.memmap with the correct data type will be used
             to store the data.
-        projector : array
-            SSP operator to apply to the data.
+        %(n_jobs_read)s
         %(verbose)s
 
         Returns
@@ -459,6 +477,7 @@ class BaseRaw(
         assert (mult is None) ^ (cals is None)  # xor
 
         # read from necessary files
+        reads = list()
         offset = 0
         for fi in np.nonzero(files_used)[0]:
             start_file = self._first_samps[fi]
@@ -477,16 +496,24 @@ class BaseRaw(
             this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
-                orig_idx,
-                fi,
-                int(start_file),
-                int(stop_file),
-                cals,
-                mult,
-            )
+            reads.append((this_sl, orig_idx, fi, int(start_file), int(stop_file)))
             offset += n_read
+
+        # each file is read into its own slice of the output, so the reads
+        # can happen concurrently (file I/O and NumPy both release the GIL)
+        parallel, p_fun, n_jobs = parallel_func(
+            _ReadSegmentFileProtector(self)._read_segment_file,
+            n_jobs,
+            max_jobs=len(reads),
+            prefer="threads",
+            require="sharedmem",
+        )
+        if n_jobs > 1:
+            logger.debug(f"Reading {len(reads)} files using {n_jobs} threads")
+        parallel(
+            p_fun(data[:, this_sl], orig_idx, fi, start_file, stop_file, cals, mult)
+            for this_sl, orig_idx, fi, start_file, stop_file in reads
+        )
         return data
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
@@ -569,12 +596,15 @@ class BaseRaw(
         return self._getitem((picks, slice(start, stop)), return_times=False)
 
     @verbose
-    def load_data(self, verbose=None):
+    def load_data(self, verbose=None, *, n_jobs=None):
         """Load raw data.
 
         Parameters
         ----------
         %(verbose)s
+        %(n_jobs_read)s
+
+            .. versionadded:: 1.7
 
         Returns
         -------
@@ -589,10 +619,10 @@ class BaseRaw(
         .. versionadded:: 0.10.0
         """
         if not self.preload:
-            self._preload_data(True)
+            self._preload_data(True, n_jobs=n_jobs)
         return self
 
-    def _preload_data(self, preload):
+    def _preload_data(self, preload, *, n_jobs=None):
         """Actually preload the data."""
         data_buffer = preload
         if isinstance(preload, (bool, np.bool_)) and not preload:
@@ -601,7 +631,7 @@ class BaseRaw(
             "Reading %d ... %d  =  %9.3f ... %9.3f secs..."
             % (0, len(self.times) - 1, 0.0, self.times[-1])
         )
-        self._data = self._read_segment(data_buffer=data_buffer)
+        self._data = self._read_segment(data_buffer=data_buffer, n_jobs=n_jobs)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
         self._comp = None  # no longer needed
@@ -851,12 +881,12 @@ class BaseRaw(
         """  # noqa: E501
         return self._getitem(item)
 
-    def _getitem(self, item, return_times=True):
+    def _getitem(self, item, return_times=True, *, n_jobs=None):
         sel, start, stop = self._parse_get_set_params(item)
         if self.preload:
             data = self._data[sel, start:stop]
         else:
-            data = self._read_segment(start=start, stop=stop, sel=sel)
+            data = self._read_segment(start=start, stop=stop, sel=sel, n_jobs=n_jobs)
 
         if return_times:
             # Rather than compute the entire thing just compute the subset
@@ -887,6 +917,7 @@ class BaseRaw(
         *,
         tmin=None,
         tmax=None,
+        n_jobs=None,
         verbose=None,
     ):
         """Get data in the given range.
@@ -916,6 +947,9 @@ class BaseRaw(
             ignored if the ``stop`` parameter is defined.
 
             .. versionadded:: 0.24.0
+        %(n_jobs_read)s
+
+            .. versionadded:: 1.7
         %(verbose)s
 
         Returns
@@ -960,7 +994,7 @@ class BaseRaw(
 
         if len(self.annotations) == 0 or reject_by_annotation is None:
             getitem = self._getitem(
-                (picks, slice(start, stop)), return_times=return_times
+                (picks, slice(start, stop)), return_times=return_times, n_jobs=n_jobs
             )
             if return_times:
                 data, times = getitem
@@ -978,7 +1012,7 @@ class BaseRaw(
         onsets = np.maximum(onsets[keep], start)
         ends = np.minimum(ends[keep], stop)
         if len(onsets) == 0:
-            data, times = self[picks, start:stop]
+            data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
             if units is not None:
                 data *= ch_factors[:, np.newaxis]
             if return_times:
@@ -1017,7 +1051,9 @@ class BaseRaw(
                     if start == stop:
                         continue
                     end = idx + stop - start
-                    data[:, idx:end], times[idx:end] = self[picks, start:stop]
+                    data[:, idx:end], times[idx:end] = self._getitem(
+                        (picks, slice(start, stop)), n_jobs=n_jobs
+                    )
                     idx = end
             else:
                 msg = (
@@ -1033,10 +1069,10 @@ class BaseRaw(
                         n_kept / n_samples,
                     )
                 )
-                data, times = self[picks, start:stop]
+                data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
                 data[:, ~used[1:-1]] = np.nan
         else:
-            data, times = self[picks, start:stop]
+            data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
 
         if units is not None:
             data *= ch_factors[:, np.newaxis]
@@ -1124,6 +1160,10 @@ class BaseRaw(
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="reflect_limited",
         verbose=None,
+        *,
+        out_fname=None,
+        buffer_size_sec=None,
+        overwrite=False,
     ):  # noqa: D102
         return super().filter(
             l_freq,
@@ -1140,6 +1180,9 @@ class BaseRaw(
             fir_design=fir_design,
             skip_by_annotation=skip_by_annotation,
             pad=pad,
+            out_fname=out_fname,
+            buffer_size_sec=buffer_size_sec,
+            overwrite=overwrite,
             verbose=verbose,
         )
 
@@ -1162,6 +1205,10 @@ class BaseRaw(
         pad="reflect_limited",
         skip_by_annotation=("edge", "bad_acq_skip"),
         verbose=None,
+        *,
+        out_fname=None,
+        buffer_size_sec=None,
+        overwrite=False,
     ):
         """Notch filter a subset of channels.
 
@@ -1201,11 +1248,22 @@ class BaseRaw(
             .. versionadded:: 0.15
         %(skip_by_annotation)s
         %(verbose)s
+        %(out_fname_stream)s
+
+            .. versionadded:: 1.7
+        %(buffer_size_sec_stream)s
+
+            .. versionadded:: 1.7
+        %(overwrite)s
+            Only used when ``out_fname`` is not None.
+
+            .. versionadded:: 1.7
 
         Returns
         -------
         raw : instance of Raw
-            The raw instance with filtered data.
+            The raw instance with filtered data. If ``out_fname`` is given,
+            a new Raw instance reading the filtered data from that file.
 
         See Also
         --------
@@ -1218,7 +1276,10 @@ class BaseRaw(
         "picks". By default the data of the Raw object is modified inplace.
 
         The Raw object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``, unless ``out_fname`` is used, in which case
+        the data are read, filtered, and written in chunks (only
+        ``method='fir'`` and ``method='iir'`` with ``phase='forward'`` are
+        supported in this mode).
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
@@ -1228,6 +1289,28 @@ class BaseRaw(
         """
         fs = float(self.info["sfreq"])
         picks = _picks_to_idx(self.info, picks, exclude=(), none="data_or_ica")
+        if out_fname is not None:
+            filt, method = _create_notch_filter(
+                fs,
+                freqs,
+                filter_length,
+                notch_widths,
+                trans_bandwidth,
+                method,
+                iir_params,
+                phase,
+                fir_window,
+                fir_design,
+            )
+            _check_streamable(method, phase, pad)
+            return self._stream_to_fif(
+                out_fname,
+                partial(_make_streamer, filt, phase, picks, pad),
+                self.info,
+                skip_by_annotation,
+                buffer_size_sec,
+                overwrite,
+            )
         _check_preload(self, "raw.notch_filter")
         onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
         logger.info(
@@ -1260,12 +1343,14 @@ class BaseRaw(
         self,
         sfreq,
         npad="auto",
-        window="boxcar",
+        window="auto",
         stim_picks=None,
         n_jobs=None,
         events=None,
-        pad="reflect_limited",
+        pad="auto",
         verbose=None,
+        *,
+        method="fft",
     ):
         """Resample all channels.
 
@@ -1302,15 +1387,18 @@ class BaseRaw(
             triggers. If None, stim channels are automatically chosen using
             :func:`mne.pick_types`.
         %(n_jobs_cuda)s
+            ``'cuda'`` is only supported for ``method="fft"``.
         events : 2D array, shape (n_events, 3) | None
             An optional event matrix. When specified, the onsets of the events
             are resampled jointly with the data. NB: The input events are not
             modified, but a new array is returned with the raw instead.
-        %(pad)s
-            The default is ``'reflect_limited'``.
+        %(pad_resample_auto)s
 
             .. versionadded:: 0.15
         %(verbose)s
+        %(method_resample)s
+
+            .. versionadded:: 1.7
 
         Returns
         -------
@@ -1333,11 +1421,20 @@ class BaseRaw(
         object has to have the data loaded e.g. with ``preload=True`` or
         ``self.load_data()``, but this increases memory requirements. The
         resulting raw object will have the data loaded into memory.
+
+        With ``method="polyphase"``, data that are not loaded are read and
+        resampled in chunks of ``buffer_size_sec`` (when ``pad`` is one of
+        ``"reflect"``, ``"symmetric"``, ``"edge"``, or ``"constant"``), so
+        only the resampled data need to fit into memory at once.
         """
         sfreq = float(sfreq)
         o_sfreq = float(self.info["sfreq"])
+        _check_option("method", method, ("fft", "polyphase"))
         if _check_resamp_noop(sfreq, o_sfreq):
             return self
+        if method == "polyphase" and isinstance(pad, str) and pad == "auto":
+            pad = "reflect"
+        stream = not self.preload and method == "polyphase" and pad in _poly_stream_pads
 
         # When no event object is supplied, some basic detection of dropped
         # events is performed to generate a warning. Finding events can fail
@@ -1363,7 +1460,13 @@ class BaseRaw(
             )
 
         kwargs = dict(
-            up=sfreq, down=o_sfreq, npad=npad, window=window, n_jobs=n_jobs, pad=pad
+            up=sfreq,
+            down=o_sfreq,
+            npad=npad,
+            window=window,
+            n_jobs=n_jobs,
+            pad=pad,
+            method=method,
         )
         ratio, n_news = zip(
             *(
@@ -1375,6 +1478,10 @@ class BaseRaw(
         new_offsets = np.cumsum([0] + list(n_news))
         if self.preload:
             new_data = np.empty((len(self.ch_names), new_offsets[-1]), self._data.dtype)
+        elif stream:
+            new_data = np.empty((len(self.ch_names), new_offsets[-1]))
+            up, down, window = _prep_polyphase(ratio, window, max(self._raw_lengths))
+            buffer_size = self._get_buffer_size()
         for ri, (n_orig, n_new) in enumerate(zip(self._raw_lengths, n_news)):
             this_sl = slice(new_offsets[ri], new_offsets[ri + 1])
             if self.preload:
@@ -1388,6 +1495,27 @@ class BaseRaw(
                     new_data[stim_picks, this_sl] = _resample_stim_channels(
                         data_chunk[stim_picks], n_new, data_chunk.shape[1]
                     )
+            elif stream:  # read all channels in chunks and resample them
+                streamer = _PolyphaseStreamer(
+                    up, down, window, pad, n_orig, n_out=n_new
+                )
+                idx = new_offsets[ri]
+                for start in range(offsets[ri], offsets[ri + 1], buffer_size):
+                    stop = min(start + buffer_size, offsets[ri + 1])
+                    resamp = streamer.feed(
+                        self._getitem((slice(None), slice(start, stop)), False)
+                    )
+                    new_data[:, idx : idx + resamp.shape[1]] = resamp
+                    idx += resamp.shape[1]
+                assert idx == new_offsets[ri + 1]
+                if len(stim_picks) > 0:
+                    new_data[stim_picks, this_sl] = _resample_stim_channels(
+                        self._getitem(
+                            (stim_picks, slice(offsets[ri], offsets[ri + 1])), False
+                        ),
+                        n_new,
+                        n_orig,
+                    )
             else:  # this will not be I/O efficient, but will be mem efficient
                 for ci in range(len(self.ch_names)):
                     data_chunk = self.get_data(
@@ -1640,27 +1768,10 @@ class BaseRaw(
         Samples annotated ``BAD_ACQ_SKIP`` are not stored in order to optimize
         memory. Whatever values, they will be loaded as 0s when reading file.
         """
-        endings = (
-            "raw.fif",
-            "raw_sss.fif",
-            "raw_tsss.fif",
-            "_meg.fif",
-            "_eeg.fif",
-            "_ieeg.fif",
-        )
-        endings += tuple([f"{e}.gz" for e in endings])
-        endings_err = (".fif", ".fif.gz")
-
         # convert to str, check for overwrite a few lines later
-        fname = _check_fname(fname, overwrite=True, verbose="error")
-        check_fname(fname, "raw", endings, endings_err=endings_err)
+        fname = self._check_save_fname(fname)
 
         split_size = _get_split_size(split_size)
-        if not self.preload and str(fname) in self._filenames:
-            raise ValueError(
-                "You cannot save data to the same file."
-                " Please use a different filename."
-            )
 
         if self.preload:
             if np.iscomplexobj(self._data):
@@ -1702,6 +1813,57 @@ class BaseRaw(
         raw_fid_writer = _RawFidWriter(self, info, picks, projector, start, stop, cfg)
         _write_raw(raw_fid_writer, fname, split_naming, overwrite)
 
+    def _check_save_fname(self, fname):
+        endings = (
+            "raw.fif",
+            "raw_sss.fif",
+            "raw_tsss.fif",
+            "_meg.fif",
+            "_eeg.fif",
+            "_ieeg.fif",
+        )
+        endings += tuple([f"{e}.gz" for e in endings])
+        endings_err = (".fif", ".fif.gz")
+
+        fname = _check_fname(fname, overwrite=True, verbose="error")
+        check_fname(fname, "raw", endings, endings_err=endings_err)
+        if not self.preload and str(fname) in self._filenames:
+            raise ValueError(
+                "You cannot save data to the same file."
+                " Please use a different filename."
+            )
+        return fname
+
+    def _stream_to_fif(
+        self, fname, make_streamer, info, skip_by_annotation, buffer_size_sec, overwrite
+    ):
+        """Process the data in chunks and write them to a new file.
+
+        ``make_streamer(n_block, n_times)`` must return an object whose
+        ``feed`` method takes consecutive chunks of all channels of one
+        contiguous segment of ``n_times`` samples and returns the processed
+        data that are ready (possibly with a delay).
+        """
+        from .fiff import read_raw_fif
+
+        fname = self._check_save_fname(fname)
+        fname = _check_fname(fname=fname, overwrite=overwrite, verbose="error")
+        buffer_size = self._get_buffer_size(buffer_size_sec)
+        onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
+        logger.info(
+            "Filtering raw data in %d contiguous segment%s in chunks of %d samples"
+            % (len(onsets), _pl(onsets), buffer_size)
+        )
+        chunks = _iter_stream_chunks(
+            self, onsets, ends, partial(make_streamer, buffer_size), buffer_size
+        )
+        cfg = _RawFidWriterCfg(buffer_size, _get_split_size("2GB"), False, "single")
+        raw_fid_writer = _RawFidWriter(
+            self, info, None, None, 0, self.n_times, cfg, reader=_ChunkReader(chunks)
+        )
+        _write_raw(raw_fid_writer, fname, "neuromag", overwrite)
+        return read_raw_fif(fname)
+
     @verbose
     def export(
         self,
@@ -2172,6 +2334,8 @@ class BaseRaw(
 
         Notes
         -----
+        %(notes_psd_raw_not_preloaded)s
+
         .. versionadded:: 1.2
 
         References
@@ -2198,6 +2362,89 @@ class BaseRaw(
             **method_kw,
         )
 
+    @verbose
+    def compute_spectrogram(
+        self,
+        fmin=0,
+        fmax=np.inf,
+        tmin=None,
+        tmax=None,
+        picks=None,
+        exclude=(),
+        proj=False,
+        remove_dc=True,
+        reject_by_annotation=True,
+        *,
+        n_fft=256,
+        n_overlap=0,
+        n_per_seg=None,
+        window="hamming",
+        n_jobs=1,
+        verbose=None,
+    ):
+        """Compute the spectrogram of the continuous data.
+
+        The power spectral density of consecutive windows of the data, read
+        from disk a few windows at a time rather than as epochs.
+
+        Parameters
+        ----------
+        %(fmin_fmax_psd)s
+        %(tmin_tmax_psd)s
+        %(picks_good_data_noref)s
+        %(exclude_psd)s
+        %(proj_psd)s
+        %(remove_dc)s
+        reject_by_annotation : bool
+            Whether to set the spectra of windows overlapping spans with
+            annotations whose description begins with ``bad`` to NaN.
+        n_fft : int
+            The length of FFT used, must be ``>= n_per_seg`` (default: 256).
+            The windows will be zero-padded if ``n_fft > n_per_seg``.
+        n_overlap : int
+            The number of points of overlap between windows. The default value
+            is 0.
+        n_per_seg : int | None
+            Length of each window. Defaults to None, which sets ``n_per_seg``
+            equal to ``n_fft``.
+        %(window_psd)s
+        %(n_jobs)s
+        %(verbose)s
+
+        Returns
+        -------
+        spectrogram : instance of Spectrogram
+            The spectrogram of the data, which can be extended with data
+            appended to the recording using
+            :meth:`~mne.time_frequency.Spectrogram.update`.
+
+        See Also
+        --------
+        compute_psd
+
+        Notes
+        -----
+        .. versionadded:: 1.7
+        """
+        return Spectrogram(
+            self,
+            fmin=fmin,
+            fmax=fmax,
+            tmin=tmin,
+            tmax=tmax,
+            picks=picks,
+            exclude=exclude,
+            proj=proj,
+            remove_dc=remove_dc,
+            reject_by_annotation=reject_by_annotation,
+            n_fft=n_fft,
+            n_overlap=n_overlap,
+            n_per_seg=n_per_seg,
+            window=window,
+            n_jobs=n_jobs,
+            verbose=verbose,
+        )
+
     @verbose
     def to_data_frame(
         self,
@@ -2501,6 +2748,59 @@ def _get_scaling(ch_type, target_unit):
     return scaling
 
 
+def _iter_stream_chunks(raw, onsets, ends, make_streamer, buffer_size):
+    """Read consecutive chunks of all channels, processing the given segments.
+
+    Samples outside the segments are passed through unchanged.
+    """
+    starts = np.arange(0, raw.n_times, buffer_size)
+    stops = np.minimum(starts + buffer_size, raw.n_times)
+    bounds = np.unique(np.concatenate([onsets, ends, starts, stops, [raw.n_times]]))
+    bounds = bounds[(bounds >= 0) & (bounds <= raw.n_times)]
+    streamer = None
+    segments = list(zip(onsets, ends))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        data = raw._getitem((slice(None), slice(start, stop)), return_times=False)
+        if streamer is None:
+            for onset, end in segments:
+                if onset <= start < end:
+                    streamer = make_streamer(end - onset)
+                    segment_end = end
+                    break
+        if streamer is None:
+            yield data
+        else:
+            yield streamer.feed(data)
+            if stop == segment_end:
+                streamer = None
+
+
+class _ChunkReader:
+    """Provide sequential access to a stream of data chunks for writing."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = None
+        self._start = 0  # sample index of the first sample in the buffer
+
+    def __call__(self, picks, start, stop):
+        if start < self._start:
+            raise RuntimeError("Data must be requested sequentially")
+        buffers = [] if self._buffer is None else [self._buffer]
+        n_have = sum(b.shape[-1] for b in buffers)
+        while self._start + n_have < stop:
+            data = next(self._chunks)
+            buffers.append(data)
+            n_have += data.shape[-1]
+        self._buffer = np.concatenate(buffers, axis=-1)
+        self._buffer = self._buffer[:, start - self._start :]
+        self._start = start
+        data = self._buffer[picks, : stop - start]
+        self._buffer = self._buffer[:, stop - start :]
+        self._start = stop
+        return data
+
+
 class _ReadSegmentFileProtector:
     """Ensure only _filenames, _raw_extras, and _read_segment_file are used."""
 
@@ -2628,8 +2928,9 @@ class _RawFidWriterCfg:
 
 
 class _RawFidWriter:
-    def __init__(self, raw, info, picks, projector, start, stop, cfg):
+    def __init__(self, raw, info, picks, projector, start, stop, cfg, reader=None):
         self.raw = raw
+        self.reader = reader
         self.picks = _picks_to_idx(info, picks, "all", ())
         self.info = pick_info(info, sel=self.picks, copy=True)
         for k in range(self.info["nchan"]):
@@ -2667,6 +2968,7 @@ class _RawFidWriter:
             self.projector,
             self.cfg.drop_small_buffer,
             self.cfg.fmt,
+            self.reader,
         )
         end_block(fid, FIFF.FIFFB_MEAS)
         is_next_split = self.start < self.stop
@@ -2697,6 +2999,7 @@ def _write_raw_data(
     projector,
     drop_small_buffer,
     fmt,
+    reader=None,
 ):
     # Start the raw data
     data_kind = "IAS_" if info.get("maxshield", False) else ""
@@ -2762,13 +3065,16 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
+        if reader is None:
+            data = raw[picks, first:last][0]
+        else:
+            data = reader(picks, first, last)
+        assert data.shape[-1] == last - first
 
         if projector is not None:
             data = np.dot(projector, data)
 
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
+        if drop_small_buffer and (first > start) and (last - first < buffer_size):
             logger.info("Skipping data chunk due to small buffer ... " "[done]")
             break
         logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
@@ -10,13 +10,19 @@
 import copy
 import os
 import os.path as op
+from contextlib import ExitStack
 
 import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
-from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
-from ..._fiff.tag import read_tag, read_tag_info
+from ..._fiff.open import (
+    _fiff_get_fid,
+    _FiffMemmap,
+    _get_next_fname,
+    fiff_open,
+)
+from ..._fiff.tag import _read_tag_memmap, read_tag, read_tag_info
 from ..._fiff.tree import dir_tree_find
 from ..._fiff.utils import _mult_cal_one
 from ...annotations import Annotations, _read_annotations_fif
@@ -404,10 +410,26 @@ class Raw(BaseRaw):
         self._dtype_ = dtype
         return dtype
 
+    def close(self):
+        """Clean up the object.
+
+        Releases the memory maps of the data files. They are created again if
+        data are read afterward.
+        """
+        for extra in self._raw_extras:
+            if "memmap" in extra:
+                extra["memmap"].close()
+
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
         n_bad = 0
-        with _fiff_get_fid(self._filenames[fi]) as fid:
+        # Uncompressed files on disk are memory-mapped (once per file) so that
+        # each buffer is a view into the page cache rather than a separate
+        # read() call
+        extra = self._raw_extras[fi]
+        mm = extra.setdefault("memmap", _FiffMemmap()).get(self._filenames[fi])
+        with ExitStack() as stack:
+            fid = None
             bounds = self._raw_extras[fi]["bounds"]
             ents = self._raw_extras[fi]["ent"]
             nchan = self._raw_extras[fi]["orig_nchan"]
@@ -421,8 +443,23 @@ class Raw(BaseRaw):
                 first_pick = max(start - first, 0)
                 last_pick = min(nsamp, stop - first)
                 picksamp = last_pick - first_pick
+                one = None
+                if ent is not None and mm is not None:
+                    one = _read_tag_memmap(mm, ent, (nsamp, nchan))
+                if one is not None:
+                    # select samples and channels before converting so that
+                    # only the needed part of the buffer gets touched
+                    _mult_cal_one(
+                        data[:, offset : (offset + picksamp)],
+                        one[first_pick:last_pick].T[idx],
+                        slice(None),
+                        cals,
+                        mult,
+                    )
                 # only read data if it exists
-                if ent is not None:
+                elif ent is not None:
+                    if fid is None:
+                        fid = stack.enter_context(_fiff_get_fid(self._filenames[fi]))
                     one = read_tag(
                         fid,
                         ent.pos,
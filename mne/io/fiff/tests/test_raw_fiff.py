@@ -29,6 +29,7 @@ from mne import (
     pick_info,
     pick_types,
 )
+from mne._fiff import open as fiff_open_mod
 from mne._fiff.constants import FIFF
 from mne._fiff.open import read_tag, read_tag_info
 from mne._fiff.tag import _read_tag_header
@@ -1447,6 +1448,35 @@ def test_resample_stim():
     raw.resample(500.0, stim_picks="misc")
 
 
+@pytest.mark.parametrize("sfreq", (300.0, 600.614990234375))
+@pytest.mark.parametrize("pad", ("auto", "edge"))
+def test_resample_polyphase_stream(tmp_path, pad, sfreq, monkeypatch):
+    """Test chunked polyphase resampling of data that are not loaded."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, 10000))
+    data[2] = 0
+    data[2, [1000, 5017, 9990]] = [1, 2, 3]
+    info = create_info(3, 2000.0, ("eeg", "eeg", "stim"))
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname)
+    raw = concatenate_raws(
+        [read_raw_fif(fname).crop(0, 3.5), read_raw_fif(fname).crop(1.2, None)]
+    )
+    raw.buffer_size_sec = 0.3
+    want = raw.copy().load_data().resample(sfreq, method="polyphase", pad=pad)
+    # the data must not be read as a whole
+    monkeypatch.setattr(base, "resample", None)
+    got = raw.copy().resample(sfreq, method="polyphase", pad=pad)
+    assert got.preload
+    assert_array_equal(got.first_samp, want.first_samp)
+    assert_allclose(got.get_data(), want.get_data(), atol=1e-12)
+    if sfreq != 300:  # up / down only approximates the ratio
+        return
+    idx = [150, 752, 1442, 2188]
+    assert_array_equal(got.get_data()[2].nonzero()[0], idx)
+    assert_array_equal(got.get_data()[2, idx], [1, 2, 2, 3])
+
+
 @testing.requires_testing_data
 def test_hilbert():
     """Test computation of analytic signal using hilbert."""
@@ -1956,6 +1986,81 @@ def test_memmap(tmp_path):
     # require them.
 
 
+@pytest.mark.parametrize("fmt", ("short", "int", "single", "double"))
+def test_memmap_read(tmp_path, fmt, monkeypatch):
+    """Test that reading via memory-mapped buffers matches tag reading."""
+    rng = np.random.default_rng(0)
+    info = create_info(
+        ["MEG 001", "MEG 002", "EEG 001", "EEG 002", "STI 014"],
+        1000.0,
+        ["mag", "grad", "eeg", "eeg", "stim"],
+    )
+    data = rng.standard_normal((5, 5000)) * 1e-6
+    data[4] = np.arange(5000) % 7
+    raw = RawArray(data, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.3)
+    raw_mm = read_raw_fif(fname)
+    with monkeypatch.context() as m:
+        m.setattr(fiff_open_mod, "_fiff_get_memmap", lambda fname: None)
+        want = read_raw_fif(fname, preload=True)
+    assert raw_mm.orig_format == fmt
+    assert not raw_mm.preload
+    for picks, start, stop in (
+        (None, 0, None),
+        ([4, 0, 2], 123, 1001),  # unsorted picks, crossing buffers
+        ([1], 301, 302),  # a single sample
+        (slice(1, 3), 4500, 5000),
+    ):
+        assert_array_equal(
+            raw_mm.get_data(picks, start, stop), want.get_data(picks, start, stop)
+        )
+    # projection requires reading the other channels, too
+    proj = compute_proj_raw(raw, n_grad=0, n_mag=0, n_eeg=1)
+    raw_mm.add_proj(proj).apply_proj()
+    want.add_proj(proj).apply_proj()
+    assert raw_mm._projector is not None
+    assert_allclose(raw_mm.get_data([2], 10, 4000), want.get_data([2], 10, 4000))
+    # the file is mapped once, copies map it again, and close releases it
+    mm = raw_mm._raw_extras[0]["memmap"].get(fname)
+    assert isinstance(mm, np.memmap)
+    raw_mm.get_data(stop=10)
+    assert raw_mm._raw_extras[0]["memmap"].get(fname) is mm
+    raw_copy = raw_mm.copy()
+    assert raw_copy._raw_extras[0]["memmap"]._mm is None
+    assert_array_equal(raw_copy.get_data(), want.get_data())
+    raw_mm.close()
+    assert raw_mm._raw_extras[0]["memmap"]._mm is None
+    raw_mm.load_data()
+    assert_allclose(raw_mm.get_data(), want.get_data())
+
+
+def test_multiple_files_threaded(tmp_path):
+    """Test reading data spanning several files with multiple threads."""
+    rng = np.random.default_rng(0)
+    info = create_info(
+        ["EEG 001", "EEG 002", "STI 014"], 1000.0, ["eeg"] * 2 + ["stim"]
+    )
+    data = rng.standard_normal((3, 400000)) * 1e-5
+    raw = RawArray(data, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, split_size="2MB")
+    raw_split = read_raw_fif(fname)
+    assert len(raw_split.filenames) > 2
+    raw_concat = concatenate_raws([raw_split.copy(), read_raw_fif(fname)])
+    for this_raw, want in ((raw_split, data), (raw_concat, np.tile(data, 2))):
+        want = RawArray(want, info).apply_function(
+            lambda x: x.astype(np.float32), picks="all"
+        )
+        assert_array_equal(this_raw.get_data(n_jobs=2), want.get_data())
+        kwargs = dict(picks=[1], start=1234, stop=this_raw.n_times - 17)
+        assert_array_equal(
+            this_raw.get_data(n_jobs=2, **kwargs), this_raw.get_data(**kwargs)
+        )
+        this_raw.load_data(n_jobs=3)
+        assert_array_equal(this_raw.get_data(), want.get_data())
+
+
 # These are slow on Azure Windows so let's do a subset
 @pytest.mark.parametrize(
     "kind",
@@ -5,12 +5,18 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import atexit
 import logging
 import multiprocessing
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from .utils import (
     ProgressBar,
+    _check_option,
     _ensure_int,
     _validate_type,
     get_config,
@@ -31,6 +37,7 @@ def parallel_func(
     prefer=None,
     *,
     max_jobs=None,
+    require=None,
     verbose=None,
 ):
     """Return parallel instance with delayed function.
@@ -65,6 +72,11 @@ def parallel_func(
         of a the maximum number of calls into :class:`joblib.Parallel` that
         you will possibly want or need, and the returned ``n_jobs`` should not
         exceed this value regardless of how many jobs the user requests.
+    require : str | None
+        If ``"sharedmem"``, force the use of a thread-based backend so that
+        ``func`` can modify arrays in place. See :class:`joblib.Parallel`.
+
+        .. versionadded:: 1.7
     %(verbose)s INFO or DEBUG
         will print parallel status, others will not.
 
@@ -76,10 +88,42 @@ def parallel_func(
         ``func`` if not parallel or delayed(func).
     n_jobs: int
         Number of jobs >= 1.
+
+    Notes
+    -----
+    If the ``MNE_PARALLEL_BACKEND`` config value is ``"shared_memory"``,
+    process-based jobs are run in a pool of worker processes that persists
+    across calls. Arrays passed to ``func`` that are larger than
+    ``max_nbytes`` are then copied once per call into
+    :mod:`multiprocessing.shared_memory` and passed to the workers as
+    read-only arrays instead of being pickled. Functions that need threads
+    (``prefer="threads"`` or ``require="sharedmem"``) or that cannot be
+    pickled always use joblib.
     """
     should_print = logger.level <= logging.INFO
     # for a single job, we don't need joblib
     _validate_type(n_jobs, ("int-like", None))
+    # check the cheap conditions first, this is called in loops with n_jobs=1
+    backend = "joblib"
+    if n_jobs not in (None, 1) and prefer != "threads" and require is None:
+        backend = get_config("MNE_PARALLEL_BACKEND", "joblib")
+        _check_option("MNE_PARALLEL_BACKEND", backend, ("joblib", "shared_memory"))
+    if backend == "shared_memory" and _picklable(func):
+        n_jobs = _check_n_jobs(n_jobs)
+        if max_jobs is not None:
+            n_jobs = min(n_jobs, max(_ensure_int(max_jobs, "max_jobs"), 1))
+        if n_jobs != 1:
+            if isinstance(max_nbytes, str) and max_nbytes == "auto":
+                max_nbytes = get_config("MNE_MEMMAP_MIN_SIZE", "1M")
+            logger.debug(f"Using the shared memory backend with {n_jobs} jobs")
+            parallel = _SharedMemoryParallel(n_jobs, max_nbytes)
+            parallel_out = parallel
+            if total is not None:
+
+                def parallel_out(op_iter):
+                    return parallel(ProgressBar(iterable=op_iter, max_value=total))
+
+            return parallel_out, _SharedMemoryDelayed(func), n_jobs
     if n_jobs != 1:
         try:
             from joblib import Parallel, delayed
@@ -110,6 +154,7 @@ def parallel_func(
         kwargs = {"verbose": 5 if should_print and total is None else 0}
         kwargs["pre_dispatch"] = pre_dispatch
         kwargs["prefer"] = prefer
+        kwargs["require"] = require
         if cache_dir is None:
             max_nbytes = None  # disable memmaping
         kwargs["temp_folder"] = cache_dir
@@ -155,3 +200,141 @@ def _check_n_jobs(n_jobs):
                 f"not be less than the number of CPUs present ({n_cores})"
             )
     return n_jobs
+
+
+###############################################################################
+# Shared memory backend
+
+_pool = dict(executor=None, n_jobs=None)
+_worker_shms = dict()  # in workers: the attached shared memory segments
+
+
+def _picklable(func):
+    try:
+        pickle.dumps(func)
+    except Exception:
+        logger.debug(f"Cannot pickle {func}, using joblib")
+        return False
+    return True
+
+
+def _nbytes(size):
+    """Convert a size like 1000, "100K", "1M" or "1G" to bytes (None: inf)."""
+    if size is None:
+        return np.inf
+    if isinstance(size, str):
+        mult = dict(K=1024, M=1024**2, G=1024**3)[size[-1].upper()]
+        return float(size[:-1]) * mult
+    return _ensure_int(size, "max_nbytes")
+
+
+def _get_pool(n_jobs):
+    """Get the persistent worker pool, (re)creating it if necessary."""
+    if _pool["executor"] is None or _pool["n_jobs"] != n_jobs:
+        _shutdown_pool()
+        logger.debug(f"Starting a pool of {n_jobs} worker processes")
+        _pool["executor"] = ProcessPoolExecutor(n_jobs)
+        _pool["n_jobs"] = n_jobs
+    return _pool["executor"]
+
+
+@atexit.register
+def _shutdown_pool():
+    """Shut down the persistent worker pool."""
+    if _pool["executor"] is not None:
+        _pool["executor"].shutdown()
+    _pool.update(executor=None, n_jobs=None)
+
+
+class _SharedArray:
+    """A description of an array stored in shared memory."""
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def attach(self):
+        """Get a read-only view of the array (in a worker)."""
+        from multiprocessing import shared_memory
+
+        if self.name not in _worker_shms:
+            # the workers share the resource tracker of the parent, which
+            # owns (and unlinks) the segment
+            _worker_shms[self.name] = shared_memory.SharedMemory(self.name)
+        arr = np.ndarray(self.shape, self.dtype, buffer=_worker_shms[self.name].buf)
+        arr.flags.writeable = False
+        return arr
+
+
+class _SharedMemoryDelayed:
+    """Like joblib.delayed, but for _SharedMemoryParallel."""
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, *args, **kwargs):
+        return self.func, args, kwargs
+
+
+class _SharedMemoryParallel:
+    """Run delayed calls in the persistent pool, sharing large arrays."""
+
+    def __init__(self, n_jobs, max_nbytes):
+        self.n_jobs = n_jobs
+        self.max_nbytes = _nbytes(max_nbytes)
+
+    def __call__(self, tasks):
+        from multiprocessing import shared_memory
+
+        shms = dict()  # id(array) -> (SharedMemory, _SharedArray, array)
+
+        def share(x):
+            if (
+                not isinstance(x, np.ndarray)
+                or x.dtype.hasobject
+                or x.nbytes < max(self.max_nbytes, 1)
+            ):
+                return x
+            if id(x) not in shms:  # the same array is only shared once
+                shm = shared_memory.SharedMemory(create=True, size=x.nbytes)
+                np.ndarray(x.shape, x.dtype, buffer=shm.buf)[...] = x
+                shms[id(x)] = (shm, _SharedArray(shm.name, x.shape, x.dtype), x)
+            return shms[id(x)][1]
+
+        executor = _get_pool(self.n_jobs)
+        try:
+            futures = list()
+            for func, args, kwargs in tasks:
+                args = tuple(share(arg) for arg in args)
+                kwargs = {key: share(val) for key, val in kwargs.items()}
+                futures.append(
+                    executor.submit(_run_shared, func, args, kwargs, logger.level)
+                )
+            return [future.result() for future in futures]
+        finally:
+            for shm, _, _ in shms.values():
+                shm.close()
+                shm.unlink()
+
+
+def _run_shared(func, args, kwargs, level):
+    """Run a function in a worker, attaching to shared arrays."""
+    # release segments from previous calls that are no longer referenced
+    for name in list(_worker_shms):
+        try:
+            _worker_shms[name].close()
+        except BufferError:  # still in use
+            pass
+        else:
+            del _worker_shms[name]
+
+    def attach(x):
+        return x.attach() if isinstance(x, _SharedArray) else x
+
+    args = tuple(attach(arg) for arg in args)
+    kwargs = {key: attach(val) for key, val in kwargs.items()}
+    # results are pickled before the next task runs, so they can safely be
+    # views of the shared memory
+    with use_log_level(level):
+        return func(*args, **kwargs)
@@ -10,6 +10,10 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import json
+import os
+from contextlib import nullcontext
+
 import numpy as np
 from scipy import ndimage, sparse
 from scipy.sparse.csgraph import connected_components
@@ -22,7 +26,9 @@ from ..source_estimate import MixedSourceEstimate, SourceEstimate, VolSourceEsti
 from ..source_space import SourceSpaces
 from ..utils import (
     ProgressBar,
+    _check_fname,
     _check_option,
+    _ensure_int,
     _pl,
     _validate_type,
     check_random_state,
@@ -31,88 +37,99 @@ from ..utils import (
     verbose,
     warn,
 )
+from ._adjacency import combine_adjacency
 from .parametric import f_oneway, ttest_1samp_no_p
 
 
-def _get_buddies_fallback(r, s, neighbors, indices=None):
-    if indices is None:
-        buddies = np.where(r)[0]
-    else:
-        buddies = indices[r[indices]]
-    buddies = buddies[np.isin(s[buddies], neighbors, assume_unique=True)]
-    r[buddies] = False
-    return buddies.tolist()
-
-
-def _get_selves_fallback(r, s, ind, inds, t, t_border, max_step):
-    start = t_border[max(t[ind] - max_step, 0)]
-    stop = t_border[min(t[ind] + max_step + 1, len(t_border) - 1)]
-    indices = inds[start:stop]
-    selves = indices[r[indices]]
-    selves = selves[s[ind] == s[selves]]
-    r[selves] = False
-    return selves.tolist()
+def _labels_fallback(n_active, row, col):
+    graph = sparse.coo_matrix(
+        (np.ones(len(row), bool), (row, col)), shape=(n_active, n_active)
+    )
+    # components are numbered in the order of their lowest node
+    return connected_components(graph, directed=False)[1]
+
+
+def _st_labels_fallback(x_in, active, indptr, indices, n_src, max_step):
+    n_active = len(active)
+    lookup = np.empty(x_in.size, np.intp)
+    lookup[active] = np.arange(n_active)
+    t, s = np.divmod(active, n_src)
+    # spatial neighbors of each active point at the same time point
+    counts = indptr[s + 1] - indptr[s]
+    rows = np.repeat(np.arange(n_active), counts)
+    offsets = np.repeat(indptr[s] - np.cumsum(counts) + counts, counts)
+    cols = t[rows] * n_src + indices[offsets + np.arange(len(rows))]
+    keep = x_in[cols]
+    rows, cols = [rows[keep]], [lookup[cols[keep]]]
+    # the same vertex at up to max_step earlier time points
+    for step in range(1, max_step + 1):
+        prev = np.where(t >= step)[0]
+        other = active[prev] - step * n_src
+        keep = x_in[other]
+        rows.append(prev[keep])
+        cols.append(lookup[other[keep]])
+    return _labels_fallback(n_active, np.concatenate(rows), np.concatenate(cols))
 
 
-def _where_first_fallback(x):
-    # this is equivalent to np.where(r)[0] for these purposes, but it's
-    # a little bit faster. Unfortunately there's no way to tell numpy
-    # just to find the first instance (to save checking every one):
-    next_ind = int(np.argmax(x))
-    if next_ind == 0:
-        next_ind = -1
-    return next_ind
+if has_numba:  # pragma: no cover
 
+    @jit()
+    def _find_root(parent, ii):
+        while parent[ii] != ii:
+            parent[ii] = parent[parent[ii]]
+            ii = parent[ii]
+        return ii
 
-if has_numba:  # pragma: no cover
+    @jit()
+    def _union(parent, ii, jj):
+        # the lowest node becomes the root, so parent[ii] <= ii always holds
+        ii = _find_root(parent, ii)
+        jj = _find_root(parent, jj)
+        if ii < jj:
+            parent[jj] = ii
+        elif jj < ii:
+            parent[ii] = jj
 
     @jit()
-    def _get_buddies(r, s, neighbors, indices=None):
-        buddies = list()
-        # At some point we might be able to use the sorted-ness of s or
-        # neighbors to further speed this up
-        if indices is None:
-            n_check = len(r)
-        else:
-            n_check = len(indices)
-        for ii in range(n_check):
-            if indices is None:
-                this_idx = ii
-            else:
-                this_idx = indices[ii]
-            if r[this_idx]:
-                this_s = s[this_idx]
-                for ni in range(len(neighbors)):
-                    if this_s == neighbors[ni]:
-                        buddies.append(this_idx)
-                        r[this_idx] = False
-                        break
-        return buddies
+    def _flatten_roots(parent):
+        # parents precede their children, so a single pass suffices
+        for ii in range(len(parent)):
+            parent[ii] = parent[parent[ii]]
+        return parent
 
     @jit()
-    def _get_selves(r, s, ind, inds, t, t_border, max_step):
-        selves = list()
-        start = t_border[max(t[ind] - max_step, 0)]
-        stop = t_border[min(t[ind] + max_step + 1, len(t_border) - 1)]
-        for ii in range(start, stop):
-            this_idx = inds[ii]
-            if r[this_idx] and s[ind] == s[this_idx]:
-                selves.append(this_idx)
-                r[this_idx] = False
-        return selves
+    def _labels(n_active, row, col):
+        parent = np.arange(n_active)
+        for ii in range(len(row)):
+            _union(parent, row[ii], col[ii])
+        return _flatten_roots(parent)
 
     @jit()
-    def _where_first(x):
-        for ii in range(len(x)):
-            if x[ii]:
-                return ii
-        return -1
+    def _st_labels(x_in, active, indptr, indices, n_src, max_step):
+        lookup = np.empty(x_in.size, np.int64)
+        parent = np.arange(len(active))
+        for ii in range(len(active)):
+            lookup[active[ii]] = ii
+        for ii in range(len(active)):
+            this_idx = active[ii]
+            t = this_idx // n_src
+            s = this_idx - t * n_src
+            # earlier neighbors at the same time point
+            for jj in range(indptr[s], indptr[s + 1]):
+                other = t * n_src + indices[jj]
+                if other < this_idx and x_in[other]:
+                    _union(parent, ii, lookup[other])
+            # the same vertex at earlier time points
+            for step in range(1, min(max_step, t) + 1):
+                other = this_idx - step * n_src
+                if x_in[other]:
+                    _union(parent, ii, lookup[other])
+        return _flatten_roots(parent)
 
 else:  # pragma: no cover
     # fastest ways we've found with NumPy
-    _get_buddies = _get_buddies_fallback
-    _get_selves = _get_selves_fallback
-    _where_first = _where_first_fallback
+    _labels = _labels_fallback
+    _st_labels = _st_labels_fallback
 
 
 @jit()
@@ -130,196 +147,50 @@ def _sum_cluster_data(data, tstep):
     return np.sign(data) * np.logical_not(data == 0) * tstep
 
 
-def _get_clusters_spatial(s, neighbors):
-    """Form spatial clusters using neighbor lists.
+def _labels_to_clusters(active, labels):
+    """Split the active indices into clusters ordered by their first index."""
+    order = np.argsort(labels, kind="stable")
+    labels = labels[order]
+    bounds = np.where(labels[1:] != labels[:-1])[0] + 1
+    return np.split(active[order], bounds)
 
-    This is equivalent to _get_components with n_times = 1, with a properly
-    reconfigured adjacency matrix (formed as "neighbors" list)
-    """
-    # s is a vector of spatial indices that are significant, like:
-    #     s = np.where(x_in)[0]
-    # for x_in representing a single time-instant
-    r = np.ones(s.shape, bool)
-    clusters = list()
-    next_ind = 0 if s.size > 0 else -1
-    while next_ind >= 0:
-        # put first point in a cluster, adjust remaining
-        t_inds = [next_ind]
-        r[next_ind] = 0
-        icount = 1  # count of nodes in the current cluster
-        while icount <= len(t_inds):
-            ind = t_inds[icount - 1]
-            # look across other vertices
-            buddies = _get_buddies(r, s, neighbors[s[ind]])
-            t_inds.extend(buddies)
-            icount += 1
-        next_ind = _where_first(r)
-        clusters.append(s[t_inds])
-    return clusters
 
+def _get_clusters_st(x_in, adjacency, max_step=1):
+    """Get spatio-temporal clusters from a mask and a spatial CSR adjacency.
 
-def _reassign(check, clusters, base, num):
-    """Reassign cluster numbers."""
-    # reconfigure check matrix
-    check[check == num] = base
-    # concatenate new values into clusters array
-    clusters[base - 1] = np.concatenate((clusters[base - 1], clusters[num - 1]))
-    clusters[num - 1] = np.array([], dtype=int)
-
-
-def _get_clusters_st_1step(keepers, neighbors):
-    """Directly calculate clusters.
-
-    This uses knowledge that time points are
-    only adjacent to immediate neighbors for data organized as time x space.
-
-    This algorithm time increases linearly with the number of time points,
-    compared to with the square for the standard (graph) algorithm.
-
-    This algorithm creates clusters for each time point using a method more
-    efficient than the standard graph method (but otherwise equivalent), then
-    combines these clusters across time points in a reasonable way.
+    Points are adjacent when they are spatial neighbors at the same time
+    point, or the same vertex at most max_step time points apart. The
+    algorithm time increases linearly with the number of points in the mask.
     """
-    n_src = len(neighbors)
-    n_times = len(keepers)
-    # start cluster numbering at 1 for diffing convenience
-    enum_offset = 1
-    check = np.zeros((n_times, n_src), dtype=int)
-    clusters = list()
-    for ii, k in enumerate(keepers):
-        c = _get_clusters_spatial(k, neighbors)
-        for ci, cl in enumerate(c):
-            check[ii, cl] = ci + enum_offset
-        enum_offset += len(c)
-        # give them the correct offsets
-        c = [cl + ii * n_src for cl in c]
-        clusters += c
-
-    # now that each cluster has been assigned a unique number, combine them
-    # by going through each time point
-    for check1, check2, k in zip(check[:-1], check[1:], keepers[:-1]):
-        # go through each one that needs reassignment
-        inds = k[check2[k] - check1[k] > 0]
-        check1_d = check1[inds]
-        n = check2[inds]
-        nexts = np.unique(n)
-        for num in nexts:
-            prevs = check1_d[n == num]
-            base = np.min(prevs)
-            for pr in np.unique(prevs[prevs != base]):
-                _reassign(check1, clusters, base, pr)
-            # reassign values
-            _reassign(check2, clusters, base, num)
-    # clean up clusters
-    clusters = [cl for cl in clusters if len(cl) > 0]
-    return clusters
-
-
-def _get_clusters_st_multistep(keepers, neighbors, max_step=1):
-    """Directly calculate clusters.
-
-    This uses knowledge that time points are
-    only adjacent to immediate neighbors for data organized as time x space.
-
-    This algorithm time increases linearly with the number of time points,
-    compared to with the square for the standard (graph) algorithm.
-    """
-    n_src = len(neighbors)
-    n_times = len(keepers)
-    t_border = list()
-    t_border.append(0)
-    for ki, k in enumerate(keepers):
-        keepers[ki] = k + ki * n_src
-        t_border.append(t_border[ki] + len(k))
-    t_border = np.array(t_border)
-    keepers = np.concatenate(keepers)
-    v = keepers
-    t, s = divmod(v, n_src)
-
-    r = np.ones(t.shape, dtype=bool)
-    clusters = list()
-    inds = np.arange(t_border[0], t_border[n_times])
-    next_ind = 0 if s.size > 0 else -1
-    while next_ind >= 0:
-        # put first point in a cluster, adjust remaining
-        t_inds = [next_ind]
-        r[next_ind] = False
-        icount = 1  # count of nodes in the current cluster
-        # look for significant values at the next time point,
-        # same sensor, not placed yet, and add those
-        while icount <= len(t_inds):
-            ind = t_inds[icount - 1]
-            selves = _get_selves(r, s, ind, inds, t, t_border, max_step)
-
-            # look at current time point across other vertices
-            these_inds = inds[t_border[t[ind]] : t_border[t[ind] + 1]]
-            buddies = _get_buddies(r, s, neighbors[s[ind]], these_inds)
-
-            t_inds += buddies + selves
-            icount += 1
-        next_ind = _where_first(r)
-        clusters.append(v[t_inds])
-
-    return clusters
-
-
-def _get_clusters_st(x_in, neighbors, max_step=1):
-    """Choose the most efficient version."""
-    n_src = len(neighbors)
-    n_times = x_in.size // n_src
-    cl_goods = np.where(x_in)[0]
-    if len(cl_goods) > 0:
-        keepers = [np.array([], dtype=int)] * n_times
-        row, col = np.unravel_index(cl_goods, (n_times, n_src))
-        lims = [0]
-        if isinstance(row, int):
-            row = [row]
-            col = [col]
-        else:
-            order = np.argsort(row)
-            row = row[order]
-            col = col[order]
-            lims += (np.where(np.diff(row) > 0)[0] + 1).tolist()
-            lims.append(len(row))
-
-        for start, end in zip(lims[:-1], lims[1:]):
-            keepers[row[start]] = np.sort(col[start:end])
-        if max_step == 1:
-            return _get_clusters_st_1step(keepers, neighbors)
-        else:
-            return _get_clusters_st_multistep(keepers, neighbors, max_step)
-    else:
+    active = np.where(x_in)[0]
+    if len(active) == 0:
         return []
+    labels = _st_labels(
+        x_in,
+        active,
+        adjacency.indptr,
+        adjacency.indices,
+        adjacency.shape[0],
+        max_step,
+    )
+    return _labels_to_clusters(active, labels)
 
 
-def _get_components(x_in, adjacency, return_list=True):
+def _get_components(x_in, adjacency):
     """Get connected components from a mask and a adjacency matrix."""
+    x_in = np.asarray(x_in, bool)
+    active = np.where(x_in)[0]
+    if len(active) == 0:
+        return []
     if adjacency is False:
-        components = np.arange(len(x_in))
-    else:
-        mask = np.logical_and(x_in[adjacency.row], x_in[adjacency.col])
-        data = adjacency.data[mask]
-        row = adjacency.row[mask]
-        col = adjacency.col[mask]
-        shape = adjacency.shape
-        idx = np.where(x_in)[0]
-        row = np.concatenate((row, idx))
-        col = np.concatenate((col, idx))
-        data = np.concatenate((data, np.ones(len(idx), dtype=data.dtype)))
-        adjacency = sparse.coo_matrix((data, (row, col)), shape=shape)
-        _, components = connected_components(adjacency)
-    if return_list:
-        start = np.min(components)
-        stop = np.max(components)
-        comp_list = [list() for i in range(start, stop + 1, 1)]
-        mask = np.zeros(len(comp_list), dtype=bool)
-        for ii, comp in enumerate(components):
-            comp_list[comp].append(ii)
-            mask[comp] += x_in[ii]
-        clusters = [np.array(k) for k, m in zip(comp_list, mask) if m]
-        return clusters
-    else:
-        return components
+        return [active[ii : ii + 1] for ii in range(len(active))]
+    mask = np.logical_and(x_in[adjacency.row], x_in[adjacency.col])
+    lookup = np.empty(len(x_in), np.intp)
+    lookup[active] = np.arange(len(active))
+    labels = _labels(
+        len(active), lookup[adjacency.row[mask]], lookup[adjacency.col[mask]]
+    )
+    return _labels_to_clusters(active, labels)
 
 
 def _find_clusters(
@@ -348,15 +219,16 @@ def _find_clusters(
         threshold-free cluster enhancement.
     tail : -1 | 0 | 1
         Type of comparison
-    adjacency : scipy.sparse.coo_matrix, None, or list
+    adjacency : scipy.sparse.coo_matrix, scipy.sparse.csr_matrix, None, or False
         Defines adjacency between features. The matrix is assumed to
         be symmetric and only the upper triangular half is used.
-        If adjacency is a list, it is assumed that each entry stores the
-        indices of the spatial neighbors in a spatio-temporal dataset x.
+        If adjacency is a CSR matrix, it is assumed to be the symmetric
+        spatial adjacency of a spatio-temporal dataset x (see
+        ``_setup_adjacency``).
         Default is None, i.e, a regular lattice adjacency.
         False means no adjacency.
     max_step : int
-        If adjacency is a list, this defines the maximal number of steps
+        If adjacency is a CSR matrix, this defines the maximal number of steps
         between vertices along the second dimension (typically time) to be
         considered adjacent.
     include : 1D bool array or None
@@ -428,7 +300,6 @@ def _find_clusters(
                     "computation (h_power=%0.2f, e_power=%0.2f)"
                     % (len(thresholds), thresholds[0], thresholds[-1], h_power, e_power)
                 )
-        scores = np.zeros(x.size)
     else:
         thresholds = [threshold]
         tfce = False
@@ -442,51 +313,18 @@ def _find_clusters(
     if tail == -1 and not np.all(np.diff(thresholds) < 0):
         raise ValueError("Thresholds must be monotonically decreasing")
 
-    # set these here just in case thresholds == []
-    clusters = list()
-    sums = list()
-    for ti, thresh in enumerate(thresholds):
-        # these need to be reset on each run
-        clusters = list()
-        if tail == 0:
-            x_ins = [
-                np.logical_and(x > thresh, include),
-                np.logical_and(x < -thresh, include),
-            ]
-        elif tail == -1:
-            x_ins = [np.logical_and(x < thresh, include)]
-        else:  # tail == 1
-            x_ins = [np.logical_and(x > thresh, include)]
-        # loop over tails
-        for x_in in x_ins:
-            if np.any(x_in):
-                out = _find_clusters_1dir_parts(
-                    x, x_in, adjacency, max_step, partitions, t_power, ndimage
-                )
-                clusters += out[0]
-                sums.append(out[1])
-        if tfce:
-            # the score of each point is the sum of the h^H * e^E for each
-            # supporting section "rectangle" h x e.
-            if ti == 0:
-                h = abs(thresh)
-            else:
-                h = abs(thresh - thresholds[ti - 1])
-            h = h**h_power
-            for c in clusters:
-                # triage based on cluster storage type
-                if isinstance(c, slice):
-                    len_c = c.stop - c.start
-                elif isinstance(c, tuple):
-                    len_c = len(c)
-                elif c.dtype == bool:
-                    len_c = np.sum(c)
-                else:
-                    len_c = len(c)
-                scores[c] += h * (len_c**e_power)
-    # turn sums into array
-    sums = np.concatenate(sums) if sums else np.array([])
     if tfce:
+        sums = _tfce(
+            x,
+            thresholds,
+            tail,
+            include,
+            adjacency,
+            max_step,
+            partitions,
+            h_power,
+            e_power,
+        )
         # each point gets treated independently
         clusters = np.arange(x.size)
         if adjacency is None or adjacency is False:
@@ -498,10 +336,214 @@ def _find_clusters(
                 clusters = [(clusters == ii).ravel() for ii in range(len(clusters))]
         else:
             clusters = [np.array([c]) for c in clusters]
-        sums = scores
+        return clusters, sums
+
+    clusters = list()
+    sums = list()
+    # loop over tails
+    for x_in in _threshold_masks(x, threshold, tail, include):
+        if np.any(x_in):
+            out = _find_clusters_1dir_parts(
+                x, x_in, adjacency, max_step, partitions, t_power, ndimage
+            )
+            clusters += out[0]
+            sums.append(out[1])
+    # turn sums into array
+    sums = np.concatenate(sums) if sums else np.array([])
     return clusters, sums
 
 
+def _threshold_masks(x, thresh, tail, include):
+    """Get the supra-threshold points of x for each tail."""
+    if tail == 0:
+        return [
+            np.logical_and(x > thresh, include),
+            np.logical_and(x < -thresh, include),
+        ]
+    elif tail == -1:
+        return [np.logical_and(x < thresh, include)]
+    else:  # tail == 1
+        return [np.logical_and(x > thresh, include)]
+
+
+def _tfce_fallback(
+    x, thresholds, tail, include, adjacency, max_step, partitions, h_power, e_power
+):
+    scores = np.zeros(x.size)
+    for ti, thresh in enumerate(thresholds):
+        clusters = list()
+        for x_in in _threshold_masks(x, thresh, tail, include):
+            if np.any(x_in):
+                clusters += _find_clusters_1dir_parts(
+                    x, x_in, adjacency, max_step, partitions, 1, ndimage
+                )[0]
+        # the score of each point is the sum of the h^H * e^E for each
+        # supporting section "rectangle" h x e.
+        if ti == 0:
+            h = abs(thresh)
+        else:
+            h = abs(thresh - thresholds[ti - 1])
+        h = h**h_power
+        for c in clusters:
+            # triage based on cluster storage type
+            if isinstance(c, slice):
+                len_c = c.stop - c.start
+            elif isinstance(c, tuple):  # slices from ndimage.find_objects
+                len_c = np.prod([cc.stop - cc.start for cc in c])
+            elif c.dtype == bool:
+                len_c = np.sum(c)
+            else:
+                len_c = len(c)
+            scores[c] += h * (len_c**e_power)
+    return scores
+
+
+@jit()
+def _tfce_find(parent, acc, ii):
+    root = ii
+    while parent[root] != root:
+        root = parent[root]
+    # compress the path, keeping the sum of acc from each point to the root
+    total = 0.0
+    jj = ii
+    while jj != root:
+        total += acc[jj]
+        jj = parent[jj]
+    while ii != root:
+        jj = parent[ii]
+        this_acc = acc[ii]
+        acc[ii] = total
+        parent[ii] = root
+        total -= this_acc
+        ii = jj
+    return root
+
+
+@jit()
+def _tfce_flush(size, acc, mark, root, done, e_power):
+    # add the steps since the last change of this component
+    acc[root] += (done - mark[root]) * size[root] ** e_power
+    mark[root] = done
+
+
+@jit()
+def _tfce_union(parent, size, acc, mark, ii, jj, done, e_power):
+    if size[jj] == 0:  # not above threshold yet
+        return
+    ii = _tfce_find(parent, acc, ii)
+    jj = _tfce_find(parent, acc, jj)
+    if ii == jj:
+        return
+    _tfce_flush(size, acc, mark, ii, done, e_power)
+    _tfce_flush(size, acc, mark, jj, done, e_power)
+    if size[ii] < size[jj]:
+        ii, jj = jj, ii
+    parent[jj] = ii
+    acc[jj] -= acc[ii]
+    size[ii] += size[jj]
+
+
+@jit()
+def _tfce_1dir(v, order, thresholds, h, indptr, indices, n_src, max_step, e_power):
+    """Compute TFCE scores of v > thresholds in a single sweep.
+
+    Points are added in descending order of v, and each component keeps its
+    accumulated score lazily at its root. The score of a point is the sum of
+    acc along its path to the root.
+    """
+    n_tot = v.size
+    n_times = n_tot // n_src
+    parent = np.arange(n_tot)
+    size = np.zeros(n_tot, np.int64)
+    acc = np.zeros(n_tot)
+    mark = np.zeros(n_tot)
+    done = 0.0  # sum of h over the thresholds above the current one
+    n_in = 0
+    for ti in range(len(thresholds) - 1, -1, -1):
+        while n_in < len(order) and v[order[n_in]] > thresholds[ti]:
+            this_idx = order[n_in]
+            n_in += 1
+            size[this_idx] = 1
+            mark[this_idx] = done
+            t = this_idx // n_src
+            s = this_idx - t * n_src
+            for jj in range(indptr[s], indptr[s + 1]):
+                other = t * n_src + indices[jj]
+                _tfce_union(parent, size, acc, mark, this_idx, other, done, e_power)
+            for step in range(1, max_step + 1):
+                if t >= step:
+                    other = this_idx - step * n_src
+                    _tfce_union(parent, size, acc, mark, this_idx, other, done, e_power)
+                if t + step < n_times:
+                    other = this_idx + step * n_src
+                    _tfce_union(parent, size, acc, mark, this_idx, other, done, e_power)
+        done += h[ti]
+    scores = np.zeros(n_tot)
+    for ii in range(n_in):
+        root = _tfce_find(parent, acc, order[ii])
+        _tfce_flush(size, acc, mark, root, done, e_power)
+    for ii in range(n_in):
+        this_idx = order[ii]
+        root = parent[this_idx]
+        scores[this_idx] = acc[this_idx]
+        if root != this_idx:
+            scores[this_idx] += acc[root]
+    return scores
+
+
+def _tfce_incremental(
+    x, thresholds, tail, include, adjacency, max_step, partitions, h_power, e_power
+):
+    # partitions are the connected components of the adjacency, so they do
+    # not change the clusters
+    thresholds = np.asarray(thresholds, float)
+    scores = np.zeros(x.size)
+    if len(thresholds) == 0:
+        return scores
+    h = np.abs(np.diff(thresholds, prepend=0.0)) ** h_power
+    # traverse the points as spatio-temporal data with a spatial CSR adjacency
+    if adjacency is None:  # lattice, with the first axis as time
+        if x.ndim == 1:
+            adjacency = sparse.csr_matrix((1, 1))
+        else:
+            adjacency = combine_adjacency(*x.shape[1:]).tocsr()
+        max_step = 1
+    elif adjacency is False:
+        adjacency = sparse.csr_matrix((x.size, x.size))
+        max_step = 0
+    elif adjacency.format == "coo":
+        adjacency = (adjacency + adjacency.transpose()).tocsr()
+        max_step = 0
+    x = x.ravel()
+    include = include.ravel()
+    if tail == 0:
+        sweeps = [(x, thresholds), (-x, thresholds)]
+    else:
+        sweeps = [(tail * x, tail * thresholds)]
+    for v, this_thresholds in sweeps:
+        order = np.where(np.logical_and(v > this_thresholds[0], include))[0]
+        order = order[np.argsort(-v[order], kind="stable")]
+        scores += _tfce_1dir(
+            v,
+            order,
+            this_thresholds,
+            h,
+            adjacency.indptr,
+            adjacency.indices,
+            adjacency.shape[0],
+            max_step,
+            e_power,
+        )
+    return scores
+
+
+if has_numba:  # pragma: no cover
+    _tfce = _tfce_incremental
+else:  # pragma: no cover
+    # labeling once per threshold is faster than the sweep in pure Python
+    _tfce = _tfce_fallback
+
+
 def _find_clusters_1dir_parts(
     x, x_in, adjacency, max_step, partitions, t_power, ndimage
 ):
@@ -558,12 +600,12 @@ def _find_clusters_1dir(x, x_in, adjacency, max_step, t_power, ndimage):
             raise Exception(
                 "Data should be 1D when using a adjacency " "to define clusters."
             )
-        if isinstance(adjacency, sparse.spmatrix) or adjacency is False:
+        if adjacency is False or adjacency.format == "coo":
             clusters = _get_components(x_in, adjacency)
-        elif isinstance(adjacency, list):  # use temporal adjacency
+        elif adjacency.format == "csr":  # use temporal adjacency
             clusters = _get_clusters_st(x_in, adjacency, max_step)
         else:
-            raise ValueError("adjacency must be a sparse matrix or list")
+            raise ValueError("adjacency must be a COO or CSR sparse matrix")
         if t_power == 1:
             sums = [_masked_sum(x, c) for c in clusters]
         else:
@@ -636,44 +678,52 @@ def _setup_adjacency(adjacency, n_tests, n_times):
             )
         # we claim to only use upper triangular part... not true here
         adjacency = (adjacency + adjacency.transpose()).tocsr()
-        adjacency = [
-            adjacency.indices[adjacency.indptr[i] : adjacency.indptr[i + 1]]
-            for i in range(len(adjacency.indptr) - 1)
-        ]
     return adjacency
 
 
-def _do_permutations(
-    X_full,
-    slices,
-    threshold,
-    tail,
-    adjacency,
-    stat_fun,
-    max_step,
-    include,
-    partitions,
-    t_power,
-    orders,
-    sample_shape,
-    buffer_size,
-    progress_bar,
-):
+# Maximum number of statistic values computed at once for a block of
+# permutations when the statistic can be computed with a matrix product
+_PERM_BLOCK_SIZE = 2**22
+
+
+def _iter_perm_stats(X_full, slices, stat_fun, orders, buffer_size):
+    """Compute the statistic of the data for each permutation of samples."""
     n_samp, n_vars = X_full.shape
+    if stat_fun is f_oneway:
+        # the sums of the groups of a block of permutations are a single
+        # product of a (permutation, group, sample) indicator matrix and X
+        n_groups = len(slices)
+        labels = np.empty(n_samp, int)
+        for k, s in enumerate(slices):
+            labels[s] = k
+        n_per_group = np.bincount(labels).astype(float)
+        ss_alldata = np.sum(X_full**2, axis=0)
+        square_of_sums_alldata = np.sum(X_full, axis=0) ** 2 / n_samp
+        sstot = ss_alldata - square_of_sums_alldata
+        dfbn, dfwn = n_groups - 1, n_samp - n_groups
+        dtype = X_full.dtype if X_full.dtype.kind == "f" else np.float64
+        n_block = max(_PERM_BLOCK_SIZE // (n_vars * n_groups), 1)
+        for start in range(0, len(orders), n_block):
+            block = np.array(orders[start : start + n_block])
+            indicator = np.zeros((len(block), n_groups, n_samp), dtype)
+            indicator[np.arange(len(block))[:, np.newaxis], labels, block] = 1
+            sums = indicator.reshape(-1, n_samp) @ X_full
+            sums = sums.reshape(len(block), n_groups, n_vars)
+            ssbn = np.tensordot(1.0 / n_per_group, sums**2, axes=(0, 1))
+            ssbn -= square_of_sums_alldata
+            yield from (ssbn / dfbn) / ((sstot - ssbn) / dfwn)
+        return
 
     if buffer_size is not None and n_vars <= buffer_size:
         buffer_size = None  # don't use buffer for few variables
 
-    # allocate space for output
-    max_cluster_sums = np.empty(len(orders), dtype=np.double)
-
     if buffer_size is not None:
         # allocate buffer, so we don't need to allocate memory during loop
         X_buffer = [
             np.empty((len(X_full[s]), buffer_size), dtype=X_full.dtype) for s in slices
         ]
 
-    for seed_idx, order in enumerate(orders):
+    for order in orders:
         # shuffle sample indices
         assert order is not None
         idx_shuffle_list = [order[s] for s in slices]
@@ -697,10 +747,33 @@ def _do_permutations(
                 # apply stat_fun and store result
                 tmp = stat_fun(*X_buffer)
                 t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
+        yield t_obs_surr
+
+
+def _do_permutations(
+    X_full,
+    slices,
+    threshold,
+    tail,
+    adjacency,
+    stat_fun,
+    max_step,
+    include,
+    partitions,
+    t_power,
+    orders,
+    sample_shape,
+    buffer_size,
+    progress_bar,
+):
+    # allocate space for output
+    max_cluster_sums = np.empty(len(orders), dtype=np.double)
 
+    stats = _iter_perm_stats(X_full, slices, stat_fun, orders, buffer_size)
+    for seed_idx, t_obs_surr in enumerate(stats):
         # The stat should have the same shape as the samples for no adj.
         if adjacency is None:
-            t_obs_surr.shape = sample_shape
+            t_obs_surr = t_obs_surr.reshape(sample_shape)
 
         # Find cluster on randomized stats
         out = _find_clusters(
@@ -725,36 +798,36 @@ def _do_permutations(
     return max_cluster_sums
 
 
-def _do_1samp_permutations(
-    X,
-    slices,
-    threshold,
-    tail,
-    adjacency,
-    stat_fun,
-    max_step,
-    include,
-    partitions,
-    t_power,
-    orders,
-    sample_shape,
-    buffer_size,
-    progress_bar,
-):
+def _iter_1samp_stats(X, stat_fun, orders, buffer_size):
+    """Compute the statistic of the data for each sign flip."""
     n_samp, n_vars = X.shape
-    assert slices is None  # should be None for the 1 sample case
+    if stat_fun is ttest_1samp_no_p:
+        # the sign flips of a block of permutations are a single product of
+        # a (permutation, sample) sign matrix and X, which leaves the sum of
+        # squares unchanged
+        ss = np.sum(X**2, axis=0)
+        dtype = X.dtype if X.dtype.kind == "f" else np.float64
+        n_block = max(_PERM_BLOCK_SIZE // n_vars, 1)
+        for start in range(0, len(orders), n_block):
+            block = np.array(orders[start : start + n_block])
+            assert block.shape[1] == n_samp  # should be guaranteed by parent
+            signs = (2 * block - 1).astype(dtype)
+            if not np.all(np.equal(np.abs(signs), 1)):
+                raise ValueError("signs from rng must be +/- 1")
+            mean = signs @ X
+            mean /= n_samp
+            var = np.maximum(ss - n_samp * mean**2, 0) / (n_samp - 1)
+            yield from mean / np.sqrt(var / n_samp)
+        return
 
     if buffer_size is not None and n_vars <= buffer_size:
         buffer_size = None  # don't use buffer for few variables
 
-    # allocate space for output
-    max_cluster_sums = np.empty(len(orders), dtype=np.double)
-
     if buffer_size is not None:
         # allocate a buffer so we don't need to allocate memory in loop
         X_flip_buffer = np.empty((n_samp, buffer_size), dtype=X.dtype)
 
-    for seed_idx, order in enumerate(orders):
+    for order in orders:
         assert isinstance(order, np.ndarray)
         # new surrogate data with specified sign flip
         assert order.size == n_samp  # should be guaranteed by parent
@@ -785,10 +858,35 @@ def _do_1samp_permutations(
                 # apply stat_fun and store result
                 tmp = stat_fun(X_flip_buffer)
                 t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
+        yield t_obs_surr
+
+
+def _do_1samp_permutations(
+    X,
+    slices,
+    threshold,
+    tail,
+    adjacency,
+    stat_fun,
+    max_step,
+    include,
+    partitions,
+    t_power,
+    orders,
+    sample_shape,
+    buffer_size,
+    progress_bar,
+):
+    assert slices is None  # should be None for the 1 sample case
 
+    # allocate space for output
+    max_cluster_sums = np.empty(len(orders), dtype=np.double)
+
+    stats = _iter_1samp_stats(X, stat_fun, orders, buffer_size)
+    for seed_idx, t_obs_surr in enumerate(stats):
         # The stat should have the same shape as the samples for no adj.
         if adjacency is None:
-            t_obs_surr.shape = sample_shape
+            t_obs_surr = t_obs_surr.reshape(sample_shape)
 
         # Find cluster on randomized stats
         out = _find_clusters(
@@ -892,6 +990,199 @@ def _get_1samp_orders(n_samples, n_permutations, tail, rng):
     return orders, n_permutations, extra
 
 
+# Number of permutations computed between two writes of a checkpoint
+_CHECKPOINT_SIZE = 500
+
+
+def _check_checkpoint(checkpoint, shard, seed):
+    """Check the checkpoint and shard parameters."""
+    if isinstance(checkpoint, (list, tuple)):
+        if shard is not None:
+            raise ValueError("shard cannot be used when merging checkpoints")
+        return [
+            _check_fname(fname, "read", must_exist=True, name="checkpoint")
+            for fname in checkpoint
+        ], None
+    if checkpoint is not None:
+        checkpoint = _check_fname(checkpoint, overwrite=True, name="checkpoint")
+    if shard is not None:
+        _validate_type(shard, (tuple, list), "shard")
+        shard = tuple(_ensure_int(s, "shard") for s in shard)
+        if len(shard) != 2 or not 0 <= shard[0] < shard[1]:
+            raise ValueError(
+                "shard must be a tuple (index, n_shards) with "
+                f"0 <= index < n_shards, got {shard}"
+            )
+        if checkpoint is None:
+            raise ValueError("shard requires a checkpoint file")
+        if not isinstance(seed, (int, np.integer)):
+            raise ValueError(
+                "shard requires an int seed so that all shards use the same "
+                f"permutations, got {seed!r}"
+            )
+    return checkpoint, shard
+
+
+def _rng_to_json(rng):
+    if isinstance(rng, np.random.Generator):
+        state = dict(generator=True, state=rng.bit_generator.state)
+    else:
+        state = dict(generator=False, state=rng.get_state(legacy=False))
+    return json.dumps(state, default=lambda x: x.tolist())
+
+
+def _rng_from_json(state):
+    state = json.loads(state)
+    if state["generator"]:
+        bit_generator = getattr(np.random, state["state"]["bit_generator"])()
+        bit_generator.state = state["state"]
+        return np.random.Generator(bit_generator)
+    rng = np.random.RandomState()
+    rng.set_state(state["state"])
+    return rng
+
+
+def _read_checkpoint(fname, fingerprint):
+    with np.load(fname) as fid:
+        data = dict(fid)
+    for key, value in fingerprint.items():
+        if key not in data or not np.array_equal(data[key], value):
+            raise ValueError(
+                f"The checkpoint {fname} was written for a different test "
+                f"({key} does not match)"
+            )
+    data["rng_state"] = str(data["rng_state"])
+    data["shard"] = tuple(data["shard"].tolist())
+    return data
+
+
+def _check_checkpoint_seed(fname, seed, rng_state):
+    """Check that an explicit seed matches the RNG state of a checkpoint."""
+    if seed is not None and _rng_to_json(check_random_state(seed)) != rng_state:
+        raise ValueError(
+            f"The checkpoint {fname} was written with a different seed than "
+            f"{seed!r}, use the same seed or seed=None to use its random state"
+        )
+
+
+def _init_checkpoint(checkpoint, shard, seed, **fingerprint):
+    """Read the state of a checkpoint, or start a new one.
+
+    Returns the checkpoint information (None without checkpoint) and the RNG
+    to draw the permutations with, which is restored when resuming.
+    """
+    rng = check_random_state(seed)
+    if checkpoint is None:
+        return None, rng
+    if isinstance(checkpoint, list):  # merge the shards
+        shards = [_read_checkpoint(fname, fingerprint) for fname in checkpoint]
+        n_orders = int(shards[0]["n_orders"])
+        n_shards = shards[0]["shard"][1]
+        H0 = np.empty(n_orders)
+        got = np.zeros(n_orders, int)
+        for fname, data in zip(checkpoint, shards):
+            index = data["shard"][0]
+            if (
+                data["shard"][1] != n_shards
+                or data["n_orders"] != n_orders
+                or data["rng_state"] != shards[0]["rng_state"]
+            ):
+                raise ValueError(
+                    f"The checkpoint {fname} is not a shard of the same "
+                    f"permutations as {checkpoint[0]}"
+                )
+            if len(data["H0"]) != len(range(index, n_orders, n_shards)):
+                raise ValueError(f"The checkpoint {fname} is not finished")
+            H0[index::n_shards] = data["H0"]
+            got[index::n_shards] += 1
+        if not np.all(got == 1):
+            raise ValueError(
+                f"The checkpoints must contain each of the {n_shards} shards "
+                "exactly once"
+            )
+        _check_checkpoint_seed(checkpoint[0], seed, shards[0]["rng_state"])
+        ckpt = dict(fname=None, H0=H0, n_orders=n_orders, shard=(0, 1))
+        return ckpt, _rng_from_json(shards[0]["rng_state"])
+    ckpt = dict(
+        fname=checkpoint,
+        H0=np.empty(0),
+        n_orders=None,
+        shard=(0, 1) if shard is None else shard,
+        fingerprint=fingerprint,
+    )
+    if checkpoint.is_file():
+        data = _read_checkpoint(checkpoint, fingerprint)
+        if data["shard"] != ckpt["shard"]:
+            raise ValueError(
+                f"The checkpoint {checkpoint} was written for shard "
+                f"{data['shard']}, got {ckpt['shard']}"
+            )
+        _check_checkpoint_seed(checkpoint, seed, data["rng_state"])
+        ckpt.update(H0=data["H0"], n_orders=int(data["n_orders"]))
+        rng = _rng_from_json(data["rng_state"])
+        logger.info(
+            f"Resuming from {len(ckpt['H0'])} permutation{_pl(ckpt['H0'])} "
+            f"in {checkpoint}"
+        )
+    ckpt["rng_state"] = _rng_to_json(rng)
+    return ckpt, rng
+
+
+def _write_checkpoint(ckpt, H0):
+    fname = ckpt["fname"]
+    tmp = fname.with_name(fname.name + ".tmp")
+    # write to a temporary file first so that a killed job keeps the last one
+    with open(tmp, "wb") as fid:
+        np.savez(
+            fid,
+            H0=H0,
+            n_orders=ckpt["n_orders"],
+            shard=ckpt["shard"],
+            rng_state=ckpt["rng_state"],
+            **ckpt["fingerprint"],
+        )
+    os.replace(tmp, fname)
+
+
+def _compute_h0(compute, orders, ckpt, mesg):
+    """Compute the H0 values of the permutation orders.
+
+    ``compute(orders, progress_bar, offset)`` returns the H0 values of a chunk
+    of orders, starting at ``offset`` in the progress bar (None if ``mesg`` is
+    None). With a checkpoint,
+    the orders of its shard are computed in chunks and saved after each one.
+    """
+    n_shards = 1 if ckpt is None else ckpt["shard"][1]
+    use = np.arange(0 if ckpt is None else ckpt["shard"][0], len(orders), n_shards)
+    H0 = list()
+    step = max(len(use), 1)
+    if ckpt is not None:
+        if ckpt["n_orders"] not in (None, len(orders)):
+            raise ValueError(
+                f"The checkpoint has {ckpt['n_orders']} permutations, but "
+                f"{len(orders)} were requested"
+            )
+        if ckpt["fname"] is None:  # merged
+            return ckpt["H0"]
+        ckpt["n_orders"] = len(orders)
+        H0.append(ckpt["H0"])
+        step = _CHECKPOINT_SIZE
+        if len(ckpt["H0"]) == 0:
+            _write_checkpoint(ckpt, ckpt["H0"])
+    n_done = sum(len(h) for h in H0)
+    if mesg is None:
+        progress_bar = nullcontext()
+    else:
+        progress_bar = ProgressBar(iterable=range(len(use) - n_done), mesg=mesg)
+    with progress_bar:
+        for start in range(n_done, len(use), step):
+            these_orders = [orders[ii] for ii in use[start : start + step]]
+            H0.append(compute(these_orders, progress_bar, start - n_done))
+            if ckpt is not None:
+                _write_checkpoint(ckpt, np.concatenate(H0))
+    return np.concatenate(H0) if H0 else np.empty(0)
+
+
 def _permutation_cluster_test(
     X,
     threshold,
@@ -908,6 +1199,8 @@ def _permutation_cluster_test(
     out_type,
     check_disjoint,
     buffer_size,
+    checkpoint=None,
+    shard=None,
 ):
     """Aux Function.
 
@@ -917,6 +1210,9 @@ def _permutation_cluster_test(
     """
     _check_option("out_type", out_type, ["mask", "indices"])
     _check_option("tail", tail, [-1, 0, 1])
+    checkpoint, shard = _check_checkpoint(checkpoint, shard, seed)
+    if checkpoint is not None and step_down_p > 0:
+        raise ValueError("checkpoint cannot be used with step_down_p > 0")
     if not isinstance(threshold, dict):
         threshold = float(threshold)
         if (
@@ -1006,6 +1302,7 @@ def _permutation_cluster_test(
         show_info=True,
     )
     clusters, cluster_stats = out
+    fingerprint = dict(t_obs=t_obs.ravel().copy(), cluster_stats=cluster_stats)
 
     # The stat should have the same shape as the samples
     t_obs.shape = sample_shape
@@ -1030,7 +1327,7 @@ def _permutation_cluster_test(
     # check to see if we can do an exact test
     # (for a two-tailed test, we can exploit symmetry to just do half)
     extra = ""
-    rng = check_random_state(seed)
+    ckpt, rng = _init_checkpoint(checkpoint, shard, seed, **fingerprint)
     del seed
     if len(X) == 1:  # 1-sample test
         do_perm_func = _do_1samp_permutations
@@ -1074,28 +1371,30 @@ def _permutation_cluster_test(
         else:
             this_include = step_down_include
 
-        with ProgressBar(
-            iterable=range(len(orders)), mesg=f"Permuting{extra}"
-        ) as progress_bar:
-            H0 = parallel(
-                my_do_perm_func(
-                    X_full,
-                    slices,
-                    threshold,
-                    tail,
-                    adjacency,
-                    stat_fun,
-                    max_step,
-                    this_include,
-                    partitions,
-                    t_power,
-                    order,
-                    sample_shape,
-                    buffer_size,
-                    progress_bar.subset(idx),
+        def compute(orders, progress_bar, offset):
+            return np.concatenate(
+                parallel(
+                    my_do_perm_func(
+                        X_full,
+                        slices,
+                        threshold,
+                        tail,
+                        adjacency,
+                        stat_fun,
+                        max_step,
+                        this_include,
+                        partitions,
+                        t_power,
+                        order,
+                        sample_shape,
+                        buffer_size,
+                        progress_bar.subset(idx + offset),
+                    )
+                    for idx, order in split_list(orders, n_jobs, idx=True)
                 )
-                for idx, order in split_list(orders, n_jobs, idx=True)
             )
+
+        H0 = _compute_h0(compute, orders, ckpt, f"Permuting{extra}")
         # include original (true) ordering
         if tail == -1:  # up tail
             orig = cluster_stats.min()
@@ -1103,8 +1402,7 @@ def _permutation_cluster_test(
             orig = cluster_stats.max()
         else:
             orig = abs(cluster_stats).max()
-        H0.insert(0, [orig])
-        H0 = np.concatenate(H0)
+        H0 = np.concatenate([[orig], H0])
         logger.debug("Computing cluster p-values")
         cluster_pv = _pval_from_histogram(cluster_stats, H0, tail)
 
@@ -1184,6 +1482,9 @@ def permutation_cluster_test(
     check_disjoint=False,
     buffer_size=1000,
     verbose=None,
+    *,
+    checkpoint=None,
+    shard=None,
 ):
     """Cluster-level statistical permutation test.
 
@@ -1224,6 +1525,8 @@ def permutation_cluster_test(
     %(check_disjoint_clust)s
     %(buffer_size_clust)s
     %(verbose)s
+    %(checkpoint_clust)s
+    %(shard_perm)s
 
     Returns
     -------
@@ -1261,6 +1564,8 @@ def permutation_cluster_test(
         out_type=out_type,
         check_disjoint=check_disjoint,
         buffer_size=buffer_size,
+        checkpoint=checkpoint,
+        shard=shard,
     )
 
 
@@ -1282,6 +1587,9 @@ def permutation_cluster_1samp_test(
     check_disjoint=False,
     buffer_size=1000,
     verbose=None,
+    *,
+    checkpoint=None,
+    shard=None,
 ):
     """Non-parametric cluster-level paired t-test.
 
@@ -1311,6 +1619,8 @@ def permutation_cluster_1samp_test(
     %(check_disjoint_clust)s
     %(buffer_size_clust)s
     %(verbose)s
+    %(checkpoint_clust)s
+    %(shard_perm)s
 
     Returns
     -------
@@ -1371,6 +1681,8 @@ def permutation_cluster_1samp_test(
         out_type=out_type,
         check_disjoint=check_disjoint,
         buffer_size=buffer_size,
+        checkpoint=checkpoint,
+        shard=shard,
     )
 
 
@@ -1392,6 +1704,9 @@ def spatio_temporal_cluster_1samp_test(
     check_disjoint=False,
     buffer_size=1000,
     verbose=None,
+    *,
+    checkpoint=None,
+    shard=None,
 ):
     """Non-parametric cluster-level paired t-test for spatio-temporal data.
 
@@ -1425,6 +1740,8 @@ def spatio_temporal_cluster_1samp_test(
     %(check_disjoint_clust)s
     %(buffer_size_clust)s
     %(verbose)s
+    %(checkpoint_clust)s
+    %(shard_perm)s
 
     Returns
     -------
@@ -1468,6 +1785,8 @@ def spatio_temporal_cluster_1samp_test(
         out_type=out_type,
         check_disjoint=check_disjoint,
         buffer_size=buffer_size,
+        checkpoint=checkpoint,
+        shard=shard,
     )
 
 
@@ -1489,6 +1808,9 @@ def spatio_temporal_cluster_test(
     check_disjoint=False,
     buffer_size=1000,
     verbose=None,
+    *,
+    checkpoint=None,
+    shard=None,
 ):
     """Non-parametric cluster-level test for spatio-temporal data.
 
@@ -1524,6 +1846,8 @@ def spatio_temporal_cluster_test(
     %(check_disjoint_clust)s
     %(buffer_size_clust)s
     %(verbose)s
+    %(checkpoint_clust)s
+    %(shard_perm)s
 
     Returns
     -------
@@ -1567,6 +1891,8 @@ def spatio_temporal_cluster_test(
         out_type=out_type,
         check_disjoint=check_disjoint,
         buffer_size=buffer_size,
+        checkpoint=checkpoint,
+        shard=shard,
     )
 
 
@@ -1605,15 +1931,8 @@ def _st_mask_from_s_inds(n_times, n_vertices, vertices, set_as=True):
 @verbose
 def _get_partitions_from_adjacency(adjacency, n_times, verbose=None):
     """Specify disjoint subsets (e.g., hemispheres) based on adjacency."""
-    if isinstance(adjacency, list):
-        test = np.ones(len(adjacency))
-        test_adj = np.zeros((len(adjacency), len(adjacency)), dtype="bool")
-        for vi in range(len(adjacency)):
-            test_adj[adjacency[vi], vi] = True
-        test_adj = sparse.coo_matrix(test_adj, dtype="float")
-    else:
-        test = np.ones(adjacency.shape[0])
-        test_adj = adjacency
+    test = np.ones(adjacency.shape[0])
+    test_adj = adjacency.tocoo()
 
     part_clusts = _find_clusters(test, 0, 1, test_adj)[0]
     if len(part_clusts) > 1:
@@ -1621,7 +1940,7 @@ def _get_partitions_from_adjacency(adjacency, n_times, verbose=None):
         partitions = np.zeros(len(test), dtype="int")
         for ii, pc in enumerate(part_clusts):
             partitions[pc] = ii
-        if isinstance(adjacency, list):
+        if adjacency.format == "csr":  # spatio-temporal
             partitions = np.tile(partitions, n_times)
     else:
         logger.info("No disjoint adjacency sets found")
@@ -5,7 +5,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
-from functools import reduce
+from functools import lru_cache, reduce
 from string import ascii_uppercase
 
 import numpy as np
@@ -265,6 +265,61 @@ def _iter_contrasts(n_subjects, factor_levels, effect_picks):
         yield c_, df1, df2
 
 
+class _RMDesign:
+    """Contrasts of a fully balanced repeated-measures design.
+
+    The contrasts of all effects are stacked in a single matrix so that the
+    effects of all observations are computed with one matrix product.
+    """
+
+    def __init__(self, n_subjects, factor_levels, effects):
+        effect_picks, _ = _map_effects(len(factor_levels), effects)
+        contrasts, df1, df2 = zip(
+            *_iter_contrasts(n_subjects, factor_levels, effect_picks)
+        )
+        sizes = [c_.shape[1] for c_ in contrasts]
+        self.n_subjects = n_subjects
+        # shape (n_columns, n_conditions)
+        self.contrast = np.concatenate(contrasts, axis=1).T
+        self.starts = np.cumsum([0] + sizes[:-1])
+        self.slices = [
+            slice(start, start + size) for start, size in zip(self.starts, sizes)
+        ]
+        self.df1 = np.array(df1, float)
+        self.df2 = np.array(df2, float)
+
+    def fit(self, data, correction=False):
+        """Get the F-values and Greenhouse-Geisser epsilons of each effect.
+
+        data has shape (n_subjects, n_conditions, n_obs), and the outputs
+        have shape (n_effects, n_obs) (eps is None without correction).
+        """
+        y = np.matmul(self.contrast, data)
+        b = np.mean(y, axis=0)
+        ss = self.n_subjects * np.add.reduceat(b * b, self.starts, axis=0)
+        yy = np.add.reduceat(np.einsum("sko,sko->ko", y, y), self.starts, axis=0)
+        mse = (yy - ss) / (self.df2 / self.df1)[:, np.newaxis]
+        fvals = ss / mse
+        eps = None
+        if correction:
+            # sample covariances, leave off "/ (y.shape[1] - 1)" norm because
+            # it falls out.
+            eps = np.empty_like(fvals)
+            for ii, sl in enumerate(self.slices):
+                v = np.einsum("sko,slo->klo", y[:, sl], y[:, sl])
+                v = np.einsum("klo,klo->o", v, v)
+                eps[ii] = yy[ii] ** 2 / (self.df1[ii] * v)
+        return fvals, eps
+
+
+@lru_cache(maxsize=10)
+def _get_rm_design(n_subjects, factor_levels, effects):
+    """Get a cached design, as f_mway_rm is often called once per permutation."""
+    if not isinstance(effects, str):
+        effects = list(effects)
+    return _RMDesign(n_subjects, list(factor_levels), effects)
+
+
 def f_threshold_mway_rm(n_subjects, factor_levels, effects="A*B", pvalue=0.05):
     """Compute F-value thresholds for a two-way ANOVA.
 
@@ -365,7 +420,14 @@ def f_mway_rm(data, factor_levels, effects="all", correction=False, return_pvals
 
     Notes
     -----
+    The contrasts of a design are computed once and cached, and the effects
+    of all observations are obtained with a single matrix product, so this
+    function is cheap to call repeatedly (e.g., as the ``stat_fun`` of a
+    cluster-level permutation test).
+
     .. versionadded:: 0.10
+    .. versionchanged:: 1.7
+       All observations and effects are computed at once.
     """
     out_reshape = (-1,)
     if data.ndim == 2:  # general purpose support, e.g. behavioural data
@@ -374,35 +436,21 @@ def f_mway_rm(data, factor_levels, effects="all", correction=False, return_pvals
         out_reshape = data.shape[2:]
         data = data.reshape(data.shape[0], data.shape[1], np.prod(data.shape[2:]))
 
-    effect_picks, _ = _map_effects(len(factor_levels), effects)
+    if not isinstance(effects, str):
+        effects = tuple(effects)
+    design = _get_rm_design(data.shape[0], tuple(factor_levels), effects)
     n_obs = data.shape[2]
-    n_replications = data.shape[0]
-
-    # put last axis in front to 'iterate' over mass univariate instances.
-    data = np.rollaxis(data, 2)
-    fvalues, pvalues = [], []
-    for c_, df1, df2 in _iter_contrasts(n_replications, factor_levels, effect_picks):
-        y = np.dot(data, c_)
-        b = np.mean(y, axis=1)[:, np.newaxis, :]
-        ss = np.sum(np.sum(y * b, axis=2), axis=1)
-        mse = (np.sum(np.sum(y * y, axis=2), axis=1) - ss) / (df2 / df1)
-        fvals = ss / mse
-        fvalues.append(fvals)
-        if correction:
-            # sample covariances, leave off "/ (y.shape[1] - 1)" norm because
-            # it falls out.
-            v = np.array([np.dot(y_.T, y_) for y_ in y])
-            v = np.array([np.trace(vv) for vv in v]) ** 2 / (
-                df1 * np.sum(np.sum(v * v, axis=2), axis=1)
-            )
-            eps = v
 
-        df1, df2 = np.zeros(n_obs) + df1, np.zeros(n_obs) + df2
+    fvalues, eps = design.fit(data, correction)
+    pvalues = []
+    for ii, fvals in enumerate(fvalues):
+        df1 = np.zeros(n_obs) + design.df1[ii]
+        df2 = np.zeros(n_obs) + design.df2[ii]
         if correction:
             # numerical imprecision can cause eps=0.99999999999999989
             # even with a single category, so never let our degrees of
             # freedom drop below 1.
-            df1, df2 = [np.maximum(d[None, :] * eps, 1.0) for d in (df1, df2)]
+            df1, df2 = [np.maximum(d * eps[ii], 1.0) for d in (df1, df2)]
 
         if return_pvals:
             pvals = stats.f(df1, df2).sf(fvals)
@@ -24,7 +24,15 @@ def _max_stat(X, X2, perms, dof_scaling):
 
 @verbose
 def permutation_t_test(
-    X, n_permutations=10000, tail=0, n_jobs=None, seed=None, verbose=None
+    X,
+    n_permutations=10000,
+    tail=0,
+    n_jobs=None,
+    seed=None,
+    verbose=None,
+    *,
+    checkpoint=None,
+    shard=None,
 ):
     """One sample/paired sample permutation test based on a t-statistic.
 
@@ -55,6 +63,8 @@ def permutation_t_test(
     %(n_jobs)s
     %(seed)s
     %(verbose)s
+    %(checkpoint_perm)s
+    %(shard_perm)s
 
     Returns
     -------
@@ -76,24 +86,35 @@ def permutation_t_test(
     ----------
     .. footbibliography::
     """
-    from .cluster_level import _get_1samp_orders
+    from .cluster_level import (
+        _check_checkpoint,
+        _compute_h0,
+        _get_1samp_orders,
+        _init_checkpoint,
+    )
 
+    checkpoint, shard = _check_checkpoint(checkpoint, shard, seed)
     n_samples, n_tests = X.shape
     X2 = np.mean(X**2, axis=0)  # precompute moments
     mu0 = np.mean(X, axis=0)
     dof_scaling = sqrt(n_samples / (n_samples - 1.0))
     std0 = np.sqrt(X2 - mu0**2) * dof_scaling  # get std with var splitting
     T_obs = np.mean(X, axis=0) / (std0 / sqrt(n_samples))
-    rng = check_random_state(seed)
+    ckpt, rng = _init_checkpoint(checkpoint, shard, seed, T_obs=T_obs)
     orders, _, extra = _get_1samp_orders(n_samples, n_permutations, tail, rng)
-    perms = 2 * np.array(orders) - 1  # from 0, 1 -> 1, -1
     logger.info("Permuting %d times%s..." % (len(orders), extra))
     parallel, my_max_stat, n_jobs = parallel_func(_max_stat, n_jobs)
-    max_abs = np.concatenate(
-        parallel(
-            my_max_stat(X, X2, p, dof_scaling) for p in np.array_split(perms, n_jobs)
+
+    def compute(orders, progress_bar, offset):
+        perms = 2 * np.array(orders) - 1  # from 0, 1 -> 1, -1
+        return np.concatenate(
+            parallel(
+                my_max_stat(X, X2, p, dof_scaling)
+                for p in np.array_split(perms, n_jobs)
+            )
         )
-    )
+
+    max_abs = _compute_h0(compute, orders, ckpt, mesg=None)
     max_abs = np.concatenate((max_abs, [np.abs(T_obs).max()]))
     H0 = np.sort(max_abs)
     if tail == 0:
@@ -792,6 +792,126 @@ def test_permutation_test_H0(numba_conditional):
         assert_equal(len(h0), 2 ** (7 - (tail == 0)))  # exact test
 
 
+@pytest.mark.parametrize("kind", ("1samp", "F"))
+def test_permutation_batched(kind, monkeypatch):
+    """Test batched permutation statistics against one stat_fun call each."""
+    from mne.stats import cluster_level
+
+    rng = np.random.RandomState(0)
+    if kind == "1samp":
+        X = rng.randn(12, 10, 15) + 0.3
+        func, stat_fun = spatio_temporal_cluster_1samp_test, ttest_1samp_no_p
+    else:
+        X = [rng.randn(n, 10, 15) + offset for n, offset in ((8, 0), (11, 0.5))]
+        func, stat_fun = spatio_temporal_cluster_test, f_oneway
+    kwargs = dict(threshold=2.0, n_permutations=100, seed=0, out_type="mask")
+    # a different function object disables the batched statistics
+    want = func(X, stat_fun=partial(stat_fun), **kwargs)
+    for block_size in (1, 500, cluster_level._PERM_BLOCK_SIZE):
+        monkeypatch.setattr(cluster_level, "_PERM_BLOCK_SIZE", block_size)
+        got = func(X, stat_fun=stat_fun, **kwargs)
+        assert_allclose(got[0], want[0])
+        assert_array_equal(got[1], want[1])
+        assert_allclose(got[2], want[2])
+        assert_allclose(got[3], want[3], rtol=1e-10)
+
+
+@pytest.mark.parametrize("kind", ("1samp", "F"))
+def test_permutation_checkpoint(kind, tmp_path, monkeypatch):
+    """Test resuming and sharding permutations with checkpoints."""
+    from mne.stats import cluster_level
+
+    monkeypatch.setattr(cluster_level, "_CHECKPOINT_SIZE", 7)
+    rng = np.random.RandomState(0)
+    if kind == "1samp":
+        X = rng.randn(25, 30) + 0.3
+        func = permutation_cluster_1samp_test
+    else:
+        X = [rng.randn(10, 30), rng.randn(12, 30) + 0.8]
+        func = permutation_cluster_test
+    kwargs = dict(threshold=1.5, n_permutations=50, out_type="mask")
+    want = func(X, seed=0, **kwargs)
+    fname = tmp_path / "perm.npz"
+    got = func(X, seed=0, checkpoint=fname, **kwargs)
+    assert_allclose(got[3], want[3], rtol=1e-12)
+    # resume an interrupted run, the RNG state comes from the checkpoint
+    with np.load(fname) as fid:
+        data = dict(fid)
+    assert len(data["H0"]) == 49
+    data["H0"] = data["H0"][:10]
+    np.savez(fname, **data)
+    with catch_logging() as log:
+        got = func(X, seed=None, checkpoint=fname, verbose=True, **kwargs)
+    assert "Resuming from 10 permutations" in log.getvalue()
+    assert_allclose(got[3], want[3], rtol=1e-12)
+    assert_allclose(got[2], want[2])
+    # an explicit seed must match the one of the checkpoint
+    got = func(X, seed=0, checkpoint=fname, **kwargs)
+    assert_allclose(got[3], want[3], rtol=1e-12)
+    with pytest.raises(ValueError, match="different seed"):
+        func(X, seed=1, checkpoint=fname, **kwargs)
+    # shard and merge
+    fnames = [tmp_path / f"shard{ii}.npz" for ii in range(3)]
+    for ii, fname in enumerate(fnames):
+        got = func(X, seed=0, checkpoint=fname, shard=(ii, 3), **kwargs)
+        assert len(got[3]) == 1 + len(range(ii, 49, 3))
+    with pytest.raises(ValueError, match="exactly once"):
+        func(X, checkpoint=fnames[:2] + fnames[:1], **kwargs)
+    got = func(X, checkpoint=fnames, **kwargs)
+    assert_allclose(got[3], want[3], rtol=1e-12)
+    assert_allclose(got[2], want[2])
+    with pytest.raises(ValueError, match="different seed"):
+        func(X, seed=1, checkpoint=fnames, **kwargs)
+    # errors
+    with pytest.raises(ValueError, match="different test"):
+        func(X, threshold=2.0, n_permutations=50, checkpoint=fnames)
+    with pytest.raises(ValueError, match="written for shard"):
+        func(X, seed=0, checkpoint=fnames[0], **kwargs)
+    kwargs["n_permutations"] = 20
+    with pytest.raises(ValueError, match="permutations, but"):
+        func(X, seed=0, checkpoint=fnames[0], shard=(0, 3), **kwargs)
+    with pytest.raises(ValueError, match="int seed"):
+        func(X, checkpoint=fnames[0], shard=(0, 3), **kwargs)
+    with pytest.raises(ValueError, match="0 <= index < n_shards"):
+        func(X, seed=0, checkpoint=fnames[0], shard=(3, 3), **kwargs)
+    with pytest.raises(ValueError, match="step_down_p"):
+        func(X, seed=0, checkpoint=fnames[0], step_down_p=0.05, **kwargs)
+
+
+@pytest.mark.parametrize("max_step", (0, 1, 2))
+def test_spatio_temporal_labeling(numba_conditional, max_step):
+    """Test spatio-temporal labeling against the global graph algorithm."""
+    from mne.stats.cluster_level import (
+        _get_clusters_st,
+        _get_components,
+        _setup_adjacency,
+    )
+
+    rng = np.random.RandomState(0)
+    n_times, n_src = 12, 40
+    adjacency = sparse.random(n_src, n_src, density=0.05, random_state=rng)
+    adjacency = (adjacency + sparse.eye(n_src) > 0).astype(float)
+    # same vertex up to max_step time points apart
+    time_adjacency = sparse.diags(
+        np.ones((2 * max_step + 1, n_times)),
+        np.arange(-max_step, max_step + 1),
+        shape=(n_times, n_times),
+    )
+    full = combine_adjacency(time_adjacency, adjacency).tocoo()
+    st_adjacency = _setup_adjacency(adjacency, n_times * n_src, n_times)
+    assert st_adjacency.format == "csr"
+    for density in (0.0, 0.3, 0.7, 1.0):
+        x_in = rng.rand(n_times * n_src) < density
+        want = _get_components(x_in, full)
+        got = _get_clusters_st(x_in, st_adjacency, max_step)
+        assert len(got) == len(want)
+        if density == 0:
+            assert len(got) == 0
+        for g, w in zip(got, want):
+            assert_array_equal(g, w)
+        assert_array_equal(np.sort(np.concatenate(got or [[]])), np.where(x_in)[0])
+
+
 def test_tfce_thresholds(numba_conditional):
     """Test TFCE thresholds."""
     rng = np.random.RandomState(0)
@@ -817,6 +937,47 @@ def test_tfce_thresholds(numba_conditional):
     permutation_cluster_1samp_test(X=data[..., 0], threshold=dict(start=0, step=0.2))
 
 
+@pytest.mark.parametrize("tail", (-1, 0, 1))
+@pytest.mark.parametrize("kind", ("lattice", "global", "st", "none"))
+def test_tfce_incremental(kind, tail):
+    """Test the single-sweep TFCE against labeling at each threshold."""
+    from mne.stats.cluster_level import (
+        _setup_adjacency,
+        _tfce_fallback,
+        _tfce_incremental,
+    )
+
+    rng = np.random.RandomState(0)
+    n_times, n_src = 6, 20
+    x = 2 * rng.randn(n_times, n_src)
+    include = rng.rand(n_times, n_src) > 0.1
+    adjacency = sparse.random(n_src, n_src, density=0.1, random_state=rng)
+    adjacency = (adjacency + sparse.eye(n_src) > 0).astype(float)
+    max_step = 2
+    if kind == "lattice":
+        adjacency = None
+    elif kind == "global":
+        adjacency = combine_adjacency(n_times, adjacency).tocoo()
+    elif kind == "st":
+        adjacency = _setup_adjacency(adjacency, x.size, n_times)
+    else:
+        adjacency = False
+    if kind != "lattice":
+        x, include = x.ravel(), include.ravel()
+    thresholds = np.arange(0.1, 6, 0.2) * (-1 if tail == -1 else 1)
+    args = (thresholds, tail, include, adjacency, max_step, None, 2, 0.5)
+    want = _tfce_fallback(x, *args)
+    assert (want > 0).any()
+    assert_allclose(_tfce_incremental(x, *args), want, rtol=1e-10)
+    # 1D data without adjacency uses the extent of each cluster
+    if kind == "lattice":
+        want = _tfce_fallback(x[:, :1], *args[:2], include[:, :1], *args[3:])
+        got = _tfce_fallback(x[:, 0], *args[:2], include[:, 0], *args[3:])
+        assert_allclose(got, want)
+        got = _tfce_incremental(x[:, 0], *args[:2], include[:, 0], *args[3:])
+        assert_allclose(got, want)
+
+
 # 1D gives slices, 2D+ gives boolean masks
 @pytest.mark.parametrize("shape", ((11,), (11, 3), (11, 1, 2)))
 @pytest.mark.parametrize("out_type", ("mask", "indices"))
@@ -9,7 +9,13 @@ import scipy.stats
 from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_less
 
 import mne
-from mne.stats.parametric import _map_effects, f_mway_rm, f_threshold_mway_rm
+from mne.stats.parametric import (
+    _get_rm_design,
+    _iter_contrasts,
+    _map_effects,
+    f_mway_rm,
+    f_threshold_mway_rm,
+)
 
 # hardcoded external test results, manually transferred
 test_external = {
@@ -126,6 +132,39 @@ def test_f_twoway_rm():
     assert_array_almost_equal(fvals, test_external["r_fvals_1way"], 5)
 
 
+@pytest.mark.parametrize("correction", (False, True))
+@pytest.mark.parametrize(
+    "factor_levels, effects", [([2, 3], "all"), ([3, 2, 2], "A:B"), ([4], "A")]
+)
+def test_f_mway_rm_vectorized(factor_levels, effects, correction):
+    """Test that the stacked contrasts match a per-effect computation."""
+    rng = np.random.RandomState(0)
+    n_subjects = 10
+    data = rng.randn(n_subjects, np.prod(factor_levels), 4, 5)
+    fvals, pvals = f_mway_rm(data, factor_levels, effects, correction=correction)
+    effect_picks, _ = _map_effects(len(factor_levels), effects)
+    want_f, want_p = [], []
+    for c_, df1, df2 in _iter_contrasts(n_subjects, factor_levels, effect_picks):
+        y = np.einsum("sco,ck->oks", data.reshape(n_subjects, c_.shape[0], -1), c_)
+        ss = n_subjects * (y.mean(-1) ** 2).sum(-1)
+        mse = ((y**2).sum((1, 2)) - ss) / (df2 / df1)
+        if correction:
+            v = y @ y.transpose(0, 2, 1)
+            eps = np.trace(v, axis1=1, axis2=2) ** 2 / (df1 * (v * v).sum((1, 2)))
+            df1, df2 = np.maximum(df1 * eps, 1.0), np.maximum(df2 * eps, 1.0)
+        want_f.append(ss / mse)
+        want_p.append(scipy.stats.f(df1, df2).sf(ss / mse))
+    want_f = np.squeeze(np.reshape(want_f, (-1, 4, 5)))
+    want_p = np.squeeze(np.reshape(want_p, (-1, 4, 5)))
+    assert_allclose(fvals, want_f, rtol=1e-10)
+    assert_allclose(pvals, want_p, rtol=1e-8)
+    # the design is reused, whatever the type of the arguments
+    f_mway_rm(data[..., 0], np.array(factor_levels), effects)
+    info = _get_rm_design.cache_info()
+    f_mway_rm(data[..., 0], tuple(factor_levels), effects)
+    assert _get_rm_design.cache_info().hits == info.hits + 1
+
+
 @pytest.mark.parametrize(
     "kind, kwargs",
     [
@@ -80,6 +80,25 @@ def test_permutation_t_test_tail(tail_name, tail_code):
     assert_allclose(p_values[0], p_values_scipy, rtol=1e-2)
 
 
+def test_permutation_t_test_checkpoint(tmp_path):
+    """Test sharded permutation t-tests."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(30, 5) + 0.2
+    want = permutation_t_test(X, n_permutations=200, seed=1)
+    fnames = [tmp_path / f"shard{ii}.npz" for ii in range(2)]
+    for ii, fname in enumerate(fnames):
+        permutation_t_test(
+            X, n_permutations=200, seed=1, checkpoint=fname, shard=(ii, 2)
+        )
+    got = permutation_t_test(X, n_permutations=200, checkpoint=fnames)
+    for w, g in zip(want, got):
+        assert_allclose(g, w, rtol=1e-12)
+    with pytest.raises(ValueError, match="different test"):
+        permutation_t_test(X + 1, n_permutations=200, checkpoint=fnames)
+    with pytest.raises(ValueError, match="different seed"):
+        permutation_t_test(X, n_permutations=200, seed=2, checkpoint=fnames)
+
+
 def test_ci():
     """Test confidence intervals."""
     # isolated test of CI functions
@@ -789,6 +789,105 @@ def test_own_data():
     assert 1 < len(epochs) < n_now
 
 
+@pytest.mark.parametrize("preload", (True, False))
+@pytest.mark.parametrize("proj", (True, "delayed"))
+def test_epochs_batched_read(tmp_path, monkeypatch, preload, proj):
+    """Test that batched epoch reading matches reading epochs one by one."""
+    sfreq = 1000.0
+    info = create_info(
+        ["EEG 001", "EEG 002", "EEG 003", "EOG 001", "STI 014"],
+        sfreq,
+        ["eeg"] * 3 + ["eog", "stim"],
+    )
+    n_times = 20000
+    data = rng.randn(5, n_times) * 1e-5
+    data[:4] += np.linspace(0, 1e-4, n_times)  # something to detrend
+    data[4] = 0
+    data[0, 6000:6010] = 1e-3  # reject by amplitude
+    raw = RawArray(data, info)
+    with raw.info._unlock():
+        raw.info["lowpass"] = 100.0
+    raw.set_eeg_reference(projection=True)
+    raw.set_annotations(Annotations([5.0, 15.0], [0.5, 0.1], ["bad_x", "edge"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = read_raw_fif(fname)
+    # overlapping events, events far apart, and ones that are out of bounds
+    samps = np.concatenate([[100], np.arange(1000, 8000, 150), [10000, 19900]])
+    events = np.array([samps, np.zeros_like(samps), np.ones_like(samps)]).T
+    kwargs = dict(
+        tmin=-0.2,
+        tmax=0.5,
+        decim=2,
+        detrend=1,
+        reject=dict(eeg=5e-4),
+        proj=proj,
+        preload=preload,
+    )
+
+    with monkeypatch.context() as m:
+        m.setattr(Epochs, "_get_epochs_from_raw", BaseEpochs._get_epochs_from_raw)
+        m.setattr(mne.epochs, "_EPOCH_BATCH_SIZE", 1)
+        want = Epochs(raw, events, **kwargs)
+        want_data = want.get_data()
+    monkeypatch.setattr(mne.epochs, "_EPOCH_BATCH_SIZE", 5 * 5 * 701)
+    epochs = Epochs(raw, events, **kwargs)
+    assert_allclose(epochs.get_data(), want_data, rtol=1e-10, atol=1e-18)
+    assert epochs.drop_log == want.drop_log
+    assert ("NO_DATA",) in epochs.drop_log
+    assert ("TOO_SHORT",) in epochs.drop_log
+    assert ("bad_x",) in epochs.drop_log
+    assert any("EEG 001" in log for log in epochs.drop_log)
+    assert len(epochs) == len(want) > 20
+    if not preload:
+        assert_allclose(
+            epochs.get_data(item=[1, 3]), want_data[[1, 3]], rtol=1e-10, atol=1e-18
+        )
+
+
+def test_epochs_memmap(tmp_path):
+    """Test memory-mapped epochs."""
+    sfreq = 1000.0
+    info = create_info(["EEG 001", "EEG 002", "STI 014"], sfreq, ["eeg"] * 2 + ["stim"])
+    data = rng.randn(3, 10000) * 1e-5
+    data[0, 5000:5010] = 1e-3
+    raw = RawArray(data, info)
+    with raw.info._unlock():
+        raw.info["lowpass"] = 100.0
+    events = make_fixed_length_events(raw, duration=0.5)
+    kwargs = dict(tmin=-0.1, tmax=0.3, baseline=(None, 0))
+    want = Epochs(raw, events, preload=True, **kwargs)
+    fname = tmp_path / "epochs.dat"
+    epochs = Epochs(raw, events, preload=fname, **kwargs)
+    assert epochs.preload
+    assert isinstance(epochs._data, np.memmap)
+    assert Path(epochs._data.filename) == fname
+    assert_array_equal(epochs.get_data(), want.get_data())
+    assert_array_equal(epochs.average().data, want.average().data)
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        want.copy().to_memmap(fname)
+
+    # operations keep the data on disk
+    for ep in (epochs, want):
+        ep.drop_bad(reject=dict(eeg=5e-4)).crop(0, 0.2).decimate(2)
+    assert len(epochs) == len(want) == len(events) - 2  # first one and artifact
+    assert_array_equal(epochs.get_data(), want.get_data())
+    assert Path(epochs._data.filename) == fname
+    sub = epochs[1:4]
+    assert Path(sub._data.filename) == fname
+    assert np.shares_memory(sub._data, epochs._data)
+    assert_array_equal(sub.get_data(), want[1:4].get_data())
+    assert_array_equal(epochs[[0, 2]].get_data(), want[[0, 2]].get_data())
+
+    # non-preloaded and preloaded epochs can both be memory-mapped
+    epochs = Epochs(raw, events, **kwargs).to_memmap(tmp_path / "a.dat")
+    assert Path(epochs._data.filename) == tmp_path / "a.dat"
+    epochs_array = EpochsArray(want.get_data(), want.info)
+    epochs_array.to_memmap(tmp_path / "b.dat")
+    assert isinstance(epochs_array._data, np.memmap)
+    assert_array_equal(epochs_array.get_data(), want.get_data())
+
+
 def test_decim():
     """Test epochs decimation."""
     # First with EpochsArray
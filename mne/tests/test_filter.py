@@ -1,5 +1,9 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
+import threading
+from fractions import Fraction
+from pathlib import Path
+
 import numpy as np
 import pytest
 from numpy.fft import fft, fftfreq
@@ -10,14 +14,18 @@ from numpy.testing import (
     assert_array_equal,
     assert_array_less,
 )
-from scipy.signal import butter, freqz, sosfreqz
+from scipy.signal import butter, freqz, resample_poly, sosfreqz
 from scipy.signal import resample as sp_resample
 
-from mne import Epochs, create_info
+from mne import Annotations, Epochs, create_info
+from mne import filter as filter_mod
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (
+    _FIRStreamer,
     _length_factors,
     _overlap_add_filter,
+    _PolyphaseStreamer,
+    _resamp_ratio_len,
     _resample_stim_channels,
     _smart_pad,
     construct_iir_filter,
@@ -175,6 +183,77 @@ def test_1d_filter():
                             assert_allclose(x_filtered, x_expected, atol=1e-13)
 
 
+@pytest.mark.parametrize("pad", ("reflect_limited", "reflect", "edge"))
+@pytest.mark.parametrize("n_times", (5, 1000))
+def test_overlap_add_block_size(n_times, pad, monkeypatch):
+    """Test batched overlap-add filtering of blocks of rows."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(2, 7, n_times)
+    h = rng.randn(51)
+    picks = [0, 2, 3, 4, 6]
+    want = np.array(
+        [
+            _smart_pad(xx, (10, 20), pad)
+            for xx in x.reshape(-1, n_times)  # _smart_pad along the last axis
+        ]
+    ).reshape(2, 7, -1)
+    assert_array_equal(_smart_pad(x, (10, 20), pad), want)
+    want = _overlap_add_filter(x, h, phase="linear", picks=picks, pad=pad, block_size=1)
+    assert_array_equal(want[:, [1, 5]], x[:, [1, 5]])
+    for block_size in (2, 4, 100, None):
+        got = _overlap_add_filter(
+            x, h, phase="linear", picks=picks, pad=pad, block_size=block_size
+        )
+        assert_allclose(got, want, rtol=1e-10, atol=1e-12)
+    monkeypatch.setenv("MNE_FILTER_BLOCK_SIZE", "3")
+    with catch_logging(verbose="debug") as log:
+        got = _overlap_add_filter(x, h, phase="linear", picks=picks, pad=pad)
+    assert "blocks of: 3 rows" in log.getvalue()
+    assert_allclose(got, want, rtol=1e-10, atol=1e-12)
+    with pytest.raises(ValueError, match="at least 1"):
+        _overlap_add_filter(x, h, block_size=0)
+
+
+@pytest.mark.parametrize("method", ("fir", "iir"))
+def test_filter_design_cache(method, monkeypatch):
+    """Test that filter designs are cached and cannot be modified."""
+    n_calls = dict(firwin=0, iirfilter=0)
+    for name in n_calls:
+        fun = getattr(filter_mod.signal, name)
+
+        def counted(*args, _fun=fun, _name=name, **kwargs):
+            n_calls[_name] += 1
+            return _fun(*args, **kwargs)
+
+        monkeypatch.setattr(filter_mod.signal, name, counted)
+    kind = "firwin" if method == "fir" else "iirfilter"
+    # an unusual sfreq so that the design is not already cached
+    kwargs = dict(sfreq=1234.5, l_freq=1.5, h_freq=40.25, method=method)
+    filt = create_filter(None, **kwargs)
+    assert n_calls[kind] > 0
+    n_design = n_calls[kind]
+    key = "h" if method == "fir" else "sos"
+    want = filt.copy() if method == "fir" else filt["sos"].copy()
+    if method == "fir":
+        filt *= 2  # modifying the output does not change the cache
+    else:
+        filt["sos"] *= 2
+    for _ in range(3):
+        filt = create_filter(None, **kwargs)
+        assert_array_equal(filt if key == "h" else filt[key], want)
+    assert n_calls[kind] == n_design
+    x = np.random.RandomState(0).randn(2, 5000)
+    assert_allclose(filter_data(x, **kwargs), filter_data(x, **kwargs), rtol=0, atol=0)
+    assert n_calls[kind] == n_design
+    # warnings are still emitted every time
+    if method == "fir":
+        for _ in range(2):
+            with pytest.warns(RuntimeWarning, match="Attenuation"):
+                create_filter(
+                    None, 1234.5, None, 40.25, filter_length=11, fir_design="firwin2"
+                )
+
+
 def test_iir_stability():
     """Test IIR filter stability check."""
     sig = np.random.RandomState(0).rand(1000)
@@ -422,6 +501,81 @@ def test_n_jobs(n_jobs):
     assert_allclose(y1, y2)
 
 
+@pytest.mark.parametrize("method", ("fir", "iir"))
+def test_filter_threaded_inplace(method, monkeypatch):
+    """Test that n_jobs > 1 filters in place using threads."""
+    x = np.random.RandomState(0).randn(2, 5, 4000)
+    want = filter_data(x, 1000.0, 1, 40, method=method)
+    threads = set()
+    filter_rows = filter_mod._filter_rows
+
+    def _filter_rows(*args, **kwargs):
+        threads.add(threading.get_ident())
+        return filter_rows(*args, **kwargs)
+
+    monkeypatch.setattr(filter_mod, "_filter_rows", _filter_rows)
+    picks = [0, 2, 3]
+    y = x.copy()
+    out = filter_data(y, 1000.0, 1, 40, picks=picks, method=method, n_jobs=2)
+    assert out is not y
+    assert_array_equal(y, x)
+    assert_allclose(out[:, picks], want[:, picks], rtol=1e-7, atol=1e-20)
+    assert_array_equal(out[:, [1, 4]], x[:, [1, 4]])
+    out = filter_data(y, 1000.0, 1, 40, method=method, n_jobs=2, copy=False)
+    assert np.shares_memory(out, y)
+    assert_allclose(y, want, rtol=1e-7, atol=1e-20)
+    assert len(threads) > 0
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.parametrize("up, down", [(1, 20), (2, 3), (3.0, 2.0), (2.5, 1)])
+def test_resample_polyphase(up, down):
+    """Test polyphase resampling and its chunked version."""
+    x = np.random.RandomState(0).randn(2, 1001, 3)
+    n_out = _resamp_ratio_len(up, down, 1001)[1]
+    frac = Fraction(up / down).limit_denominator()
+    want = resample_poly(
+        x, frac.numerator, frac.denominator, axis=1, padtype="reflect"
+    )[:, :n_out]
+    got = resample(x, up, down, axis=1, method="polyphase")
+    assert_allclose(got, want, atol=1e-12)
+    got = resample(x, up, down, axis=1, method="polyphase", n_jobs=2)
+    assert_allclose(got, want, atol=1e-12)
+    with pytest.raises(TypeError, match="when method='polyphase'"):
+        resample(x, up, down, method="polyphase", n_jobs="cuda")
+    with pytest.raises(ValueError, match="Invalid value for the 'method'"):
+        resample(x, up, down, method="foo")
+    # chunked
+    x = x[..., 0]
+    for pad in ("reflect", "constant"):
+        want = resample(x, up, down, method="polyphase", pad=pad)
+        streamer = _PolyphaseStreamer(
+            frac.numerator, frac.denominator, ("kaiser", 5.0), pad, x.shape[1]
+        )
+        got = np.concatenate(
+            [streamer.feed(x[:, start : start + 99]) for start in range(0, 1001, 99)],
+            axis=-1,
+        )
+        assert_allclose(got, want, atol=1e-12)
+    with pytest.raises(ValueError, match="Fed more samples"):
+        streamer.feed(x[:, :1])
+    # non-integer sampling rates are approximated with small factors
+    x = np.random.RandomState(0).randn(1, 60000)
+    with catch_logging(verbose=True) as log:
+        y = resample(x, 200, 600.614990234375, method="polyphase")
+    assert "up=325, down=976" in log.getvalue()
+    assert y.shape == (1, 19980)
+    with pytest.raises(ValueError, match='use method="fft"'):
+        resample(np.zeros((1, 3000000)), 200, 600.614990234375, method="polyphase")
+    # here 325 / 976 gives one sample less than the exact ratio
+    x = x[:, :2440]
+    want = resample(x, 200, 600.614990234375, method="polyphase")
+    assert want.shape == (1, 813)
+    streamer = _PolyphaseStreamer(325, 976, ("kaiser", 5.0), "reflect", 2440, n_out=813)
+    got = np.concatenate([streamer.feed(x[:, :1000]), streamer.feed(x[:, 1000:])], -1)
+    assert_allclose(got, want, atol=1e-12)
+
+
 def test_resamp_stim_channel():
     """Test resampling of stim channels."""
     # Downsampling
@@ -1037,3 +1191,79 @@ def test_filter_picks():
                 raw.filter(picks=picks, **kwargs)
                 want = want[1:]
                 assert_allclose(raw.get_data(), want)
+
+
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "linear", "minimum"))
+@pytest.mark.parametrize("pad", ("reflect_limited", "edge", "constant"))
+@pytest.mark.parametrize("n_block", (1, 97, 10000))
+def test_fir_streamer(phase, pad, n_block):
+    """Test chunked FIR filtering against filtering all at once."""
+    rng = np.random.RandomState(0)
+    picks = np.array([0, 2])
+    for n_times in (50, 3001):
+        x = rng.randn(3, n_times)
+        h = create_filter(x, 1000.0, 5.0, 40.0, phase=phase, verbose="error")
+        want = _overlap_add_filter(x, h, phase=phase, picks=picks, pad=pad)
+        streamer = _FIRStreamer(h, n_times, picks, phase, pad, n_block)
+        got = np.concatenate(
+            [streamer.feed(x[:, s : s + n_block]) for s in range(0, n_times, n_block)],
+            axis=-1,
+        )
+        assert_allclose(got, want, atol=1e-12)
+        with pytest.raises(ValueError, match="Fed more samples"):
+            streamer.feed(x[:, :1])
+
+
+def test_filter_raw_to_file(tmp_path):
+    """Test filtering Raw in chunks straight to a file."""
+    rng = np.random.RandomState(0)
+    info = create_info(["a", "b", "s"], 500.0, ["eeg", "eeg", "stim"])
+    data = rng.randn(3, 10000) * 1e-5
+    data[2] = 0.0
+    data[2, ::1000] = 1.0
+    raw = RawArray(data, info)
+    raw.set_annotations(Annotations([7.0], [1.5], ["bad_skip"]))
+    raw.save(tmp_path / "orig_raw.fif")
+    raw = read_raw_fif(tmp_path / "orig_raw.fif")
+    assert not raw.preload
+    kwargs = dict(skip_by_annotation=["edge", "bad_skip"])
+    want = raw.copy().load_data().filter(1.0, 40.0, **kwargs)
+    out = raw.filter(
+        1.0,
+        40.0,
+        out_fname=tmp_path / "filt_raw.fif",
+        buffer_size_sec=0.7,
+        **kwargs,
+    )
+    assert not raw.preload
+    assert Path(out.filenames[0]) == tmp_path / "filt_raw.fif"
+    assert out.info["highpass"] == want.info["highpass"] == 1.0
+    assert out.info["lowpass"] == want.info["lowpass"] == 40.0
+    assert raw.info["lowpass"] == 250.0
+    assert_allclose(out.get_data(), want.get_data(), rtol=1e-6, atol=1e-12)
+    assert_array_equal(out.get_data("s"), raw.get_data("s"))
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        raw.filter(1.0, 40.0, out_fname=tmp_path / "filt_raw.fif")
+
+    # notch and causal IIR
+    want = raw.copy().load_data().notch_filter(50.0)
+    out = raw.notch_filter(50.0, out_fname=tmp_path / "notch_raw.fif")
+    assert_allclose(out.get_data(), want.get_data(), rtol=1e-6, atol=1e-12)
+    kwargs = dict(method="iir", phase="forward")
+    want = raw.copy().load_data().filter(None, 40.0, **kwargs)
+    out = raw.filter(None, 40.0, out_fname=tmp_path / "iir_raw.fif", **kwargs)
+    assert_allclose(out.get_data(), want.get_data(), rtol=1e-6, atol=1e-12)
+
+    # errors
+    with pytest.raises(ValueError, match='requires phase="forward"'):
+        raw.filter(None, 40.0, method="iir", out_fname=tmp_path / "bad_raw.fif")
+    with pytest.raises(ValueError, match="Invalid value for the 'pad'"):
+        raw.filter(None, 40.0, pad="wrap", out_fname=tmp_path / "bad_raw.fif")
+    with pytest.raises(ValueError, match="Invalid value for the 'method'"):
+        raw.notch_filter(
+            50.0, method="spectrum_fit", out_fname=tmp_path / "bad_raw.fif"
+        )
+    with pytest.raises(ValueError, match="only be used with Raw"):
+        Epochs(want, np.array([[1000, 0, 1]]), preload=True).filter(
+            None, 40.0, out_fname=tmp_path / "bad_raw.fif"
+        )
@@ -7,6 +7,7 @@ import multiprocessing
 import os
 from contextlib import nullcontext
 
+import numpy as np
 import pytest
 
 from mne.parallel import parallel_func
@@ -51,3 +52,48 @@ def test_parallel_func(n_jobs):
     with ctx:
         parallel, p_fun, got_jobs = parallel_func(fun, n_jobs, verbose="debug")
     assert got_jobs == want_jobs
+
+
+def _sum_writeable(x, y):
+    return x.sum() + y, x.flags.writeable
+
+
+def test_parallel_func_shared_memory(monkeypatch):
+    """Test the shared memory backend."""
+    from mne import parallel
+
+    if os.getenv("MNE_FORCE_SERIAL", "").lower() in ("true", "1"):
+        pytest.skip("MNE_FORCE_SERIAL cannot be set")
+    monkeypatch.setenv("MNE_PARALLEL_BACKEND", "shared_memory")
+    x = np.arange(10000.0)
+    try:
+        par, p_fun, n_jobs = parallel_func(_sum_writeable, 2, max_nbytes="1K")
+        assert isinstance(par, parallel._SharedMemoryParallel)
+        assert n_jobs == 2
+        out = par(p_fun(x, y) for y in range(4))
+        assert out == [(x.sum() + y, False) for y in range(4)]
+        executor = parallel._pool["executor"]
+        # small arrays are pickled, and the pool is reused
+        par, p_fun, _ = parallel_func(_sum_writeable, 2, max_nbytes=None)
+        assert par(p_fun(x, y=1) for _ in range(2)) == [(x.sum() + 1, True)] * 2
+        assert parallel._pool["executor"] is executor
+        # a progress bar can be used
+        par, p_fun, _ = parallel_func(_sum_writeable, 2, total=2)
+        assert len(par(p_fun(x, y) for y in range(2))) == 2
+    finally:
+        parallel._shutdown_pool()
+    assert parallel._pool["executor"] is None
+
+    # threads and unpicklable functions use joblib
+    pytest.importorskip("joblib")
+    par, _, _ = parallel_func(_sum_writeable, 2, prefer="threads")
+    assert not isinstance(par, parallel._SharedMemoryParallel)
+    par, _, _ = parallel_func(lambda x: x, 2)
+    assert not isinstance(par, parallel._SharedMemoryParallel)
+    monkeypatch.setenv("MNE_PARALLEL_BACKEND", "foo")
+    with pytest.raises(ValueError, match="Invalid value for the 'MNE_PARALLEL"):
+        parallel_func(_sum_writeable, 2)
+    # a single job reads no config and pickles nothing
+    monkeypatch.setattr(parallel, "get_config", None)
+    monkeypatch.setattr(parallel, "_picklable", None)
+    assert parallel_func(_sum_writeable, 1)[2] == 1
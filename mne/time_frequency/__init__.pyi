@@ -4,6 +4,7 @@ __all__ = [
     "EpochsSpectrum",
     "EpochsSpectrumArray",
     "EpochsTFR",
+    "Spectrogram",
     "Spectrum",
     "SpectrumArray",
     "_BaseTFR",
@@ -30,6 +31,7 @@ __all__ = [
     "tfr_array_morlet",
     "tfr_array_multitaper",
     "tfr_array_stockwell",
+    "tfr_average",
     "tfr_morlet",
     "tfr_multitaper",
     "tfr_stockwell",
@@ -55,6 +57,7 @@ from .psd import psd_array_welch
 from .spectrum import (
     EpochsSpectrum,
     EpochsSpectrumArray,
+    Spectrogram,
     Spectrum,
     SpectrumArray,
     read_spectrum,
@@ -67,6 +70,7 @@ from .tfr import (
     morlet,
     read_tfrs,
     tfr_array_morlet,
+    tfr_average,
     tfr_morlet,
     tfr_multitaper,
     write_tfrs,
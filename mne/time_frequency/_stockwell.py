@@ -13,7 +13,7 @@ from scipy.fft import fft, fftfreq, ifft
 from .._fiff.pick import _pick_data_channels, pick_info
 from ..parallel import parallel_func
 from ..utils import _validate_type, fill_doc, logger, verbose
-from .tfr import AverageTFR, _get_data
+from .tfr import AverageTFR, _check_tfr_dtype, _get_data
 
 
 def _check_input_st(x_in, n_fft):
@@ -51,18 +51,13 @@ def _precompute_st_windows(n_samp, start_f, stop_f, sfreq, width):
     tw = np.r_[tw[:1], tw[1:][::-1]]
 
     k = width  # 1 for classical stowckwell transform
-    f_range = np.arange(start_f, stop_f, 1)
-    windows = np.empty((len(f_range), len(tw)), dtype=np.complex128)
-    for i_f, f in enumerate(f_range):
-        if f == 0.0:
-            window = np.ones(len(tw))
-        else:
-            window = (f / (np.sqrt(2.0 * np.pi) * k)) * np.exp(
-                -0.5 * (1.0 / k**2.0) * (f**2.0) * tw**2.0
-            )
-        window /= window.sum()  # normalisation
-        windows[i_f] = fft(window)
-    return windows
+    f_range = np.arange(start_f, stop_f, 1.0)[:, np.newaxis]
+    windows = (f_range / (np.sqrt(2.0 * np.pi) * k)) * np.exp(
+        -0.5 * (1.0 / k**2.0) * (f_range**2.0) * tw**2.0
+    )
+    windows[f_range[:, 0] == 0.0] = 1.0
+    windows /= windows.sum(axis=-1, keepdims=True)  # normalisation
+    return fft(windows, axis=-1)
 
 
 def _st(x, start_f, windows):
@@ -80,29 +75,60 @@ def _st(x, start_f, windows):
     return ST
 
 
-def _st_power_itc(x, start_f, compute_itc, zero_pad, decim, W):
-    """Aux function."""
-    n_samp = x.shape[-1]
+# Maximum number of complex values transformed by one batched inverse FFT
+_ST_BLOCK_SIZE = 2**17
+
+
+def _st_power_itc(x, start_f, compute_itc, zero_pad, decim, W, dtype=np.float64):
+    """Compute the power and ITC of signals averaged over the first axis.
+
+    ``x`` has shape (n_epochs, ..., n_samp) and the outputs have shape
+    (..., n_freqs, n_out). All frequencies of a block of signals are obtained
+    with a single inverse FFT.
+    """
+    dtype = np.dtype(dtype)
+    complex_dtype = np.result_type(dtype, np.complex64)
+    n_epochs, n_samp = x.shape[0], x.shape[-1]
+    sig_shape = x.shape[1:-1]
+    x = x.reshape(n_epochs, int(np.prod(sig_shape)), n_samp)
+    n_sig, n_freq = x.shape[1], len(W)
     n_out = n_samp - zero_pad
     n_out = n_out // decim + bool(n_out % decim)
-    psd = np.empty((len(W), n_out))
+    # Decimating in time is aliasing in frequency: when possible, fold the
+    # spectrum and take a shorter inverse FFT instead of discarding samples
+    fold = decim > 1 and n_samp % decim == 0
+    psd = np.empty((n_sig, n_freq, n_out), dtype)
     itc = np.empty_like(psd) if compute_itc else None
-    X = fft(x)
+    W = W.astype(complex_dtype, copy=False)
+    X = fft(x.astype(dtype, copy=False), axis=-1)
     XX = np.concatenate([X, X], axis=-1)
-    for i_f, window in enumerate(W):
-        f = start_f + i_f
-        ST = ifft(XX[:, f : f + n_samp] * window)
-        if zero_pad > 0:
-            TFR = ST[:, :-zero_pad:decim]
-        else:
-            TFR = ST[:, ::decim]
-        TFR_abs = np.abs(TFR)
-        TFR_abs[TFR_abs == 0] = 1.0
-        if compute_itc:
-            TFR /= TFR_abs
-            itc[i_f] = np.abs(np.mean(TFR, axis=0))
-        TFR_abs *= TFR_abs
-        psd[i_f] = np.mean(TFR_abs, axis=0)
+    # XX[..., f, :] is XX[..., f : f + n_samp], without copying
+    XX = np.lib.stride_tricks.sliding_window_view(XX, n_samp, axis=-1)
+    sig_step = max(min(_ST_BLOCK_SIZE // (n_epochs * n_samp), n_sig), 1)
+    freq_step = max(_ST_BLOCK_SIZE // (n_epochs * sig_step * n_samp), 1)
+    for s_start in range(0, n_sig, sig_step):
+        sig_sl = slice(s_start, s_start + sig_step)
+        for f_start in range(0, n_freq, freq_step):
+            freq_sl = slice(f_start, f_start + freq_step)
+            f_stop = min(f_start + freq_step, n_freq)
+            ST = XX[:, sig_sl, start_f + f_start : start_f + f_stop] * W[freq_sl]
+            if fold:
+                ST = ST.reshape(ST.shape[:-1] + (decim, n_samp // decim))
+                TFR = ifft(ST.sum(axis=-2), axis=-1, overwrite_x=True)[..., :n_out]
+                TFR /= decim
+            else:
+                TFR = ifft(ST, axis=-1, overwrite_x=True)
+                TFR = TFR[..., : n_samp - zero_pad : decim]
+            TFR_abs = np.abs(TFR)
+            TFR_abs[TFR_abs == 0] = 1.0
+            if compute_itc:
+                TFR *= np.reciprocal(TFR_abs)  # cheaper than a complex division
+                itc[sig_sl, freq_sl] = np.abs(np.mean(TFR, axis=0))
+            TFR_abs *= TFR_abs
+            psd[sig_sl, freq_sl] = np.mean(TFR_abs, axis=0)
+    psd = psd.reshape(sig_shape + psd.shape[1:])
+    if compute_itc:
+        itc = itc.reshape(psd.shape)
     return psd, itc
 
 
@@ -117,6 +143,8 @@ def tfr_array_stockwell(
     decim=1,
     return_itc=False,
     n_jobs=None,
+    *,
+    dtype="float64",
 ):
     """Compute power and intertrial coherence using Stockwell (S) transform.
 
@@ -149,6 +177,7 @@ def tfr_array_stockwell(
     return_itc : bool
         Return intertrial coherence (ITC) as well as averaged power.
     %(n_jobs)s
+    %(dtype_tfr)s
 
     Returns
     -------
@@ -168,6 +197,12 @@ def tfr_array_stockwell(
     mne.time_frequency.tfr_morlet
     mne.time_frequency.tfr_array_morlet
 
+    Notes
+    -----
+    Power and ITC are computed for blocks of channels in parallel. Within a
+    block, all frequencies of a group of signals are obtained with a single
+    batched inverse FFT, with groups sized to bound memory usage.
+
     References
     ----------
     .. footbibliography::
@@ -178,8 +213,7 @@ def tfr_array_stockwell(
             "data must be 3D with shape (n_epochs, n_channels, n_times), "
             f"got {data.shape}"
         )
-    n_epochs, n_channels = data.shape[:2]
-    n_out = data.shape[2] // decim + bool(data.shape[-1] % decim)
+    n_channels = data.shape[1]
     data, n_fft_, zero_pad = _check_input_st(data, n_fft)
 
     freqs = fftfreq(n_fft_, 1.0 / sfreq)
@@ -192,20 +226,17 @@ def tfr_array_stockwell(
     stop_f = np.abs(freqs - fmax).argmin()
     freqs = freqs[start_f:stop_f]
 
+    dtype = _check_tfr_dtype(dtype)[0]
     W = _precompute_st_windows(data.shape[-1], start_f, stop_f, sfreq, width)
-    n_freq = stop_f - start_f
-    psd = np.empty((n_channels, n_freq, n_out))
-    itc = np.empty((n_channels, n_freq, n_out)) if return_itc else None
-
     parallel, my_st, n_jobs = parallel_func(_st_power_itc, n_jobs)
+    n_blocks = max(min(n_jobs, n_channels), 1)
     tfrs = parallel(
-        my_st(data[:, c, :], start_f, return_itc, zero_pad, decim, W)
-        for c in range(n_channels)
+        my_st(block, start_f, return_itc, zero_pad, decim, W, dtype)
+        for block in np.array_split(data, n_blocks, axis=1)
     )
-    for c, (this_psd, this_itc) in enumerate(iter(tfrs)):
-        psd[c] = this_psd
-        if this_itc is not None:
-            itc[c] = this_itc
+    psds, itcs = zip(*tfrs)
+    psd = np.concatenate(psds)
+    itc = np.concatenate(itcs) if return_itc else None
 
     return psd, itc, freqs
 
@@ -221,6 +252,8 @@ def tfr_stockwell(
     return_itc=False,
     n_jobs=None,
     verbose=None,
+    *,
+    dtype="float64",
 ):
     """Compute Time-Frequency Representation (TFR) using Stockwell Transform.
 
@@ -253,6 +286,7 @@ def tfr_stockwell(
     n_jobs : int
         The number of jobs to run in parallel (over channels).
     %(verbose)s
+    %(dtype_tfr)s
 
     Returns
     -------
@@ -292,6 +326,7 @@ def tfr_stockwell(
         decim=decim,
         return_itc=return_itc,
         n_jobs=n_jobs,
+        dtype=dtype,
     )
     times = inst.times[::decim].copy()
     nave = len(data)
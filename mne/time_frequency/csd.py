@@ -10,6 +10,7 @@ import numbers
 
 import numpy as np
 from scipy.fft import rfftfreq
+from scipy.linalg import get_blas_funcs
 
 from .._fiff.pick import _picks_to_idx, pick_channels
 from ..parallel import parallel_func
@@ -30,7 +31,7 @@ from ..utils import (
     warn,
 )
 from ..viz.misc import plot_csd
-from .tfr import EpochsTFR, _cwt_array, _get_nfft, morlet
+from .tfr import EpochsTFR, _check_wavelet_length, _cwt_array, morlet
 
 
 @verbose
@@ -1066,15 +1067,11 @@ def csd_morlet(
     Parameters
     ----------
     epochs : instance of Epochs
-        The epochs to compute the CSD for.
+        The epochs to compute the CSD for. If they are not preloaded, they are
+        read a few at a time.
     frequencies : list of float
         The frequencies of interest, in Hertz.
-    tmin : float | None
-        Minimum time instant to consider, in seconds. If ``None`` start at
-        first sample.
-    tmax : float | None
-        Maximum time instant to consider, in seconds. If ``None`` end at last
-        sample.
+    %(tmin_tmax_csd_morlet)s
     %(picks_good_data_noref)s
     n_cycles : float | list of float | None
         Number of cycles to use when constructing Morlet wavelets. Fixed number
@@ -1097,8 +1094,9 @@ def csd_morlet(
 
     Returns
     -------
-    csd : instance of CrossSpectralDensity
-        The computed cross-spectral density.
+    csd : instance of CrossSpectralDensity | list of CrossSpectralDensity
+        The computed cross-spectral density, or one per time window if
+        ``tmin`` or ``tmax`` are array-like.
 
     See Also
     --------
@@ -1108,21 +1106,30 @@ def csd_morlet(
     csd_fourier
     csd_multitaper
     """
-    epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
-    return csd_array_morlet(
-        epochs.get_data(copy=False),
+    if epochs.preload:
+        epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
+        X, picks = epochs.get_data(copy=False), None
+        ch_names = epochs.ch_names
+    else:  # the epochs will be read a few at a time
+        _check_csd_epochs(epochs, tmin, tmax)
+        X, picks = epochs, _picks_to_idx(epochs.info, picks, "data", with_ref_meg=False)
+        ch_names = [epochs.ch_names[pick] for pick in picks]
+        if projs is None:
+            projs = epochs.info["projs"]
+    return _csd_array_morlet(
+        X,
         sfreq=epochs.info["sfreq"],
         frequencies=frequencies,
         t0=epochs.tmin,
         tmin=tmin,
         tmax=tmax,
-        ch_names=epochs.ch_names,
+        ch_names=ch_names,
         n_cycles=n_cycles,
         use_fft=use_fft,
         decim=decim,
         projs=projs,
         n_jobs=n_jobs,
-        verbose=verbose,
+        picks=picks,
     )
 
 
@@ -1157,12 +1164,7 @@ def csd_array_morlet(
     t0 : float
         Time of the first sample relative to the onset of the epoch, in
         seconds. Defaults to 0.
-    tmin : float | None
-        Minimum time instant to consider, in seconds. If ``None`` start at
-        first sample.
-    tmax : float | None
-        Maximum time instant to consider, in seconds. If ``None`` end at last
-        sample.
+    %(tmin_tmax_csd_morlet)s
     ch_names : list of str | None
         A name for each time series. If ``None`` (the default), the series will
         be named 'SERIES###'.
@@ -1198,45 +1200,159 @@ def csd_array_morlet(
     csd_morlet
     csd_multitaper
     """
-    X, times, tmin, tmax, _, _ = _prepare_csd_array(X, sfreq, t0, tmin, tmax)
-    n_times = len(times)
+    X = _check_csd_array(X)
+    return _csd_array_morlet(
+        X,
+        sfreq,
+        frequencies,
+        t0,
+        tmin,
+        tmax,
+        ch_names,
+        n_cycles,
+        use_fft,
+        decim,
+        projs,
+        n_jobs,
+    )
+
+
+# Number of complex values of the wavelet transforms of a batch of epochs
+# kept in memory at once to compute Morlet CSDs (256 MB)
+_CSD_BLOCK_SIZE = 2**24
+
+
+def _csd_array_morlet(
+    X,
+    sfreq,
+    frequencies,
+    t0,
+    tmin,
+    tmax,
+    ch_names,
+    n_cycles,
+    use_fft,
+    decim,
+    projs,
+    n_jobs,
+    picks=None,
+):
+    """Compute Morlet CSDs of an array or of the picks of (not preloaded) epochs."""
+    from ..epochs import BaseEpochs
+
+    n_channels, n_times = (
+        (len(picks), len(X.times)) if isinstance(X, BaseEpochs) else X.shape[1:]
+    )
+    times = np.arange(n_times) * (1.0 / sfreq) + t0
+
+    # Check the time windows
+    multiple = np.ndim(tmin) > 0 or np.ndim(tmax) > 0
+    tmin, tmax = np.array(
+        [
+            _check_csd_times(times, sfreq, this_tmin, this_tmax)
+            for this_tmin, this_tmax in _csd_windows(tmin, tmax)
+        ]
+    ).T
 
     # Construct the appropriate Morlet wavelets
     wavelets = morlet(sfreq, frequencies, n_cycles)
 
-    # Slice X to the requested time window + half the length of the longest
+    # Slice X to the requested time windows + half the length of the longest
     # wavelet.
     wave_length = len(wavelets[np.argmin(frequencies)]) // 2
-    tstart = tstop = None
-    if tmin is not None:
-        tstart = np.searchsorted(times, tmin)
-        tstart = max(0, tstart - wave_length)
-    if tmax is not None:
-        tstop = np.searchsorted(times, tmax)
-        tstop = min(n_times, tstop + wave_length)
-    X = X[:, :, tstart:tstop]
+    tstart = max(0, np.searchsorted(times, tmin.min()) - wave_length)
+    tstop = min(n_times, np.searchsorted(times, tmax.max()) + wave_length)
     times = times[tstart:tstop]
 
-    # After CSD computation, we slice again to the requested time window.
-    csd_tstart = None if tmin is None else np.searchsorted(times, tmin - 1e-10)
-    csd_tstop = None if tmax is None else np.searchsorted(times, tmax + 1e-10)
-    csd_tslice = slice(csd_tstart, csd_tstop)
-    times = times[csd_tslice]
+    # After CSD computation, we slice again to the requested time windows.
+    csd_tslices = [
+        slice(
+            np.searchsorted(times, this_tmin - 1e-10),
+            np.searchsorted(times, this_tmax + 1e-10),
+        )
+        for this_tmin, this_tmax in zip(tmin, tmax)
+    ]
 
-    # Compute the CSD
-    nfft = _get_nfft(wavelets, X, use_fft)
-    return _execute_csd_function(
-        X,
-        times,
-        frequencies,
-        _csd_morlet,
-        params=[sfreq, wavelets, nfft, csd_tslice, use_fft, decim],
-        n_fft=1,
-        ch_names=ch_names,
-        projs=projs,
-        n_jobs=n_jobs,
-        verbose=verbose,
+    # Compute the CSD, with epochs (and frequencies) in batches whose wavelet
+    # transforms fit in _CSD_BLOCK_SIZE values
+    _check_wavelet_length(wavelets, len(times), use_fft)
+    logger.info("Computing cross-spectral density from epochs...")
+    parallel, my_csd, n_jobs = parallel_func(
+        _csd_morlet, n_jobs, max_jobs=len(wavelets), prefer="threads"
+    )
+    n_batch = max(_CSD_BLOCK_SIZE // (n_channels * len(times)), 1)
+    n_freq_batch = max(_CSD_BLOCK_SIZE // (n_batch * n_channels * len(times)), 1)
+    n_freq_batches = max(int(np.ceil(len(wavelets) / n_freq_batch)), n_jobs)
+    freq_batches = np.array_split(np.arange(len(wavelets)), n_freq_batches)
+    csds = np.zeros(
+        (len(csd_tslices), n_channels * (n_channels + 1) // 2, len(wavelets)),
+        dtype=np.complex128,
     )
+    n_epochs = 0
+    for data in _iter_csd_batches(X, n_batch, picks):
+        data = data[:, :, tstart:tstop]
+        n_epochs += len(data)
+        out = parallel(
+            my_csd(
+                data, sfreq, [wavelets[ii] for ii in idx], csd_tslices, use_fft, decim
+            )
+            for idx in freq_batches
+        )
+        for idx, this_csds in zip(freq_batches, out):
+            csds[..., idx] += this_csds
+    csds /= n_epochs
+    logger.info("[done]")
+
+    if ch_names is None:
+        ch_names = ["SERIES%03d" % (i + 1) for i in range(n_channels)]
+    out = [
+        CrossSpectralDensity(
+            this_csds,
+            ch_names=ch_names,
+            tmin=times[tslice][0],
+            tmax=times[tslice][-1],
+            frequencies=frequencies,
+            n_fft=1,
+            projs=projs,
+        )
+        for this_csds, tslice in zip(csds, csd_tslices)
+    ]
+    return out if multiple else out[0]
+
+
+def _csd_windows(tmin, tmax):
+    """Get the (tmin, tmax) pairs of one or several time windows."""
+    tmin, tmax = (
+        np.atleast_1d(np.array(t, dtype=object)).tolist() for t in (tmin, tmax)
+    )
+    if len(tmin) == 1:
+        tmin = tmin * len(tmax)
+    if len(tmax) == 1:
+        tmax = tmax * len(tmin)
+    if len(tmin) != len(tmax):
+        raise ValueError(
+            "tmin and tmax must have the same number of time windows, got "
+            f"{len(tmin)} and {len(tmax)}"
+        )
+    return list(zip(tmin, tmax))
+
+
+def _iter_csd_batches(X, n_batch, picks):
+    """Iterate over batches of the data of an array or of epochs."""
+    from ..epochs import BaseEpochs
+
+    if not isinstance(X, BaseEpochs):
+        for start in ProgressBar(range(0, len(X), n_batch), mesg="CSD epoch blocks"):
+            yield X[start : start + n_batch]
+        return
+    batch = list()
+    for data in X:
+        batch.append(data[picks])
+        if len(batch) == n_batch:
+            yield np.array(batch)
+            batch.clear()
+    if len(batch):
+        yield np.array(batch)
 
 
 def _prepare_csd(epochs, tmin=None, tmax=None, picks=None, projs=None):
@@ -1244,20 +1360,7 @@ def _prepare_csd(epochs, tmin=None, tmax=None, picks=None, projs=None):
 
     See the csd_* functions for documentation of the parameters.
     """
-    tstep = epochs.times[1] - epochs.times[0]
-    if tmin is not None and tmin < epochs.times[0] - tstep:
-        raise ValueError("tmin should be larger than the smallest data time " "point")
-    if tmax is not None and tmax > epochs.times[-1] + tstep:
-        raise ValueError("tmax should be smaller than the largest data time " "point")
-    if tmax is not None and tmin is not None:
-        if tmax < tmin:
-            raise ValueError("tmax must be larger than tmin")
-    if epochs.baseline is None and epochs.info["highpass"] < 0.1:
-        warn(
-            "Epochs are not baseline corrected or enough highpass filtered. "
-            "Cross-spectral density may be inaccurate."
-        )
-
+    _check_csd_epochs(epochs, tmin, tmax)
     picks = _picks_to_idx(epochs.info, picks, "data", with_ref_meg=False)
     epochs = epochs.copy().pick(picks)
 
@@ -1267,20 +1370,55 @@ def _prepare_csd(epochs, tmin=None, tmax=None, picks=None, projs=None):
     return epochs, projs
 
 
+def _check_csd_epochs(epochs, tmin, tmax):
+    """Check the time windows of csd_* functions on epochs."""
+    tstep = epochs.times[1] - epochs.times[0]
+    for tmin, tmax in _csd_windows(tmin, tmax):
+        if tmin is not None and tmin < epochs.times[0] - tstep:
+            raise ValueError(
+                "tmin should be larger than the smallest data time " "point"
+            )
+        if tmax is not None and tmax > epochs.times[-1] + tstep:
+            raise ValueError(
+                "tmax should be smaller than the largest data time " "point"
+            )
+        if tmax is not None and tmin is not None:
+            if tmax < tmin:
+                raise ValueError("tmax must be larger than tmin")
+    if epochs.baseline is None and epochs.info["highpass"] < 0.1:
+        warn(
+            "Epochs are not baseline corrected or enough highpass filtered. "
+            "Cross-spectral density may be inaccurate."
+        )
+
+
 def _prepare_csd_array(X, sfreq, t0, tmin, tmax, fmin=None, fmax=None):
     """Do some checking and preprocessing of common csd_r=array_* parameters.
 
     See the csd_array_* functions for documentation of the parameters.
     """
+    X = _check_csd_array(X)
+    times = np.arange(X.shape[2]) * (1.0 / sfreq) + t0
+    tmin, tmax = _check_csd_times(times, sfreq, tmin, tmax)
+
+    # Check fmin and fmax
+    if fmax is not None and fmin is not None and fmax <= fmin:
+        raise ValueError("fmax must be larger than fmin")
+
+    return X, times, tmin, tmax, fmin, fmax
+
+
+def _check_csd_array(X):
+    """Check the data array of the csd_array_* functions."""
     X = np.asarray(X, dtype=float)
     if X.ndim != 3:
         raise ValueError("X must be n_epochs x n_channels x n_times.")
+    return X
 
-    n_times = X.shape[2]
-    tstep = 1.0 / sfreq
-    times = np.arange(n_times) * tstep + t0
 
-    # Check tmin and tmax
+def _check_csd_times(times, sfreq, tmin, tmax):
+    """Check tmin and tmax, replacing None by the first or last time point."""
+    tstep = 1.0 / sfreq
     if tmax is None:
         tmax = times.max()
     if tmin is None:
@@ -1291,12 +1429,7 @@ def _prepare_csd_array(X, sfreq, t0, tmin, tmax, fmin=None, fmax=None):
         raise ValueError("tmin should be larger than the smallest data time " "point")
     if tmax > times[-1] + tstep:
         raise ValueError("tmax should be smaller than the largest data time " "point")
-
-    # Check fmin and fmax
-    if fmax is not None and fmin is not None and fmax <= fmin:
-        raise ValueError("fmax must be larger than fmin")
-
-    return X, times, tmin, tmax, fmin, fmax
+    return tmin, tmax
 
 
 @verbose
@@ -1474,14 +1607,14 @@ def _csd_multitaper(
     return csds
 
 
-def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1):
+def _csd_morlet(data, sfreq, wavelets, tslices, use_fft=True, decim=1):
     """Compute cross spectral density (CSD) using the given Morlet wavelets.
 
-    Computes the CSD for a single epoch of data.
+    Computes the sum of the CSDs of a batch of epochs.
 
     Parameters
     ----------
-    data : ndarray, shape (n_channels, n_times)
+    data : ndarray, shape (n_epochs, n_channels, n_times)
         The time series data consisting of n_channels time-series of length
         n_times.
     sfreq : float
@@ -1489,11 +1622,8 @@ def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1)
     wavelets : list of ndarray
         The Morlet wavelets for which to compute the CSD's. These have been
         created by the `mne.time_frequency.tfr.morlet` function.
-    nfft : int
-        The number of FFT points.
-    tslice : slice | None
-        The desired time samples to compute the CSD over. If None, defaults to
-        including all time samples.
+    tslices : list of slice
+        The time samples to compute the CSD over, for each time window.
     use_fft : bool
         Whether to use FFT-based convolution to compute the wavelet transform.
         Defaults to True.
@@ -1507,31 +1637,38 @@ def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1)
 
     Returns
     -------
-    csd : ndarray, shape ((n_channels**2 + n_channels) / 2 , n_wavelets)
-        For each wavelet, the upper triangle of the cross spectral density
-        matrix.
+    csd : ndarray, shape (n_windows, (n_channels**2 + n_channels) / 2 , n_wavelets)
+        For each time window and wavelet, the upper triangle of the sum over
+        epochs of the cross spectral density matrices.
 
     See Also
     --------
     _vector_to_sym_mat : For converting the CSD to a full matrix.
     """
-    # Compute PSD
-    psds = _cwt_array(data, wavelets, nfft, mode="same", use_fft=use_fft, decim=decim)
-
-    if tslice is not None:
+    n_epochs, n_channels, n_times = data.shape
+    psds = _cwt_array(
+        data.reshape(-1, n_times), wavelets, mode="same", use_fft=use_fft, decim=decim
+    )
+    psds = psds.reshape(n_epochs, n_channels, len(wavelets), -1)
+
+    # Compute the spectral density between all pairs of series: with the
+    # epochs and time samples of each wavelet transform concatenated in X,
+    # the upper triangle of X @ X^H is obtained with a Hermitian rank-k update
+    # (X^T is passed so that no copy to Fortran order is needed, which
+    # conjugates the result)
+    triu = np.triu_indices(n_channels)
+    csds = np.empty((len(tslices), len(triu[0]), len(wavelets)), np.complex128)
+    herk = get_blas_funcs("herk", (psds,))
+    for ti, tslice in enumerate(tslices):
         tstart = None if tslice.start is None else tslice.start // decim
         tstop = None if tslice.stop is None else tslice.stop // decim
         tstep = None if tslice.step is None else tslice.step // decim
-        tslice = slice(tstart, tstop, tstep)
-        psds = psds[:, :, tslice]
-
-    psds_conj = np.conj(psds)
-
-    # Compute the spectral density between all pairs of series
-    n_channels = data.shape[0]
-    csds = np.vstack(
-        [np.mean(psds[[i]] * psds_conj[i:], axis=2) for i in range(n_channels)]
-    )
+        this_psds = psds[..., slice(tstart, tstop, tstep)]
+        for fi in range(len(wavelets)):
+            x = this_psds[:, :, fi].transpose(1, 0, 2).reshape(n_channels, -1)
+            # mean over time of each epoch
+            csd = herk(1.0 / this_psds.shape[-1], x.T, trans=2)
+            csds[ti, :, fi] = csd[triu].conj()
 
     # Scaling by sampling frequency for compatibility with Matlab
     csds /= sfreq
@@ -12,7 +12,7 @@ from scipy.signal import get_window
 from scipy.signal.windows import dpss as sp_dpss
 
 from ..parallel import parallel_func
-from ..utils import _check_option, logger, verbose, warn
+from ..utils import _check_option, _custom_lru_cache, logger, verbose, warn
 
 
 def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
@@ -60,22 +60,38 @@ def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
     -----
     Tridiagonal form of DPSS calculation from :footcite:`Slepian1978`.
 
+    The last 50 sets of tapers are cached in memory and reused by later calls
+    with the same parameters. Use :func:`mne.utils.clear_caches` to free them.
+
     References
     ----------
     .. footbibliography::
     """
-    dpss, eigvals = sp_dpss(N, half_nbw, Kmax, sym=sym, norm=norm, return_ratios=True)
+    dpss, eigvals = _dpss(N, half_nbw, Kmax, sym, norm)
+    idx = np.ones(len(eigvals), bool)
     if low_bias:
         idx = eigvals > 0.9
         if not idx.any():
             warn("Could not properly use low_bias, keeping lowest-bias taper")
             idx = [np.argmax(eigvals)]
-        dpss, eigvals = dpss[idx], eigvals[idx]
+    dpss, eigvals = dpss[idx], eigvals[idx]  # copies of the cached arrays
     assert len(dpss) > 0  # should never happen
     assert dpss.shape[1] == N  # old nitime bug
     return dpss, eigvals
 
 
+@_custom_lru_cache(50)
+def _dpss(N, half_nbw, Kmax, sym, norm):
+    dpss, eigvals = sp_dpss(N, half_nbw, Kmax, sym=sym, norm=norm, return_ratios=True)
+    dpss.flags.writeable = False
+    eigvals.flags.writeable = False
+    return dpss, eigvals
+
+
+# Number of signals times frequencies whose adaptive weights are iterated at once
+_MT_ADAPTIVE_BLOCK_SIZE = 2**14
+
+
 def _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, max_iter=250, return_weights=False):
     r"""Use iterative procedure to compute the PSD from tapered spectra.
 
@@ -116,68 +132,40 @@ def _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, max_iter=250, return_weights
 
     rt_eig = np.sqrt(eigvals)
 
+    # tapered power spectra
+    s_k = x_mt.real**2 + x_mt.imag**2
+    eigvals = eigvals.astype(s_k.dtype)
+    rt_eig = rt_eig.astype(s_k.dtype)
+
     # estimate the variance from an estimate with fixed weights
-    psd_est = _psd_from_mt(x_mt, rt_eig[np.newaxis, :, np.newaxis])
+    psd_est = 2 * (eigvals @ s_k) / eigvals.sum()
     x_var = trapezoid(psd_est, dx=np.pi / n_freqs) / (2 * np.pi)
     del psd_est
 
     # allocate space for output
-    psd = np.empty((n_signals, np.sum(freq_mask)))
-
-    # only keep the frequencies of interest
-    x_mt = x_mt[:, :, freq_mask]
-
-    if return_weights:
-        weights = np.empty((n_signals, n_tapers, psd.shape[1]))
-
-    for i, (xk, var) in enumerate(zip(x_mt, x_var)):
-        # combine the SDFs in the traditional way in order to estimate
-        # the variance of the timeseries
-
-        # The process is to iteratively switch solving for the following
-        # two expressions:
-        # (1) Adaptive Multitaper SDF:
-        # S^{mt}(f) = [ sum |d_k(f)|^2 S_k(f) ]/ sum |d_k(f)|^2
-        #
-        # (2) Weights
-        # d_k(f) = [sqrt(lam_k) S^{mt}(f)] / [lam_k S^{mt}(f) + E{B_k(f)}]
-        #
-        # Where lam_k are the eigenvalues corresponding to the DPSS tapers,
-        # and the expected value of the broadband bias function
-        # E{B_k(f)} is replaced by its full-band integration
-        # (1/2pi) int_{-pi}^{pi} E{B_k(f)} = sig^2(1-lam_k)
-
-        # start with an estimate from incomplete data--the first 2 tapers
-        psd_iter = _psd_from_mt(xk[:2, :], rt_eig[:2, np.newaxis])
-
-        err = np.zeros_like(xk)
-        for n in range(max_iter):
-            d_k = psd_iter / (
-                eigvals[:, np.newaxis] * psd_iter + (1 - eigvals[:, np.newaxis]) * var
-            )
-            d_k *= rt_eig[:, np.newaxis]
-            # Test for convergence -- this is overly conservative, since
-            # iteration only stops when all frequencies have converged.
-            # A better approach is to iterate separately for each freq, but
-            # that is a nonvectorized algorithm.
-            # Take the RMS difference in weights from the previous iterate
-            # across frequencies. If the maximum RMS error across freqs is
-            # less than 1e-10, then we're converged
-            err -= d_k
-            if np.max(np.mean(err**2, axis=0)) < 1e-10:
-                break
-
-            # update the iterative estimate with this d_k
-            psd_iter = _psd_from_mt(xk, d_k)
-            err = d_k
-
-        if n == max_iter - 1:
-            warn("Iterative multi-taper PSD computation did not converge.")
-
-        psd[i, :] = psd_iter
-
-        if return_weights:
-            weights[i, :, :] = d_k
+    n_freqs = np.sum(freq_mask)
+    psd = np.empty((n_signals, n_freqs), s_k.dtype)
+    weights = np.empty((n_signals, n_tapers, n_freqs), s_k.dtype)
+
+    # iterate over blocks of signals small enough to stay in the CPU cache,
+    # with all their frequencies of interest at once
+    converged = True
+    n_block = max(_MT_ADAPTIVE_BLOCK_SIZE // n_freqs, 1)
+    for start in range(0, n_signals, n_block):
+        sl = slice(start, start + n_block)
+        s_k_block = s_k[sl][:, :, freq_mask].transpose(1, 0, 2).reshape(n_tapers, -1)
+        psd_block, weights_block, block_converged = _adaptive_weights(
+            s_k_block,
+            np.repeat(x_var[sl], n_freqs),
+            eigvals[:, np.newaxis],
+            rt_eig[:, np.newaxis],
+            max_iter,
+        )
+        psd[sl] = psd_block.reshape(-1, n_freqs)
+        weights[sl] = weights_block.reshape(n_tapers, -1, n_freqs).transpose(1, 0, 2)
+        converged &= block_converged
+    if not converged:
+        warn("Iterative multi-taper PSD computation did not converge.")
 
     if return_weights:
         return psd, weights
@@ -185,6 +173,61 @@ def _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, max_iter=250, return_weights
         return psd
 
 
+def _adaptive_weights(s_k, x_var, eigvals, rt_eig, max_iter):
+    """Compute the adaptive PSD and weights of (n_tapers, n_elements) spectra.
+
+    Also returns whether all elements converged.
+    """
+    # combine the SDFs in the traditional way in order to estimate
+    # the variance of the timeseries
+
+    # The process is to iteratively switch solving for the following
+    # two expressions:
+    # (1) Adaptive Multitaper SDF:
+    # S^{mt}(f) = [ sum |d_k(f)|^2 S_k(f) ]/ sum |d_k(f)|^2
+    #
+    # (2) Weights
+    # d_k(f) = [sqrt(lam_k) S^{mt}(f)] / [lam_k S^{mt}(f) + E{B_k(f)}]
+    #
+    # Where lam_k are the eigenvalues corresponding to the DPSS tapers,
+    # and the expected value of the broadband bias function
+    # E{B_k(f)} is replaced by its full-band integration
+    # (1/2pi) int_{-pi}^{pi} E{B_k(f)} = sig^2(1-lam_k)
+
+    # start with an estimate from incomplete data--the first 2 tapers
+    psd_iter = 2 * (eigvals[:2] * s_k[:2]).sum(axis=0) / eigvals[:2].sum()
+
+    psd = np.empty_like(psd_iter)
+    weights = np.empty_like(s_k)
+
+    # elements still iterating
+    idx = np.arange(len(psd))
+    err = np.zeros_like(s_k)
+    for _ in range(max_iter):
+        d_k = psd_iter / (eigvals * psd_iter + (1 - eigvals) * x_var)
+        d_k *= rt_eig
+        # Test for convergence of each signal and frequency separately: take
+        # the RMS difference in weights from the previous iterate, if it is
+        # less than 1e-5, the element is converged and stops iterating
+        err -= d_k
+        converged = np.mean(err**2, axis=0) < 1e-10
+        if converged.any():
+            psd[idx[converged]] = psd_iter[converged]
+            weights[:, idx[converged]] = d_k[:, converged]
+            keep = ~converged
+            idx, s_k, x_var, d_k = idx[keep], s_k[:, keep], x_var[keep], d_k[:, keep]
+            if not idx.size:
+                return psd, weights, True
+
+        # update the iterative estimate with this d_k
+        d_k_sq = d_k * d_k
+        psd_iter = 2 * (d_k_sq * s_k).sum(axis=0) / d_k_sq.sum(axis=0)
+        err = d_k
+    psd[idx] = psd_iter
+    weights[:, idx] = d_k
+    return psd, weights, False
+
+
 def _psd_from_mt(x_mt, weights):
     """Compute PSD from tapered spectra.
 
@@ -234,7 +277,11 @@ def _csd_from_mt(x_mt, y_mt, weights_x, weights_y):
     return csd
 
 
-def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
+# Number of tapered samples transformed at once by _mt_spectra
+_MT_BLOCK_SAMPLES = 2**22
+
+
+def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True, dtype=np.complex128):
     """Compute tapered spectra.
 
     Parameters
@@ -249,6 +296,8 @@ def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
         Length of the FFT. If None, the number of samples in the input signal
         will be used.
     %(remove_dc)s
+    dtype : dtype
+        The complex dtype of the tapered spectra.
 
     Returns
     -------
@@ -270,9 +319,16 @@ def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
     # The following is equivalent to this, but uses less memory:
     # x_mt = fftpack.fft(x[:, np.newaxis, :] * dpss, n=n_fft)
     n_tapers = dpss.shape[0] if dpss.ndim > 1 else 1
-    x_mt = np.zeros(x.shape[:-1] + (n_tapers, len(freqs)), dtype=np.complex128)
-    for idx, sig in enumerate(x):
-        x_mt[idx] = rfft(sig[..., np.newaxis, :] * dpss, n=n_fft)
+    x_mt = np.zeros(x.shape[:-1] + (n_tapers, len(freqs)), dtype=dtype)
+    # taper and transform blocks of signals at once
+    real_dtype = np.finfo(dtype).dtype
+    x_flat = x.reshape(-1, x.shape[-1]).astype(real_dtype, copy=False)
+    x_mt_flat = x_mt.reshape(-1, n_tapers, len(freqs))
+    dpss = np.atleast_2d(dpss).astype(real_dtype, copy=False)
+    n_block = max(_MT_BLOCK_SAMPLES // (n_tapers * n_fft), 1)
+    for start in range(0, len(x_flat), n_block):
+        sl = slice(start, start + n_block)
+        x_mt_flat[sl] = rfft(x_flat[sl, np.newaxis] * dpss, n=n_fft)
     # Adjust DC and maybe Nyquist, depending on one-sided transform
     x_mt[..., 0] /= np.sqrt(2.0)
     if n_fft % 2 == 0:
@@ -337,6 +393,7 @@ def psd_array_multitaper(
     n_jobs=None,
     *,
     max_iter=150,
+    dtype="float64",
     verbose=None,
 ):
     r"""Compute power spectral density (PSD) using a multi-taper method.
@@ -357,8 +414,7 @@ def psd_array_multitaper(
         together. The default value is a bandwidth of
         ``8 * (sfreq / n_times)``.
     adaptive : bool
-        Use adaptive weights to combine the tapered spectra into PSD
-        (slow, use n_jobs >> 1 to speed up computation).
+        Use adaptive weights to combine the tapered spectra into PSD.
     low_bias : bool
         Only use tapers with more than 90%% spectral concentration within
         bandwidth.
@@ -373,6 +429,7 @@ def psd_array_multitaper(
           taper.
     %(n_jobs)s
     %(max_iter_multitaper)s
+    %(dtype_tfr)s
     %(verbose)s
 
     Returns
@@ -395,13 +452,18 @@ def psd_array_multitaper(
 
     Notes
     -----
+    The DPSS tapers are cached in memory, see :func:`dpss_windows`.
+
     .. versionadded:: 0.14.0
 
     References
     ----------
     .. footbibliography::
     """
+    from .tfr import _check_tfr_dtype
+
     _check_option("normalization", normalization, ["length", "full"])
+    dtype, complex_dtype = _check_tfr_dtype(dtype)
 
     # Reshape data so its 2-D for parallelization
     ndim_in = x.ndim
@@ -414,7 +476,7 @@ def psd_array_multitaper(
         n_times, sfreq, bandwidth, low_bias, adaptive
     )
     n_tapers = len(dpss)
-    weights = np.sqrt(eigvals)[np.newaxis, :, np.newaxis]
+    weights = np.sqrt(eigvals)[np.newaxis, :, np.newaxis].astype(dtype)
 
     # decide which frequencies to keep
     freqs = rfftfreq(n_times, 1.0 / sfreq)
@@ -423,15 +485,19 @@ def psd_array_multitaper(
     n_freqs = len(freqs)
 
     if output == "complex":
-        psd = np.zeros((x.shape[0], n_tapers, n_freqs), dtype="complex")
+        psd = np.zeros((x.shape[0], n_tapers, n_freqs), dtype=complex_dtype)
     else:
-        psd = np.zeros((x.shape[0], n_freqs))
+        psd = np.zeros((x.shape[0], n_freqs), dtype=dtype)
 
     # Let's go in up to 50 MB chunks of signals to save memory
-    n_chunk = max(50000000 // (len(freq_mask) * len(eigvals) * 16), 1)
+    n_chunk = max(
+        50000000 // (len(freq_mask) * len(eigvals) * complex_dtype.itemsize), 1
+    )
     offsets = np.concatenate((np.arange(0, x.shape[0], n_chunk), [x.shape[0]]))
     for start, stop in zip(offsets[:-1], offsets[1:]):
-        x_mt = _mt_spectra(x[start:stop], dpss, sfreq, remove_dc=remove_dc)[0]
+        x_mt = _mt_spectra(
+            x[start:stop], dpss, sfreq, remove_dc=remove_dc, dtype=complex_dtype
+        )[0]
         if output == "power":
             if not adaptive:
                 psd[start:stop] = _psd_from_mt(x_mt[:, :, freq_mask], weights)
@@ -476,6 +542,7 @@ def tfr_array_multitaper(
     output="complex",
     n_jobs=None,
     *,
+    dtype="float64",
     verbose=None,
 ):
     """Compute Time-Frequency Representation (TFR) using DPSS tapers.
@@ -508,6 +575,7 @@ def tfr_array_multitaper(
         * ``'avg_power_itc'`` : average of single trial power and inter-trial
           coherence across trials.
     %(n_jobs)s
+    %(dtype_tfr)s
     %(verbose)s
 
     Returns
@@ -555,5 +623,6 @@ def tfr_array_multitaper(
         decim=decim,
         output=output,
         n_jobs=n_jobs,
+        dtype=dtype,
         verbose=verbose,
     )
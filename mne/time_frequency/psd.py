@@ -4,13 +4,14 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import warnings
 from functools import partial
 
 import numpy as np
 from scipy.signal import spectrogram
 
 from ..parallel import parallel_func
-from ..utils import _check_option, _ensure_int, logger, verbose
+from ..utils import _check_option, _ensure_int, get_config, logger, verbose
 
 
 # adapted from SciPy
@@ -100,6 +101,36 @@ def _check_nfft(n, n_fft, n_per_seg, n_overlap):
     return n_fft, n_per_seg, n_overlap
 
 
+def _welch_freqs(sfreq, n_fft, fmin, fmax):
+    """Get the frequencies of interest of Welch spectra and their slice."""
+    win_size = n_fft / float(sfreq)
+    logger.info("Effective window size : %0.3f (s)" % win_size)
+    freqs = np.arange(n_fft // 2 + 1, dtype=float) * (sfreq / n_fft)
+    freq_mask = (freqs >= fmin) & (freqs <= fmax)
+    if not freq_mask.any():
+        raise ValueError(f"No frequencies found between fmin={fmin} and fmax={fmax}")
+    freq_sl = slice(*(np.where(freq_mask)[0][[0, -1]] + [0, 1]))
+    return freqs[freq_sl], freq_sl
+
+
+def _welch_func(sfreq, n_fft, n_overlap, n_per_seg, window, detrend, mode):
+    """Get the spectrogram function of the Welch segments."""
+    logger.debug(
+        f"Spectogram using {n_fft}-point FFT on {n_per_seg} samples with "
+        f"{n_overlap} overlap and {window} window"
+    )
+    return partial(
+        spectrogram,
+        detrend=detrend,
+        noverlap=n_overlap,
+        nperseg=n_per_seg,
+        nfft=n_fft,
+        fs=sfreq,
+        window=window,
+        mode=mode,
+    )
+
+
 @verbose
 def psd_array_welch(
     x,
@@ -197,33 +228,11 @@ def psd_array_welch(
 
     # Prep the PSD
     n_fft, n_per_seg, n_overlap = _check_nfft(n_times, n_fft, n_per_seg, n_overlap)
-    win_size = n_fft / float(sfreq)
-    logger.info("Effective window size : %0.3f (s)" % win_size)
-    freqs = np.arange(n_fft // 2 + 1, dtype=float) * (sfreq / n_fft)
-    freq_mask = (freqs >= fmin) & (freqs <= fmax)
-    if not freq_mask.any():
-        raise ValueError(f"No frequencies found between fmin={fmin} and fmax={fmax}")
-    freq_sl = slice(*(np.where(freq_mask)[0][[0, -1]] + [0, 1]))
-    del freq_mask
-    freqs = freqs[freq_sl]
+    freqs, freq_sl = _welch_freqs(sfreq, n_fft, fmin, fmax)
 
     # Parallelize across first N-1 dimensions
-    logger.debug(
-        f"Spectogram using {n_fft}-point FFT on {n_per_seg} samples with "
-        f"{n_overlap} overlap and {window} window"
-    )
-
     parallel, my_spect_func, n_jobs = parallel_func(_spect_func, n_jobs=n_jobs)
-    func = partial(
-        spectrogram,
-        detrend=detrend,
-        noverlap=n_overlap,
-        nperseg=n_per_seg,
-        nfft=n_fft,
-        fs=sfreq,
-        window=window,
-        mode=mode,
-    )
+    func = _welch_func(sfreq, n_fft, n_overlap, n_per_seg, window, detrend, mode)
     x_splits = [arr for arr in np.array_split(x, n_jobs) if arr.size != 0]
     f_spect = parallel(
         my_spect_func(d, func=func, freq_sl=freq_sl, average=average, output=output)
@@ -235,3 +244,157 @@ def psd_array_welch(
         shape = shape + (-1,)
     psds.shape = shape
     return psds, freqs
+
+
+# Number of Welch segments read from Raw instances at once
+_WELCH_CHUNK_SEGMENTS = 64
+# Number of spectral values kept for the streaming median before collapsing
+# them to their median. None (default) uses the MNE_PSD_MEDIAN_BLOCK_SIZE
+# config value if set, and otherwise keeps all of them (exact median)
+_WELCH_MEDIAN_BLOCK_SIZE = None
+
+
+@verbose
+def _psd_welch_raw(
+    raw,
+    sfreq,
+    fmin=0,
+    fmax=np.inf,
+    n_fft=256,
+    n_overlap=0,
+    n_per_seg=None,
+    n_jobs=None,
+    average="mean",
+    window="hamming",
+    remove_dc=True,
+    *,
+    picks,
+    start,
+    stop,
+    reject_by_annotation,
+    output="power",
+    verbose=None,
+):
+    """Compute the Welch PSD of Raw data, reading it segment by segment.
+
+    Same as :func:`psd_array_welch` on ``raw.get_data(picks, start, stop,
+    reject_by_annotation)`` for ``average='mean'``, but only
+    ``_WELCH_CHUNK_SEGMENTS`` Welch segments are in memory at once. For
+    ``average='median'``, the spectra of all segments are kept and the median
+    is exact, unless a block size is set (``_WELCH_MEDIAN_BLOCK_SIZE`` or the
+    ``MNE_PSD_MEDIAN_BLOCK_SIZE`` config value). Then, the median is exact as
+    long as all spectra fit in that many values and otherwise approximated
+    with a remedian (Rousseeuw & Bassett, 1990, JASA 85(409):97-104).
+    """
+    _check_option("average", average, ("mean", "median"))
+    _check_option("output", output, ("power",))
+    detrend = "constant" if remove_dc else False
+    n_fft = _ensure_int(n_fft, "n_fft")
+    n_overlap = _ensure_int(n_overlap, "n_overlap")
+    if n_per_seg is not None:
+        n_per_seg = _ensure_int(n_per_seg, "n_per_seg")
+    n_times = stop - start
+    n_fft, n_per_seg, n_overlap = _check_nfft(n_times, n_fft, n_per_seg, n_overlap)
+    freqs, freq_sl = _welch_freqs(sfreq, n_fft, fmin, fmax)
+    func = _welch_func(sfreq, n_fft, n_overlap, n_per_seg, window, detrend, "psd")
+    parallel, my_spect_func, n_jobs = parallel_func(
+        _decomp_aggregate_mask, n_jobs=n_jobs, prefer="threads", max_jobs=len(picks)
+    )
+
+    # Each chunk of data holds whole Welch segments, which then are the same
+    # as those of the whole data. Segments overlapping annotations are NaN.
+    step = n_per_seg - n_overlap
+    n_segments = (n_times - n_overlap) // step
+    shape = (len(picks), len(freqs))
+    psds, counts = np.zeros(shape), np.zeros(shape, int)
+    median = None
+    if average == "median":
+        block_size = _WELCH_MEDIAN_BLOCK_SIZE
+        if block_size is None:
+            block_size = get_config("MNE_PSD_MEDIAN_BLOCK_SIZE", None)
+        if block_size is None:
+            base = np.inf  # never collapse
+        else:
+            base = max(int(block_size) // np.prod(shape), _WELCH_CHUNK_SEGMENTS)
+        median = _StreamingMedian(base)
+    for first in range(0, n_segments, _WELCH_CHUNK_SEGMENTS):
+        last = min(first + _WELCH_CHUNK_SEGMENTS, n_segments)
+        data = raw.get_data(
+            picks,
+            start + first * step,
+            start + (last - 1) * step + n_per_seg,
+            reject_by_annotation=reject_by_annotation,
+        )
+        spect = parallel(
+            my_spect_func(d, func, average=None, freq_sl=freq_sl)
+            for d in data[:, np.newaxis]
+        )
+        spect = spect[0] if len(spect) == 1 else np.concatenate(spect)
+        good = ~np.isnan(spect)
+        counts += good.sum(axis=-1)
+        if median is None:
+            psds += np.nansum(spect, axis=-1)
+        else:  # segments first
+            median.push(spect.transpose(2, 0, 1), good.transpose(2, 0, 1))
+    with np.errstate(invalid="ignore"):  # NaN without good segments
+        if median is None:
+            psds /= counts
+        else:
+            psds = median.get() / _median_biases(n_segments)[counts]
+    return psds, freqs
+
+
+class _StreamingMedian:
+    """Approximate the median of a stream of arrays with a remedian.
+
+    Each time ``base`` values (arrays) have been pushed to a level, they are
+    replaced by their median, pushed to the next level, so that only
+    O(base * log(n)) values are kept in memory. Values with a zero weight are
+    ignored, and the remaining values of all levels are combined with their
+    weights (the number of values they summarize). With ``base=np.inf``, all
+    values are kept and the median is exact.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.levels = [[]]
+
+    def push(self, values, weights, level=0):
+        """Push values of shape (n, ...) and their weights of the same shape."""
+        if level == len(self.levels):
+            self.levels.append(list())
+        self.levels[level].append((values, weights))
+        if sum(len(v) for v, _ in self.levels[level]) >= self.base:
+            values, weights = self._concatenate(self.levels[level])
+            self.levels[level] = list()
+            if weights.all():  # much faster than nanmedian
+                values = np.median(values, axis=0, keepdims=True)
+            else:
+                with warnings.catch_warnings():  # all-NaN slices have no weight
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    values = np.nanmedian(
+                        np.where(weights > 0, values, np.nan), axis=0, keepdims=True
+                    )
+            self.push(values, weights.sum(axis=0, keepdims=True), level + 1)
+
+    def get(self):
+        """Get the (approximate) median of all the values pushed."""
+        values, weights = self._concatenate(sum(self.levels, list()))
+        if len(self.levels) == 1:  # nothing was collapsed, the median is exact
+            return np.nanmedian(np.where(weights > 0, values, np.nan), axis=0)
+        return _weighted_median(values, weights)
+
+    @staticmethod
+    def _concatenate(values_weights):
+        values, weights = zip(*values_weights)
+        return np.concatenate(values), np.concatenate(weights)
+
+
+def _weighted_median(values, weights):
+    """Compute the weighted (lower) median along the first axis."""
+    values = np.where(weights > 0, values, np.nan)  # sorted last
+    order = np.argsort(values, axis=0)
+    values = np.take_along_axis(values, order, axis=0)
+    cum_weights = np.cumsum(np.take_along_axis(weights, order, axis=0), axis=0)
+    idx = (cum_weights < cum_weights[-1] / 2.0).sum(axis=0, keepdims=True)
+    return np.take_along_axis(values, np.minimum(idx, len(values) - 1), axis=0)[0]
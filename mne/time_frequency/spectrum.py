@@ -13,6 +13,7 @@ import numpy as np
 
 from .._fiff.meas_info import ContainsMixin, Info
 from .._fiff.pick import _pick_data_channels, _picks_to_idx, pick_info
+from .._fiff.proj import make_projector_info
 from ..channels.channels import UpdateChannelsMixin
 from ..channels.layout import _merge_ch_data, find_layout
 from ..defaults import (
@@ -22,12 +23,14 @@ from ..defaults import (
     _handle_default,
 )
 from ..html_templates import _get_html_template
+from ..parallel import parallel_func
 from ..utils import (
     GetEpochsMixin,
     _build_data_frame,
     _check_pandas_index_arguments,
     _check_pandas_installed,
     _check_sphere,
+    _ensure_int,
     _time_mask,
     _validate_type,
     fill_doc,
@@ -35,6 +38,7 @@ from ..utils import (
     logger,
     object_diff,
     repr_html,
+    sizeof_fmt,
     verbose,
     warn,
 )
@@ -57,7 +61,16 @@ from ..viz.utils import (
     plt_show,
 )
 from .multitaper import psd_array_multitaper
-from .psd import _check_nfft, psd_array_welch
+from .psd import (
+    _WELCH_CHUNK_SEGMENTS,
+    _check_nfft,
+    _decomp_aggregate_mask,
+    _psd_welch_raw,
+    _welch_freqs,
+    _welch_func,
+    psd_array_welch,
+)
+from .tfr import AverageTFR
 
 
 def _identity_function(x):
@@ -1114,6 +1127,10 @@ class Spectrum(BaseSpectrum):
     mne.Epochs.compute_psd
     mne.Evoked.compute_psd
 
+    Notes
+    -----
+    %(notes_psd_raw_not_preloaded)s
+
     References
     ----------
     .. footbibliography::
@@ -1163,9 +1180,26 @@ class Spectrum(BaseSpectrum):
         if isinstance(self.inst, BaseRaw):
             start, stop = np.where(self._time_mask)[0][[0, -1]]
             rba = "NaN" if reject_by_annotation else None
-            data = self.inst.get_data(
-                self._picks, start, stop + 1, reject_by_annotation=rba
-            )
+            if (
+                not self.inst.preload
+                and method == "welch"
+                and method_kw.get("average", "mean") in ("mean", "median")
+            ):
+                # read the data segment by segment rather than all at once
+                self._psd_func = partial(
+                    _psd_welch_raw,
+                    picks=self._picks,
+                    start=start,
+                    stop=stop + 1,
+                    reject_by_annotation=rba,
+                    remove_dc=remove_dc,
+                    **method_kw,
+                )
+                data = self.inst
+            else:
+                data = self.inst.get_data(
+                    self._picks, start, stop + 1, reject_by_annotation=rba
+                )
         else:  # Evoked
             data = self.inst.data[self._picks][:, self._time_mask]
         # compute the spectra
@@ -1544,6 +1578,255 @@ class EpochsSpectrumArray(EpochsSpectrum):
         )
 
 
+@fill_doc
+class Spectrogram(AverageTFR):
+    """Time-resolved power spectrum of continuous data.
+
+    .. warning:: The preferred means of creating Spectrogram objects is via
+                 the instance method :meth:`mne.io.Raw.compute_spectrogram`.
+                 Direct class instantiation is not supported.
+
+    The power spectral density of consecutive, possibly overlapping windows
+    of the data. The windows are the segments of Welch's method (see
+    :func:`~mne.time_frequency.psd_array_welch`), so that averaging the
+    spectrogram over time gives the Welch PSD. Data are read from disk a few
+    windows at a time, and :meth:`update` extends the spectrogram when new
+    data are appended to the recording.
+
+    Parameters
+    ----------
+    inst : instance of Raw
+        The data from which to compute the spectrogram.
+    %(fmin_fmax_psd)s
+    %(tmin_tmax_psd)s
+    %(picks_good_data_noref)s
+    %(exclude_psd)s
+    %(proj_psd)s
+    %(remove_dc)s
+    reject_by_annotation : bool
+        Whether to set the spectra of windows overlapping spans with
+        annotations whose description begins with ``bad`` to NaN.
+    n_fft : int
+        The length of FFT used, must be ``>= n_per_seg``. The windows will be
+        zero-padded if ``n_fft > n_per_seg``.
+    n_overlap : int
+        The number of points of overlap between windows.
+    n_per_seg : int | None
+        Length of each window. Defaults to None, which sets ``n_per_seg``
+        equal to ``n_fft``.
+    %(window_psd)s
+    %(n_jobs)s
+    %(verbose)s
+
+    Attributes
+    ----------
+    %(info_not_none)s
+    ch_names : list
+        The names of the channels.
+    data : ndarray, shape (n_channels, n_freqs, n_times)
+        The power spectral density of each window.
+    times : ndarray, shape (n_times,)
+        The time of the center of each window in seconds, relative to the
+        first sample of the recording.
+    freqs : ndarray, shape (n_freqs,)
+        The frequencies in Hz.
+
+    See Also
+    --------
+    mne.io.Raw.compute_spectrogram
+    Spectrum
+    AverageTFR
+
+    Notes
+    -----
+    .. versionadded:: 1.7
+    """
+
+    @verbose
+    def __init__(
+        self,
+        inst,
+        fmin,
+        fmax,
+        tmin,
+        tmax,
+        picks,
+        exclude,
+        proj,
+        remove_dc,
+        reject_by_annotation,
+        *,
+        n_fft,
+        n_overlap,
+        n_per_seg,
+        window,
+        n_jobs,
+        verbose=None,
+    ):
+        from ..io import BaseRaw
+
+        _validate_type(inst, BaseRaw, "inst", "Raw")
+        sfreq = inst.info["sfreq"]
+        if np.isfinite(fmax) and (fmax > sfreq / 2):
+            raise ValueError(
+                f"Requested fmax ({fmax} Hz) must not exceed ½ the sampling "
+                f"frequency of the data ({0.5 * sfreq} Hz)."
+            )
+        picks = _picks_to_idx(inst.info, picks, "data", exclude, with_ref_meg=False)
+        info = pick_info(inst.info, sel=picks, copy=True)
+        start, stop = np.where(_time_mask(inst.times, tmin, tmax, sfreq=sfreq))[0][
+            [0, -1]
+        ]
+        n_fft = _ensure_int(n_fft, "n_fft")
+        n_overlap = _ensure_int(n_overlap, "n_overlap")
+        if n_per_seg is not None:
+            n_per_seg = _ensure_int(n_per_seg, "n_per_seg")
+        n_fft, n_per_seg, n_overlap = _check_nfft(
+            stop + 1 - start, n_fft, n_per_seg, n_overlap
+        )
+        freqs, freq_sl = _welch_freqs(sfreq, n_fft, fmin, fmax)
+        detrend = "constant" if remove_dc else False
+        # everything needed to process data appended later on
+        self._stft = dict(
+            func=_welch_func(
+                sfreq, n_fft, n_overlap, n_per_seg, window, detrend, "psd"
+            ),
+            sfreq=sfreq,
+            all_freqs=np.arange(n_fft // 2 + 1) * (sfreq / n_fft),
+            freq_idx=np.arange(freq_sl.start, freq_sl.stop),
+            n_per_seg=n_per_seg,
+            step=n_per_seg - n_overlap,
+            ch_names=info["ch_names"],
+            first_samp=inst.first_samp,
+            proj=proj,
+            reject_by_annotation=reject_by_annotation,
+        )
+        # samples read but not processed yet, starting with the next window
+        self._buffer = np.empty((len(picks), 0))
+        self._n_read = start
+        data, times = self._read(inst, picks, stop + 1, n_jobs)
+        super().__init__(info, data, times, freqs, nave=1, method="stft-power")
+
+    def __repr__(self):  # noqa: D105
+        s = "time : [%f, %f]" % (self.times[0], self.times[-1])
+        s += ", freq : [%f, %f]" % (self.freqs[0], self.freqs[-1])
+        s += ", channels : %d" % self.data.shape[0]
+        s += ", ~%s" % (sizeof_fmt(self._size),)
+        return "<Spectrogram | %s>" % s
+
+    @verbose
+    def update(self, inst, *, n_jobs=None, verbose=None):
+        """Extend the spectrogram with new data.
+
+        Parameters
+        ----------
+        inst : instance of Raw | ndarray, shape (n_channels, n_times)
+            The recording the spectrogram was computed from, with data
+            appended to it, in which case all samples following those already
+            processed are read. Can also be an array with the samples of the
+            channels in ``ch_names`` that directly follow those already
+            processed, to which projections are not applied.
+        %(n_jobs)s
+        %(verbose)s
+
+        Returns
+        -------
+        inst : instance of Spectrogram
+            The modified instance.
+
+        Notes
+        -----
+        Samples that do not fill a complete window yet are kept until the
+        next update, so the windows are the same as if all the data had been
+        available at once.
+
+        .. versionadded:: 1.7
+        """
+        from ..io import BaseRaw
+
+        _validate_type(inst, (BaseRaw, np.ndarray), "inst", "Raw or ndarray")
+        # follow the channels and frequencies picked since the last update
+        stft = self._stft
+        sel = [stft["ch_names"].index(ch_name) for ch_name in self.ch_names]
+        self._buffer = self._buffer[sel]
+        stft["ch_names"] = list(self.ch_names)
+        stft["freq_idx"] = np.searchsorted(stft["all_freqs"], self.freqs)
+        if isinstance(inst, BaseRaw):
+            if inst.info["sfreq"] != stft["sfreq"] or (
+                inst.first_samp != stft["first_samp"]
+            ):
+                raise ValueError(
+                    "inst must be the recording the spectrogram was computed "
+                    "from, got a different sampling frequency or first sample"
+                )
+            picks = _picks_to_idx(inst.info, self.ch_names, exclude=())
+            data, times = self._read(inst, picks, inst.n_times, n_jobs)
+        else:
+            if inst.ndim != 2 or len(inst) != len(self.ch_names):
+                raise ValueError(
+                    f"inst must have shape (n_channels={len(self.ch_names)}, "
+                    f"n_times), got {inst.shape}"
+                )
+            data, times = self._feed(inst, n_jobs)
+        self._data = np.concatenate([self._data, data], axis=-1)
+        self._set_times(np.concatenate([self.times, times]))
+        self._raw_times = np.concatenate([self._raw_times, times])
+        return self
+
+    def _read(self, raw, picks, stop, n_jobs):
+        """Read and process the samples of raw up to stop, in chunks."""
+        stft = self._stft
+        rba = "NaN" if stft["reject_by_annotation"] else None
+        proj_op = None
+        if stft["proj"]:
+            proj_op, n_proj = make_projector_info(raw.info)
+            proj_op = proj_op[picks] if n_proj else None
+        chunk = _WELCH_CHUNK_SEGMENTS * stft["step"]
+        spects, times = [], []
+        for start in range(self._n_read, stop, chunk):
+            this_stop = min(start + chunk, stop)
+            if proj_op is None:
+                data = raw.get_data(picks, start, this_stop, reject_by_annotation=rba)
+            else:
+                data = proj_op @ raw.get_data(
+                    np.arange(len(raw.ch_names)),
+                    start,
+                    this_stop,
+                    reject_by_annotation=rba,
+                )
+            spect, this_times = self._feed(data, n_jobs)
+            spects.append(spect)
+            times.append(this_times)
+        if not spects:
+            return self._feed(np.empty((len(picks), 0)), n_jobs)
+        return np.concatenate(spects, axis=-1), np.concatenate(times)
+
+    def _feed(self, data, n_jobs):
+        """Process the windows completed by new samples."""
+        stft = self._stft
+        n_per_seg, step = stft["n_per_seg"], stft["step"]
+        first = self._n_read - self._buffer.shape[-1]
+        self._n_read += data.shape[-1]
+        data = np.concatenate([self._buffer, data], axis=-1)
+        n_windows = max((data.shape[-1] - n_per_seg) // step + 1, 0)
+        times = (first + step * np.arange(n_windows) + n_per_seg / 2.0) / stft["sfreq"]
+        if n_windows:
+            parallel, my_spect_func, n_jobs = parallel_func(
+                _decomp_aggregate_mask, n_jobs, prefer="threads", max_jobs=len(data)
+            )
+            spect = parallel(
+                my_spect_func(d, stft["func"], average=None, freq_sl=stft["freq_idx"])
+                for d in np.array_split(
+                    data[:, : (n_windows - 1) * step + n_per_seg], n_jobs
+                )
+            )
+            spect = np.concatenate(spect)
+        else:
+            spect = np.empty((len(data), len(stft["freq_idx"]), 0))
+        self._buffer = data[:, n_windows * step :].copy()
+        return spect, times
+
+
 def read_spectrum(fname):
     """Load a :class:`mne.time_frequency.Spectrum` object from disk.
 
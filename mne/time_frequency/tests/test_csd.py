@@ -618,6 +618,37 @@ def test_csd_morlet():
         csd = csd_morlet(epochs_nobase, frequencies=[10], decim=20)
 
 
+def test_csd_morlet_windows(tmp_path, monkeypatch):
+    """Test Morlet CSDs of several time windows and of non-preloaded epochs."""
+    from mne.time_frequency import csd as csd_mod
+
+    rng = np.random.default_rng(0)
+    info = mne.create_info(4, 200.0, "eeg")
+    raw = mne.io.RawArray(rng.standard_normal((4, 4000)), info)
+    raw.save(tmp_path / "test_raw.fif")
+    raw = mne.io.read_raw_fif(tmp_path / "test_raw.fif")
+    events = mne.make_fixed_length_events(raw, duration=2.0)
+    epochs = mne.Epochs(raw, events, tmin=-0.5, tmax=1.0, preload=False)
+    freqs = [10, 20]
+    tmin, tmax = [-0.2, 0.1, 0.4], [0.3, 0.5, None]
+    csds = csd_morlet(epochs, freqs, tmin=tmin, tmax=tmax, n_cycles=3)
+    assert not epochs.preload
+    assert len(csds) == 3
+    epochs.load_data()
+    for csd, this_tmin, this_tmax in zip(csds, tmin, tmax):
+        want = csd_morlet(epochs, freqs, tmin=this_tmin, tmax=this_tmax, n_cycles=3)
+        assert_allclose(csd.get_data(index=1), want.get_data(index=1), rtol=1e-6)
+        assert csd.tmin == want.tmin and csd.tmax == want.tmax
+    # one batch of epochs and one frequency at a time
+    monkeypatch.setattr(csd_mod, "_CSD_BLOCK_SIZE", 1)
+    csd = csd_morlet(epochs, freqs, tmin=0.1, tmax=0.5, n_cycles=3, n_jobs=2)
+    assert_allclose(csd._data, csds[1]._data, rtol=1e-6)
+    with pytest.raises(ValueError, match="same number of time windows"):
+        csd_morlet(epochs, freqs, tmin=[0.1, 0.2], tmax=[0.3, 0.4, 0.5])
+    with pytest.raises(ValueError, match="tmax must be larger"):
+        csd_morlet(epochs, freqs, tmin=[0.1, 0.2], tmax=[0.3, 0.1])
+
+
 def test_equalize_channels():
     """Test equalization of channels for instances of CrossSpectralDensity."""
     csd1 = _make_csd()
@@ -2,7 +2,7 @@
 # Copyright the MNE-Python contributors.
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
 from mne.time_frequency import psd_array_multitaper
 from mne.time_frequency.multitaper import dpss_windows
@@ -32,6 +32,21 @@ def test_dpss_windows():
     assert_array_almost_equal(eigs, eigs_ni)
 
 
+def test_dpss_windows_cache():
+    """Test that cached DPSS windows are not modified through the outputs."""
+    dpss, eigs = dpss_windows(500, 2.0, 3)
+    want_dpss, want_eigs = dpss.copy(), eigs.copy()
+    dpss *= 2
+    eigs[:] = 0
+    dpss, eigs = dpss_windows(500, 2.0, 3)
+    assert_array_equal(dpss, want_dpss)
+    assert_array_equal(eigs, want_eigs)
+    # low_bias selection still warns when the windows come from the cache
+    for _ in range(2):
+        with pytest.warns(RuntimeWarning, match="Could not properly use low_bias"):
+            dpss_windows(10, 0.1, 2)
+
+
 @pytest.mark.parametrize("n_times", (100, 101))
 @pytest.mark.parametrize("adaptive, n_jobs", [(False, 1), (True, 1), (True, 2)])
 def test_multitaper_psd(n_times, adaptive, n_jobs):
@@ -75,3 +90,31 @@ def test_adaptive_weights_convergence():
     ):
         psd_array_multitaper(data, sfreq, adaptive=True, max_iter=2)
     psd_array_multitaper(data, sfreq, adaptive=True, max_iter=200)
+
+
+@pytest.mark.parametrize("adaptive", (False, True))
+def test_multitaper_psd_blocks_dtype(adaptive, monkeypatch):
+    """Test that blocks of signals and single precision give the same PSD."""
+    from mne.time_frequency import multitaper
+
+    data = np.random.default_rng(0).standard_normal((4, 3, 200))
+    sfreq = 500
+    psd, freqs = psd_array_multitaper(data, sfreq, adaptive=adaptive)
+    assert psd.shape == (4, 3, len(freqs))
+    assert psd.dtype == np.float64
+    psd_32, freqs_32 = psd_array_multitaper(
+        data, sfreq, adaptive=adaptive, dtype="float32"
+    )
+    assert psd_32.dtype == np.float32
+    assert_array_equal(freqs, freqs_32)
+    assert_allclose(psd_32, psd, rtol=1e-4)
+    coefs, _, weights = psd_array_multitaper(
+        data, sfreq, output="complex", dtype="float32"
+    )
+    assert coefs.dtype == np.complex64
+    monkeypatch.setattr(multitaper, "_MT_ADAPTIVE_BLOCK_SIZE", 1)
+    monkeypatch.setattr(multitaper, "_MT_BLOCK_SAMPLES", 1)
+    psd_block, _ = psd_array_multitaper(data, sfreq, adaptive=adaptive)
+    assert_allclose(psd_block, psd, rtol=1e-12)
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        psd_array_multitaper(data, sfreq, dtype="int")
@@ -8,8 +8,8 @@ from matplotlib.colors import same_color
 from numpy.testing import assert_allclose, assert_array_equal
 
 from mne import Annotations, create_info, make_fixed_length_epochs
-from mne.io import RawArray
-from mne.time_frequency import read_spectrum
+from mne.io import RawArray, read_raw_fif
+from mne.time_frequency import Spectrogram, read_spectrum
 from mne.time_frequency.multitaper import _psd_from_mt
 from mne.time_frequency.spectrum import EpochsSpectrumArray, SpectrumArray
 
@@ -171,6 +171,80 @@ def test_spectrum_reject_by_annot(raw):
     assert spect_no_annot != spect_reject_annot
 
 
+@pytest.mark.parametrize("average", ("mean", "median"))
+def test_spectrum_raw_not_preloaded(average, tmp_path, monkeypatch):
+    """Test Welch spectra of non-preloaded Raw read segment by segment."""
+    from mne.time_frequency import psd as psd_mod
+
+    rng = np.random.default_rng(0)
+    raw = RawArray(rng.standard_normal((3, 60000)), create_info(3, 1000.0, "eeg"))
+    raw.set_annotations(Annotations([10.1, 30], [2, 0.5], "bad_test"))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = read_raw_fif(fname)
+    kwargs = dict(average=average, tmin=0.7, n_fft=512, n_overlap=100)
+    want = raw.copy().load_data().compute_psd(**kwargs)
+    got = raw.compute_psd(**kwargs)
+    assert not raw.preload
+    assert_allclose(got.get_data(), want.get_data(), rtol=1e-10)
+    assert_array_equal(got.freqs, want.freqs)
+    # reading many chunks gives the same result
+    monkeypatch.setattr(psd_mod, "_WELCH_CHUNK_SEGMENTS", 8)
+    got = raw.compute_psd(**kwargs)
+    assert_allclose(got.get_data(), want.get_data(), rtol=1e-10)
+    # bounding the memory of the median makes it approximate
+    monkeypatch.setenv("MNE_PSD_MEDIAN_BLOCK_SIZE", "1")
+    got = raw.compute_psd(**kwargs).get_data()[:, 1:]
+    want = want.get_data()[:, 1:]
+    if average == "mean":
+        assert_allclose(got, want, rtol=1e-10)
+    else:  # noisier, but not biased (here, medians of 8 segments)
+        assert not np.allclose(got, want)
+        assert_allclose(np.mean(got / want, axis=-1), 1, atol=0.03)
+
+
+def test_spectrogram_raw(tmp_path, monkeypatch):
+    """Test the spectrogram of Raw data and its incremental updates."""
+    from mne.time_frequency import spectrum as spectrum_mod
+
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, 20000))
+    info = create_info(["a", "b", "c"], 1000.0, "eeg")
+    raw = RawArray(data, info)
+    raw.set_annotations(Annotations([10.1], [2], "bad_test"))
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    kwargs = dict(tmin=0.7, fmax=200, n_fft=512, n_overlap=100)
+    monkeypatch.setattr(spectrum_mod, "_WELCH_CHUNK_SEGMENTS", 3)
+    spectrogram = raw.compute_spectrogram(**kwargs)
+    assert not raw.preload
+    assert isinstance(spectrogram, Spectrogram)
+    assert spectrogram.data.shape == (3, len(spectrogram.freqs), 46)
+    assert_allclose(spectrogram.times[:2], [0.956, 1.368])
+    # averaging the windows gives the Welch PSD, without the bad ones
+    bad = np.isnan(spectrogram.data).any(axis=(0, 1))
+    assert_array_equal(np.where(bad)[0], np.arange(22, 28))
+    want = raw.compute_psd(**kwargs)
+    assert_allclose(np.nanmean(spectrogram.data, -1), want.get_data(), rtol=1e-10)
+    assert_array_equal(spectrogram.freqs, want.freqs)
+    # extend with samples or with a growing recording
+    want = RawArray(data, info).compute_spectrogram(**kwargs)
+    got = RawArray(data[:, :2000], info).compute_spectrogram(**kwargs)
+    for start, stop in ((2000, 2001), (2001, 5000), (5000, 20000)):
+        got.update(data[:, start:stop])
+    assert_allclose(got.data, want.data)
+    assert_allclose(got.times, want.times)
+    raw = RawArray(data[:, :5000], info)
+    got = raw.compute_spectrogram(**kwargs).crop(fmin=10, fmax=50).pick(["c", "a"])
+    raw.append(RawArray(data[:, 5000:], info))
+    got.update(raw)
+    want.crop(fmin=10, fmax=50).pick(["c", "a"])
+    assert_allclose(got.data, want.data)
+    assert_allclose(got.times, want.times)
+    with pytest.raises(ValueError, match="must have shape"):
+        got.update(data)
+
+
 def test_spectrum_bads_exclude(raw):
     """Test bads are not removed unless exclude="bads"."""
     raw.pick("mag")  # get rid of IAS channel
@@ -17,6 +17,7 @@ from numpy.testing import (
 )
 from scipy import fftpack
 
+import mne
 from mne import Epochs, make_fixed_length_events, read_events
 from mne.io import read_raw_fif
 from mne.time_frequency import AverageTFR, tfr_array_stockwell
@@ -70,6 +71,36 @@ def test_stockwell_st_no_zero_pad():
     _st_power_itc(data, 10, True, 0, 1, W)
 
 
+@pytest.mark.parametrize("decim", (1, 3, 4))
+def test_stockwell_batched(decim, monkeypatch):
+    """Test the batched Stockwell power and ITC against the per-frequency ST."""
+    sfreq, n_times = 100.0, 200
+    data = np.random.RandomState(0).randn(4, 3, n_times)
+    power, itc, freqs = tfr_array_stockwell(
+        data, sfreq, fmin=5, fmax=40, decim=decim, return_itc=True
+    )
+    x, n_fft, zero_pad = _check_input_st(data, None)
+    start_f = np.abs(fftpack.fftfreq(n_fft, 1.0 / sfreq) - 5).argmin()
+    W = _precompute_st_windows(n_fft, start_f, start_f + len(freqs), sfreq, 1.0)
+    st = _st(x, start_f, W)[..., :n_times:decim]
+    assert power.shape == itc.shape == (3, len(freqs), st.shape[-1])
+    assert_allclose(power, np.mean(np.abs(st) ** 2, axis=0), rtol=1e-10)
+    assert_allclose(itc, np.abs(np.mean(st / np.abs(st), axis=0)), rtol=1e-10)
+    # one signal and frequency per inverse FFT, in parallel over channels
+    monkeypatch.setattr(mne.time_frequency._stockwell, "_ST_BLOCK_SIZE", 1)
+    power_1, itc_1, _ = tfr_array_stockwell(
+        data, sfreq, fmin=5, fmax=40, decim=decim, return_itc=True, n_jobs=2
+    )
+    assert_allclose(power_1, power, rtol=1e-10)
+    assert_allclose(itc_1, itc, rtol=1e-10)
+    power_32, itc_32, _ = tfr_array_stockwell(
+        data, sfreq, fmin=5, fmax=40, decim=decim, return_itc=True, dtype="float32"
+    )
+    assert power_32.dtype == itc_32.dtype == np.float32
+    assert_allclose(power_32, power, rtol=1e-4)
+    assert_allclose(itc_32, itc, rtol=1e-3)
+
+
 def test_stockwell_core():
     """Test stockwell transform."""
     # adapted from
@@ -23,17 +23,20 @@ from mne import (
 )
 from mne.io import read_raw_fif
 from mne.tests.test_epochs import assert_metadata_equal
+from mne.time_frequency import tfr as tfr_mod
 from mne.time_frequency import tfr_array_morlet, tfr_array_multitaper
 from mne.time_frequency.tfr import (
     AverageTFR,
     EpochsTFR,
     _compute_tfr,
+    _cwt_array,
     _make_dpss,
     combine_tfr,
     cwt,
     fwhm,
     morlet,
     read_tfrs,
+    tfr_average,
     tfr_morlet,
     tfr_multitaper,
     write_tfrs,
@@ -648,6 +651,13 @@ def test_io(tmp_path):
     assert_equal(tfr2.comment, tfr4.comment)
 
     pytest.raises(ValueError, read_tfrs, fname, condition="nonono")
+
+    # single precision is preserved
+    for dtype in (np.float32, np.complex64):
+        tfr.data = np.ones(tfr.data.shape, dtype)
+        tfr.save(fname, overwrite=True)
+        assert read_tfrs(fname)[0].data.dtype == dtype
+
     # Test save of EpochsTFR.
     n_events = 5
     data = np.zeros((n_events, 3, 2, 3))
@@ -1126,6 +1136,139 @@ def test_compute_tfr_correct(method, decim):
     assert freqs[np.argmax(tfr.mean(-1))] == f
 
 
+@pytest.mark.parametrize("output", ("complex", "power", "avg_power_itc"))
+def test_cwt_blocks(output, monkeypatch):
+    """Test that batching signals and wavelets does not change the TFR."""
+    rng = np.random.RandomState(0)
+    sfreq = 200.0
+    data = rng.randn(3, 4, 300)
+    freqs = [8.0, 13.0, 30.0, 50.0]
+    n_cycles = [2.0, 3.0, 7.0, 7.0]  # different FFT lengths
+    Ws = morlet(sfreq, freqs, n_cycles=n_cycles)
+    for x in (data[0], data[0] + 1j * data[1]):
+        want = cwt(x, Ws, use_fft=False)
+        assert_allclose(cwt(x, Ws), want, atol=1e-12)
+        got = _cwt_array(x, Ws, "same", 1, True, dtype=np.complex64)
+        assert got.dtype == np.complex64
+        assert_allclose(got, want, atol=1e-5)
+    kwargs = dict(n_cycles=2.0, output=output)
+    want = _compute_tfr(data, freqs, sfreq, **kwargs)
+    monkeypatch.setattr(tfr_mod, "_CWT_BLOCK_SAMPLES", 1)  # one signal at a time
+    for n_jobs in (1, 3):
+        got = _compute_tfr(data, freqs, sfreq, n_jobs=n_jobs, **kwargs)
+        assert_allclose(got, want, atol=1e-12)
+
+
+@pytest.mark.parametrize("decim", (2, 7, slice(5, 290, 3), slice(-50, None, 20)))
+def test_cwt_decim(decim):
+    """Test that decimating from folded spectra matches slicing the TFR."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(2, 300)
+    Ws = morlet(200.0, [8.0, 30.0, 50.0], n_cycles=[2.0, 7.0, 7.0])
+    decim_slice = decim if isinstance(decim, slice) else slice(None, None, decim)
+    for this_x in (x, x + 1j * x[::-1]):
+        want = cwt(this_x, Ws)[..., decim_slice]
+        assert_allclose(cwt(this_x, Ws, decim=decim), want, atol=1e-12)
+    tfr = tfr_array_morlet(x[np.newaxis], 200.0, [30.0], decim=decim, output="power")
+    want = tfr_array_morlet(x[np.newaxis], 200.0, [30.0], output="power")
+    assert_allclose(tfr, want[..., decim_slice], atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ("morlet", "multitaper"))
+def test_tfr_average(method):
+    """Test streaming the TFR average of epochs."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(3, 250 * 20)
+    data[:, 1000:1010] *= 1e3  # one bad epoch
+    raw = mne.io.RawArray(data, create_info(3, 250.0, "eeg"))
+    events = mne.make_fixed_length_events(raw, duration=1.0)
+    events[::2, 2] = 2
+    kwargs = dict(tmin=0, tmax=0.996, baseline=None, reject=dict(eeg=50))
+    epochs = Epochs(raw, events, dict(a=1, b=2), preload=False, **kwargs)
+    freqs = [10.0, 20.0, 40.0]
+    fun = dict(morlet=tfr_morlet, multitaper=tfr_multitaper)[method]
+    fun_kwargs = dict(use_fft=True) if method == "morlet" else dict()
+    power, itc = fun(epochs.copy().load_data(), freqs, 3.0, decim=2, **fun_kwargs)
+    assert power.nave == 19
+    # non-preloaded epochs are streamed
+    for this_power, this_itc in (
+        fun(epochs, freqs, 3.0, decim=2, **fun_kwargs),
+        tfr_average(
+            epochs, freqs, 3.0, method=method, zero_mean=True, decim=2, batch_size=4
+        ),
+    ):
+        assert this_power.nave == 19
+        assert_allclose(this_power.data, power.data, rtol=1e-10)
+        assert_allclose(this_itc.data, itc.data, rtol=1e-10)
+    assert not epochs.preload
+    powers, variances = tfr_average(
+        epochs,
+        freqs,
+        3.0,
+        method=method,
+        zero_mean=True,
+        return_itc=False,
+        return_var=True,
+        by_event_type=True,
+        batch_size=3,
+        n_jobs=2,
+    )
+    for cond, this_power, var in zip(("a", "b"), powers, variances):
+        want = fun(
+            epochs[cond].load_data(),
+            freqs,
+            3.0,
+            average=False,
+            return_itc=False,
+            **fun_kwargs,
+        ).data
+        assert this_power.comment == var.comment == cond
+        assert this_power.nave == len(want)
+        assert_allclose(this_power.data, want.mean(0), rtol=1e-10)
+        assert_allclose(var.data, want.var(0), rtol=1e-8)
+    with pytest.raises(ValueError, match="at least 1"):
+        tfr_average(epochs, freqs, 3.0, batch_size=0)
+
+
+@pytest.mark.parametrize("method", ("morlet", "multitaper"))
+@pytest.mark.parametrize(
+    "output", ("complex", "power", "phase", "avg_power", "itc", "avg_power_itc")
+)
+def test_tfr_dtype(method, output):
+    """Test single precision TFRs."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(4, 3, 500)
+    kwargs = dict(n_cycles=3.0, output=output, decim=3)
+    fun = dict(morlet=tfr_array_morlet, multitaper=tfr_array_multitaper)[method]
+    want = fun(data, 250.0, [10.0, 20.0, 40.0], **kwargs)
+    got = fun(data, 250.0, [10.0, 20.0, 40.0], dtype="float32", **kwargs)
+    assert got.dtype == (np.complex64 if np.iscomplexobj(want) else np.float32)
+    if output == "phase":
+        assert_allclose(np.angle(np.exp(1j * (got - want))), 0, atol=1e-4)
+    else:
+        assert_allclose(got, want, rtol=0, atol=1e-5 * np.abs(want).max())
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        fun(data, 250.0, [10.0], dtype="float16", **kwargs)
+
+
+def test_tfr_dtype_objects():
+    """Test single precision TFR objects."""
+    rng = np.random.RandomState(0)
+    epochs = EpochsArray(rng.randn(4, 3, 500), create_info(3, 250.0, "eeg"))
+    for fun in (tfr_morlet, tfr_multitaper):
+        power, itc = fun(epochs, [10.0, 20.0], 3.0, dtype="float32")
+        assert power.data.dtype == itc.data.dtype == np.float32
+        power = fun(epochs, [10.0, 20.0], 3.0, average=False, return_itc=False)
+        power_32 = fun(
+            epochs, [10.0, 20.0], 3.0, average=False, return_itc=False, dtype="float32"
+        )
+        assert power_32.data.dtype == np.float32
+        assert power_32.average().data.dtype == np.float32
+        assert_allclose(power_32.data, power.data, rtol=1e-5)
+    tfrs = tfr_average(epochs, [10.0, 20.0], 3.0, return_var=True, dtype="float32")
+    assert all(tfr.data.dtype == np.float32 for tfr in tfrs)
+
+
 def test_averaging_epochsTFR():
     """Test that EpochsTFR averaging methods work."""
     # Setup for reading the raw data
@@ -15,7 +15,7 @@ from copy import deepcopy
 from functools import partial
 
 import numpy as np
-from scipy.fft import fft, ifft
+from scipy.fft import fft, ifft, rfft
 from scipy.signal import argrelmax
 
 from .._fiff.meas_info import ContainsMixin, Info
@@ -42,6 +42,7 @@ from ..utils import (
     _check_pandas_installed,
     _check_time_format,
     _convert_times,
+    _custom_lru_cache,
     _freq_mask,
     _gen_events,
     _import_h5io_funcs,
@@ -310,9 +311,13 @@ def _make_dpss(sfreq, freqs, n_cycles=7.0, time_bandwidth=4.0, zero_mean=False):
 
 # Low level convolution
 
+# Number of spectrum samples (signals x wavelets x n_fft) _cwt_gen transforms
+# at once
+_CWT_BLOCK_SAMPLES = 2**18
 
-def _get_nfft(wavelets, X, use_fft=True, check=True):
-    n_times = X.shape[-1]
+
+def _check_wavelet_length(wavelets, n_times, use_fft=True):
+    """Warn (FFT) or raise (temporal convolution) if a wavelet is too long."""
     max_size = max(w.size for w in wavelets)
     if max_size > n_times:
         msg = (
@@ -320,17 +325,13 @@ def _get_nfft(wavelets, X, use_fft=True, check=True):
             f"signal ({n_times}). Consider using a longer signal or "
             "shorter wavelets."
         )
-        if check:
-            if use_fft:
-                warn(msg, UserWarning)
-            else:
-                raise ValueError(msg)
-    nfft = n_times + max_size - 1
-    nfft = next_fast_len(nfft)  # 2 ** int(np.ceil(np.log2(nfft)))
-    return nfft
+        if use_fft:
+            warn(msg, UserWarning)
+        else:
+            raise ValueError(msg)
 
 
-def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
+def _cwt_gen(X, Ws, *, mode="same", decim=1, use_fft=True, dtype=np.complex128):
     """Compute cwt with fft based convolutions or temporal convolutions.
 
     Parameters
@@ -339,8 +340,6 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
         The data.
     Ws : list of array
         Wavelets time series.
-    fsize : int
-        FFT length.
     mode : {'full', 'valid', 'same'}
         See numpy.convolve.
     decim : int | slice, default 1
@@ -351,66 +350,151 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
         .. note:: Decimation may create aliasing artifacts.
 
+        With ``use_fft=True`` and ``mode != 'valid'``, the decimated samples
+        are computed directly, without the full resolution transform.
     use_fft : bool, default True
         Use the FFT for convolutions or not.
-
-    Returns
-    -------
-    out : array, shape (n_signals, n_freqs, n_time_decim)
-        The time-frequency transform of the signals.
+    dtype : dtype, default np.complex128
+        The output dtype. With ``np.complex64`` the FFTs are computed in
+        single precision.
+
+    Yields
+    ------
+    tfr : array, shape (n_block, n_freqs, n_time_decim)
+        The time-frequency transform of consecutive blocks of signals.
     """
     _check_option("mode", mode, ["same", "valid", "full"])
     decim = _check_decim(decim)
     X = np.asarray(X)
+    dtype = np.dtype(dtype)
+    _check_option("dtype", dtype, (np.complex64, np.complex128))
 
-    # Precompute wavelets for given frequency range to save time
     _, n_times = X.shape
     n_times_out = X[:, decim].shape[1]
     n_freqs = len(Ws)
-
-    # precompute FFTs of Ws
+    # Decimated outputs are computed directly from folded spectra
+    fold = use_fft and mode != "valid" and decim.step > 1
     if use_fft:
-        fft_Ws = np.empty((n_freqs, fsize), dtype=np.complex128)
-        for i, W in enumerate(Ws):
-            fft_Ws[i] = fft(W, fsize)
+        groups = _get_cwt_fft_groups(Ws, n_times, dtype, decim if fold else None)
+        n_group = max(len(idx) * fft_Ws.shape[-1] for idx, fft_Ws in groups)
+        block_size = max(_CWT_BLOCK_SAMPLES // n_group, 1)
+    else:
+        block_size = 1
+    x_dtype = dtype if np.iscomplexobj(X) else np.finfo(dtype).dtype
 
-    # Make generator looping across signals
-    tfr = np.zeros((n_freqs, n_times_out), dtype=np.complex128)
-    for x in X:
+    # Make generator looping across blocks of signals
+    for start in range(0, len(X), block_size):
+        x = X[start : start + block_size].astype(x_dtype, copy=False)
+        tfr = np.zeros((len(x), n_freqs, n_times_out), dtype=dtype)
         if use_fft:
-            fft_x = fft(x, fsize)
-
-        # Loop across wavelets
-        for ii, W in enumerate(Ws):
-            if use_fft:
-                ret = ifft(fft_x * fft_Ws[ii])[: n_times + W.size - 1]
-            else:
+            for idx, fft_Ws in groups:
+                x_fft = _cwt_fft(x, np.prod(fft_Ws.shape[1:]))
+                if fold:
+                    tfr[:, idx] = _cwt_fold(x_fft, fft_Ws, n_times_out)
+                    continue
+                rets = ifft(x_fft[:, np.newaxis] * fft_Ws, axis=-1)
+                for ii, ret in zip(idx, rets.transpose(1, 0, 2)):
+                    W = Ws[ii]
+                    ret = ret[:, : n_times + W.size - 1]
+                    _store_cwt(tfr[:, ii], ret, W, n_times, mode, decim, use_fft)
+        else:
+            for ii, W in enumerate(Ws):
                 # Work around multarray.correlate->OpenBLAS bug on ppc64le
                 # ret = np.correlate(x, W, mode=mode)
-                ret = np.convolve(x, W.real, mode=mode) + 1j * np.convolve(
-                    x, W.imag, mode=mode
+                ret = np.convolve(x[0], W.real, mode=mode) + 1j * np.convolve(
+                    x[0], W.imag, mode=mode
+                )
+                _store_cwt(
+                    tfr[:, ii], ret[np.newaxis], W, n_times, mode, decim, use_fft
                 )
-
-            # Center and decimate decomposition
-            if mode == "valid":
-                sz = int(abs(W.size - n_times)) + 1
-                offset = (n_times - sz) // 2
-                this_slice = slice(offset // decim.step, (offset + sz) // decim.step)
-                if use_fft:
-                    ret = _centered(ret, sz)
-                tfr[ii, this_slice] = ret[decim]
-            elif mode == "full" and not use_fft:
-                start = (W.size - 1) // 2
-                end = len(ret) - (W.size // 2)
-                ret = ret[start:end]
-                tfr[ii, :] = ret[decim]
-            else:
-                if use_fft:
-                    ret = _centered(ret, n_times)
-                tfr[ii, :] = ret[decim]
         yield tfr
 
 
+def _get_cwt_fft_groups(Ws, n_times, dtype, decim=None):
+    """Group the wavelets that share the same (minimal) FFT length.
+
+    With ``decim``, the FFT lengths are multiples of the decimation step and
+    the wavelet spectra are prepared for :func:`_cwt_fold`: shifted to the
+    first output sample, scaled and split in ``decim.step`` segments.
+    """
+    if decim is not None:
+        decim = (decim.start, decim.stop, decim.step)
+    return _cwt_fft_groups(list(Ws), n_times, np.dtype(dtype).name, decim)
+
+
+@_custom_lru_cache(10)
+def _cwt_fft_groups(Ws, n_times, dtype, decim):
+    # Sliding-window and per-epoch callers reuse the same wavelets, so the
+    # (read-only) spectra are cached
+    if decim is not None:
+        decim = slice(*decim)
+    step = 1 if decim is None else decim.step
+    n_ffts = np.array(
+        [step * next_fast_len(-(-(n_times + W.size - 1) // step)) for W in Ws]
+    )
+    groups = list()
+    for n_fft in np.unique(n_ffts):
+        idx = np.where(n_ffts == n_fft)[0]
+        fft_Ws = np.array([fft(Ws[ii], n_fft) for ii in idx])
+        if decim is not None:
+            # first output sample of each wavelet in the full convolution
+            first = [(Ws[ii].size - 1) // 2 + range(n_times)[decim].start for ii in idx]
+            phase = np.outer(first, np.arange(n_fft)) % n_fft / n_fft
+            fft_Ws *= np.exp(2j * np.pi * phase) / step
+            fft_Ws = fft_Ws.reshape(len(idx), step, n_fft // step)
+        fft_Ws = fft_Ws.astype(dtype, copy=False)
+        idx.flags.writeable = fft_Ws.flags.writeable = False
+        groups.append((idx, fft_Ws))
+    return groups
+
+
+def _cwt_fold(x_fft, fft_Ws, n_out):
+    """Compute decimated convolutions from their folded spectra.
+
+    Keeping every ``step`` sample of a signal aliases its spectrum, so the
+    decimated convolutions are the inverse FFTs (of length ``n_fft // step``)
+    of the sums of the ``step`` segments of the (shifted) product spectra.
+    """
+    step, n_seg = fft_Ws.shape[1:]
+    x_fft = x_fft.reshape(len(x_fft), 1, step, n_seg)
+    folded = x_fft[:, :, 0] * fft_Ws[:, 0]
+    for jj in range(1, step):
+        folded += x_fft[:, :, jj] * fft_Ws[:, jj]
+    return ifft(folded, axis=-1)[..., :n_out]
+
+
+def _cwt_fft(x, n_fft):
+    """Compute the full spectrum of x, using the real FFT for real data."""
+    if np.iscomplexobj(x):
+        return fft(x, n_fft, axis=-1)
+    x_fft = rfft(x, n_fft, axis=-1)
+    # Fill the negative frequencies from the Hermitian symmetry
+    n_half = x_fft.shape[-1]
+    out = np.empty(x.shape[:-1] + (n_fft,), x_fft.dtype)
+    out[..., :n_half] = x_fft
+    out[..., n_half:] = x_fft[..., 1 : n_fft - n_half + 1][..., ::-1].conj()
+    return out
+
+
+def _store_cwt(tfr, ret, W, n_times, mode, decim, use_fft):
+    """Center and decimate the convolutions of a block of signals."""
+    if mode == "valid":
+        sz = int(abs(W.size - n_times)) + 1
+        offset = (n_times - sz) // 2
+        this_slice = slice(offset // decim.step, (offset + sz) // decim.step)
+        if use_fft:
+            ret = _centered(ret, (len(ret), sz))
+        tfr[:, this_slice] = ret[:, decim]
+    elif mode == "full" and not use_fft:
+        start = (W.size - 1) // 2
+        end = ret.shape[1] - (W.size // 2)
+        tfr[:] = ret[:, start:end][:, decim]
+    else:
+        if use_fft:
+            ret = _centered(ret, (len(ret), n_times))
+        tfr[:] = ret[:, decim]
+
+
 # Loop of convolution: single trial
 
 
@@ -426,6 +510,8 @@ def _compute_tfr(
     decim=1,
     output="complex",
     n_jobs=None,
+    *,
+    dtype="float64",
     verbose=None,
 ):
     """Compute time-frequency transforms.
@@ -476,8 +562,9 @@ def _compute_tfr(
           coherence across trials.
 
     %(n_jobs)s
-        The number of epochs to process at the same time. The parallelization
-        is implemented across channels.
+        The number of threads to use. The parallelization is implemented
+        across blocks of channels.
+    %(dtype_tfr)s
     %(verbose)s
 
     Returns
@@ -501,6 +588,86 @@ def _compute_tfr(
             "n_times), got %s" % (epoch_data.shape,)
         )
 
+    freqs, decim, Ws = _prepare_tfr_wavelets(
+        epoch_data.shape[2],
+        freqs,
+        sfreq,
+        method,
+        zero_mean,
+        n_cycles,
+        time_bandwidth,
+        use_fft,
+        decim,
+        output,
+    )
+
+    # Initialize output
+    n_freqs = len(freqs)
+    n_tapers = len(Ws)
+    n_epochs, n_chans, n_times = epoch_data[:, :, decim].shape
+    real_dtype, complex_dtype = _check_tfr_dtype(dtype)
+    if output in ("power", "phase", "avg_power", "itc"):
+        dtype = real_dtype
+    elif output in ("complex", "avg_power_itc"):
+        # avg_power_itc is stored as power + 1i * itc to keep a
+        # simple dimensionality
+        dtype = complex_dtype
+
+    if ("avg_" in output) or ("itc" in output):
+        out = np.empty((n_chans, n_freqs, n_times), dtype)
+    elif output in ["complex", "phase"] and method == "multitaper":
+        out = np.empty((n_chans, n_tapers, n_epochs, n_freqs, n_times), dtype)
+    else:
+        out = np.empty((n_chans, n_epochs, n_freqs, n_times), dtype)
+
+    # Parallel computation
+    all_Ws = sum([list(W) for W in Ws], list())
+    _check_wavelet_length(all_Ws, epoch_data.shape[-1], use_fft)
+    parallel, my_cwt, n_jobs = parallel_func(
+        _time_frequency_loop, n_jobs, prefer="threads", max_jobs=n_chans
+    )
+
+    # Parallelization is applied across blocks of channels, the FFTs of the
+    # epochs of each block being computed together
+    picks = np.array_split(np.arange(n_chans), n_jobs)
+    tfrs = parallel(
+        my_cwt(
+            epoch_data[:, pick].transpose(1, 0, 2),
+            Ws,
+            output,
+            use_fft,
+            "same",
+            decim,
+            method,
+            real_dtype,
+        )
+        for pick in picks
+    )
+    for pick, tfr in zip(picks, tfrs):
+        out[pick] = tfr
+
+    if ("avg_" not in output) and ("itc" not in output):
+        # This is to enforce that the first dimension is for epochs
+        if output in ["complex", "phase"] and method == "multitaper":
+            out = out.transpose(2, 0, 1, 3, 4)
+        else:
+            out = out.transpose(1, 0, 2, 3)
+    return out
+
+
+def _prepare_tfr_wavelets(
+    n_times,
+    freqs,
+    sfreq,
+    method,
+    zero_mean,
+    n_cycles,
+    time_bandwidth,
+    use_fft,
+    decim,
+    output,
+):
+    """Check the TFR parameters and make the wavelets of each taper."""
     # Check params
     freqs, sfreq, zero_mean, n_cycles, time_bandwidth, decim = _check_tfr_param(
         freqs,
@@ -537,52 +704,13 @@ def _compute_tfr(
         )
 
     # Check wavelets
-    if len(Ws[0][0]) > epoch_data.shape[2]:
+    if len(Ws[0][0]) > n_times:
         raise ValueError(
             "At least one of the wavelets is longer than the "
             "signal. Use a longer signal or shorter wavelets."
         )
 
-    # Initialize output
-    n_freqs = len(freqs)
-    n_tapers = len(Ws)
-    n_epochs, n_chans, n_times = epoch_data[:, :, decim].shape
-    if output in ("power", "phase", "avg_power", "itc"):
-        dtype = np.float64
-    elif output in ("complex", "avg_power_itc"):
-        # avg_power_itc is stored as power + 1i * itc to keep a
-        # simple dimensionality
-        dtype = np.complex128
-
-    if ("avg_" in output) or ("itc" in output):
-        out = np.empty((n_chans, n_freqs, n_times), dtype)
-    elif output in ["complex", "phase"] and method == "multitaper":
-        out = np.empty((n_chans, n_tapers, n_epochs, n_freqs, n_times), dtype)
-    else:
-        out = np.empty((n_chans, n_epochs, n_freqs, n_times), dtype)
-
-    # Parallel computation
-    all_Ws = sum([list(W) for W in Ws], list())
-    _get_nfft(all_Ws, epoch_data, use_fft)
-    parallel, my_cwt, n_jobs = parallel_func(_time_frequency_loop, n_jobs)
-
-    # Parallelization is applied across channels.
-    tfrs = parallel(
-        my_cwt(channel, Ws, output, use_fft, "same", decim, method)
-        for channel in epoch_data.transpose(1, 0, 2)
-    )
-
-    # FIXME: to avoid overheads we should use np.array_split()
-    for channel_idx, tfr in enumerate(tfrs):
-        out[channel_idx] = tfr
-
-    if ("avg_" not in output) and ("itc" not in output):
-        # This is to enforce that the first dimension is for epochs
-        if output in ["complex", "phase"] and method == "multitaper":
-            out = out.transpose(2, 0, 1, 3, 4)
-        else:
-            out = out.transpose(1, 0, 2, 3)
-    return out
+    return freqs, decim, Ws
 
 
 def _check_tfr_param(
@@ -661,15 +789,17 @@ def _check_tfr_param(
     return freqs, sfreq, zero_mean, n_cycles, time_bandwidth, decim
 
 
-def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
+def _time_frequency_loop(
+    X, Ws, output, use_fft, mode, decim, method=None, dtype=np.float64
+):
     """Aux. function to _compute_tfr.
 
-    Loops time-frequency transform across wavelets and epochs.
+    Loops time-frequency transform across wavelets and blocks of epochs.
 
     Parameters
     ----------
-    X : array, shape (n_epochs, n_times)
-        The epochs data of a single channel.
+    X : array, shape (n_chans, n_epochs, n_times)
+        The epochs data of a block of channels.
     Ws : list, shape (n_tapers, n_wavelets, n_times)
         The wavelets.
     output : str
@@ -691,56 +821,69 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
     method : str | None
         Used only for multitapering to create tapers dimension in the output
         if ``output in ['complex', 'phase']``.
+    dtype : dtype
+        The real output dtype, np.float64 or np.float32.
     """
     # Set output type
-    dtype = np.float64
+    real_dtype, complex_dtype = _check_tfr_dtype(dtype)
+    dtype = real_dtype
     if output in ["complex", "avg_power_itc"]:
-        dtype = np.complex128
+        dtype = complex_dtype
 
     # Init outputs
     decim = _check_decim(decim)
     n_tapers = len(Ws)
-    n_epochs, n_times = X[:, decim].shape
+    n_chans, n_epochs, n_times = X[..., decim].shape
     n_freqs = len(Ws[0])
     if ("avg_" in output) or ("itc" in output):
-        tfrs = np.zeros((n_freqs, n_times), dtype=dtype)
+        tfrs = np.zeros((n_chans, n_freqs, n_times), dtype=dtype)
     elif output in ["complex", "phase"] and method == "multitaper":
-        tfrs = np.zeros((n_tapers, n_epochs, n_freqs, n_times), dtype=dtype)
+        tfrs = np.zeros((n_chans, n_tapers, n_epochs, n_freqs, n_times), dtype=dtype)
     else:
-        tfrs = np.zeros((n_epochs, n_freqs, n_times), dtype=dtype)
+        tfrs = np.zeros((n_chans, n_epochs, n_freqs, n_times), dtype=dtype)
+        tfrs_flat = tfrs.reshape(n_chans * n_epochs, n_freqs, n_times)
+
+    # The epochs of all channels are transformed together, in blocks
+    X = X.reshape(n_chans * n_epochs, -1)
+    chans = np.repeat(np.arange(n_chans), n_epochs)
+    epochs = np.tile(np.arange(n_epochs), n_chans)
 
     # Loops across tapers.
     for taper_idx, W in enumerate(Ws):
-        # No need to check here, it's done earlier (outside parallel part)
-        nfft = _get_nfft(W, X, use_fft, check=False)
-        coefs = _cwt_gen(X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft)
+        coefs = _cwt_gen(
+            X, W, mode=mode, decim=decim, use_fft=use_fft, dtype=complex_dtype
+        )
 
         # Inter-trial phase locking is apparently computed per taper...
         if "itc" in output:
-            plf = np.zeros((n_freqs, n_times), dtype=np.complex128)
+            plf = np.zeros((n_chans, n_freqs, n_times), dtype=complex_dtype)
+
+        # Loop across blocks of epochs
+        start = 0
+        for tfr in coefs:
+            sl = slice(start, start + len(tfr))
+            start += len(tfr)
 
-        # Loop across epochs
-        for epoch_idx, tfr in enumerate(coefs):
             # Transform complex values
             if output in ["power", "avg_power"]:
-                tfr = (tfr * tfr.conj()).real  # power
+                tfr = tfr.real**2 + tfr.imag**2  # power
             elif output == "phase":
                 tfr = np.angle(tfr)
             elif output == "avg_power_itc":
                 tfr_abs = np.abs(tfr)
-                plf += tfr / tfr_abs  # phase
+                _add_by_channel(plf, chans[sl], tfr / tfr_abs)  # phase
                 tfr = tfr_abs**2  # power
             elif output == "itc":
-                plf += tfr / np.abs(tfr)  # phase
+                _add_by_channel(plf, chans[sl], tfr / np.abs(tfr))  # phase
                 continue  # not need to stack anything else than plf
 
             # Stack or add
             if ("avg_" in output) or ("itc" in output):
-                tfrs += tfr
+                _add_by_channel(tfrs, chans[sl], tfr)
             elif output in ["complex", "phase"] and method == "multitaper":
-                tfrs[taper_idx, epoch_idx] += tfr
+                tfrs[chans[sl], taper_idx, epochs[sl]] = tfr
             else:
-                tfrs[epoch_idx] += tfr
+                tfrs_flat[sl] += tfr
 
         # Compute inter trial coherence
         if output == "avg_power_itc":
@@ -758,6 +901,118 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
     return tfrs
 
 
+def _add_by_channel(out, ch_idx, tfr):
+    """Sum the transforms of a block of epochs into their (sorted) channels."""
+    chs, first = np.unique(ch_idx, return_index=True)
+    out[chs] += np.add.reduceat(tfr, first, axis=0)
+
+
+def _power_plf_loop(X, Ws, use_fft, decim, dtype=np.float64):
+    """Aux. function to _TFRReducer.
+
+    Compute the single-trial power (averaged across tapers) and the sums of
+    the unit phase vectors (per taper) of a block of channels.
+
+    Parameters
+    ----------
+    X : array, shape (n_chans, n_epochs, n_times)
+        The epochs data of a block of channels.
+    Ws : list, shape (n_tapers, n_wavelets, n_times)
+        The wavelets.
+    use_fft : bool
+        Use the FFT for convolutions or not.
+    decim : slice
+        The decimation slice: e.g. power[:, decim]
+    dtype : dtype
+        The precision of the transforms, np.float64 or np.float32.
+
+    Returns
+    -------
+    power : array, shape (n_chans, n_epochs, n_freqs, n_times)
+        The single-trial power.
+    plf : array, shape (n_tapers, n_chans, n_freqs, n_times)
+        The sums of the unit phase vectors across epochs.
+    """
+    n_chans, n_epochs, n_times = X[..., decim].shape
+    n_freqs = len(Ws[0])
+    real_dtype, complex_dtype = _check_tfr_dtype(dtype)
+    power = np.zeros((n_chans, n_epochs, n_freqs, n_times), real_dtype)
+    power_flat = power.reshape(n_chans * n_epochs, n_freqs, n_times)
+    plf = np.zeros((len(Ws), n_chans, n_freqs, n_times), complex_dtype)
+    X = X.reshape(n_chans * n_epochs, -1)
+    chans = np.repeat(np.arange(n_chans), n_epochs)
+    for taper_idx, W in enumerate(Ws):
+        start = 0
+        coefs = _cwt_gen(
+            X, W, mode="same", decim=decim, use_fft=use_fft, dtype=complex_dtype
+        )
+        for tfr in coefs:
+            sl = slice(start, start + len(tfr))
+            start += len(tfr)
+            tfr_abs = np.abs(tfr)
+            _add_by_channel(plf[taper_idx], chans[sl], tfr / tfr_abs)
+            power_flat[sl] += tfr_abs**2
+    power /= len(Ws)
+    return power, plf
+
+
+class _TFRReducer:
+    """Accumulate the average power and ITC of epochs fed in blocks.
+
+    Only sums across epochs are kept, so the memory used does not depend on
+    the number of epochs. The power variance uses Welford's online algorithm,
+    generalized to blocks (Chan et al.).
+    """
+
+    def __init__(self, Ws, n_chans, n_times, use_fft, decim, n_jobs, return_var, dtype):
+        self.Ws = Ws
+        self.dtype = dtype
+        self.use_fft = use_fft
+        self.decim = decim
+        self.nave = 0
+        shape = (n_chans, len(Ws[0]), len(range(n_times)[decim]))
+        self.power = np.zeros(shape)
+        self.plf = np.zeros((len(Ws),) + shape, np.complex128)
+        self.m2 = np.zeros(shape) if return_var else None
+        self.parallel, self.p_fun, n_jobs = parallel_func(
+            _power_plf_loop, n_jobs, prefer="threads", max_jobs=n_chans
+        )
+        self.picks = np.array_split(np.arange(n_chans), n_jobs)
+
+    def update(self, data):
+        """Add a block of epochs of shape (n_epochs, n_chans, n_times)."""
+        out = self.parallel(
+            self.p_fun(
+                data[:, pick].transpose(1, 0, 2),
+                self.Ws,
+                self.use_fft,
+                self.decim,
+                self.dtype,
+            )
+            for pick in self.picks
+        )
+        n_new = len(data)
+        power = np.empty((n_new,) + self.power.shape)
+        for pick, (this_power, this_plf) in zip(self.picks, out):
+            power[:, pick] = this_power.transpose(1, 0, 2, 3)
+            self.plf[:, pick] += this_plf
+        if self.m2 is not None:
+            mean_new = power.mean(axis=0)
+            delta = mean_new - self.power / max(self.nave, 1)
+            self.m2 += ((power - mean_new) ** 2).sum(axis=0)
+            self.m2 += delta**2 * (self.nave * n_new / (self.nave + n_new))
+        self.power += power.sum(axis=0)
+        self.nave += n_new
+
+    def finalize(self):
+        """Get the average power, ITC, and power variance across epochs."""
+        with np.errstate(invalid="ignore"):  # NaN without epochs
+            power = self.power / self.nave
+            itc = np.abs(self.plf).mean(axis=0) / self.nave
+            var = None if self.m2 is None else self.m2 / self.nave
+        return power, itc, var
+
+
 @fill_doc
 def cwt(X, Ws, use_fft=True, mode="same", decim=1):
     """Compute time-frequency decomposition with continuous wavelet transform.
@@ -785,20 +1040,14 @@ def cwt(X, Ws, use_fft=True, mode="same", decim=1):
     mne.time_frequency.tfr_morlet : Compute time-frequency decomposition
                                     with Morlet wavelets.
     """
-    nfft = _get_nfft(Ws, X, use_fft)
-    return _cwt_array(X, Ws, nfft, mode, decim, use_fft)
+    _check_wavelet_length(Ws, X.shape[-1], use_fft)
+    return _cwt_array(X, Ws, mode, decim, use_fft)
 
 
-def _cwt_array(X, Ws, nfft, mode, decim, use_fft):
+def _cwt_array(X, Ws, mode, decim, use_fft, dtype=np.complex128):
     decim = _check_decim(decim)
-    coefs = _cwt_gen(X, Ws, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft)
-
-    n_signals, n_times = X[:, decim].shape
-    tfrs = np.empty((n_signals, len(Ws), n_times), dtype=np.complex128)
-    for k, tfr in enumerate(coefs):
-        tfrs[k] = tfr
-
-    return tfrs
+    coefs = _cwt_gen(X, Ws, mode=mode, decim=decim, use_fft=use_fft, dtype=dtype)
+    return np.concatenate(list(coefs))
 
 
 def _tfr_aux(
@@ -808,6 +1057,14 @@ def _tfr_aux(
 
     """Help reduce redundancy between tfr_morlet and tfr_multitaper."""
     decim = _check_decim(decim)
+    if average and isinstance(inst, BaseEpochs) and not inst.preload:
+        # stream the epochs instead of loading them all at once
+        if output == "complex":
+            raise ValueError('output must be "power" if average=True')
+        ((power, itc, _),) = _tfr_average_epochs(
+            method, inst, freqs, decim, picks, return_itc, **tfr_params
+        )
+        return (power, itc) if return_itc else power
     data = _get_data(inst, return_itc)
     info = inst.info.copy()  # make a copy as sfreq can be altered
 
@@ -881,6 +1138,96 @@ def _tfr_aux(
     return out
 
 
+def _tfr_average_epochs(
+    method,
+    epochs,
+    freqs,
+    decim,
+    picks,
+    return_itc,
+    return_var=False,
+    by_event_type=False,
+    batch_size=32,
+    *,
+    n_cycles,
+    zero_mean,
+    time_bandwidth=None,
+    use_fft,
+    n_jobs,
+    dtype="float64",
+):
+    """Average the TFR of epochs fed in blocks to _TFRReducer instances."""
+    _validate_type(batch_size, "int-like", "batch_size")
+    batch_size = int(batch_size)
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    info = epochs.info.copy()  # make a copy as sfreq can be altered
+    picks = _picks_to_idx(info, picks, exclude="bads")
+    info = pick_info(info, picks)
+    freqs, decim, Ws = _prepare_tfr_wavelets(
+        len(epochs.times),
+        freqs,
+        info["sfreq"],
+        method,
+        zero_mean,
+        n_cycles,
+        time_bandwidth,
+        use_fft,
+        decim,
+        "avg_power_itc",
+    )
+    dtype = _check_tfr_dtype(dtype)[0]
+    _check_wavelet_length(
+        sum([list(W) for W in Ws], list()), len(epochs.times), use_fft
+    )
+
+    # One reducer per condition, fed in the order of the (good) epochs
+    conditions = list(epochs.event_id.items()) if by_event_type else [(None, None)]
+    reducers = {
+        code: _TFRReducer(
+            Ws, len(picks), len(epochs.times), use_fft, decim, n_jobs, return_var, dtype
+        )
+        for _, code in conditions
+    }
+    blocks = {code: list() for _, code in conditions}
+    epochs.__iter__()
+    while True:
+        try:
+            epoch, code = epochs.__next__(return_event_id=True)
+        except StopIteration:
+            break
+        code = code if by_event_type else None
+        blocks[code].append(epoch[picks])
+        if len(blocks[code]) == batch_size:
+            reducers[code].update(np.array(blocks[code]))
+            blocks[code].clear()
+    for code, block in blocks.items():
+        if len(block):
+            reducers[code].update(np.array(block))
+
+    times = epochs.times[decim].copy()
+    with info._unlock():
+        info["sfreq"] /= decim.step
+    out = list()
+    for comment, code in conditions:
+        reducer = reducers[code]
+        tfrs = list()
+        for data, kind in zip(reducer.finalize(), ("power", "itc", "power-var")):
+            if data is not None:
+                data = AverageTFR(
+                    info.copy(),
+                    data.astype(dtype),
+                    times,
+                    freqs,
+                    reducer.nave,
+                    comment=comment,
+                    method=f"{method}-{kind}",
+                )
+            tfrs.append(data)
+        out.append(tfrs)
+    return out
+
+
 @verbose
 def tfr_morlet(
     inst,
@@ -895,6 +1242,8 @@ def tfr_morlet(
     average=True,
     output="power",
     verbose=None,
+    *,
+    dtype="float64",
 ):
     """Compute Time-Frequency Representation (TFR) using Morlet wavelets.
 
@@ -929,6 +1278,7 @@ def tfr_morlet(
 
         .. versionadded:: 0.15.0
     %(verbose)s
+    %(dtype_tfr)s
 
     Returns
     -------
@@ -965,6 +1315,7 @@ def tfr_morlet(
         use_fft=use_fft,
         zero_mean=zero_mean,
         output=output,
+        dtype=dtype,
     )
     return _tfr_aux(
         "morlet", inst, freqs, decim, return_itc, picks, average, **tfr_params
@@ -983,6 +1334,8 @@ def tfr_array_morlet(
     output="complex",
     n_jobs=None,
     verbose=None,
+    *,
+    dtype="float64",
 ):
     """Compute Time-Frequency Representation (TFR) using Morlet wavelets.
 
@@ -1012,9 +1365,10 @@ def tfr_array_morlet(
         * ``'avg_power_itc'`` : average of single trial power and inter-trial
           coherence across trials.
     %(n_jobs)s
-        The number of epochs to process at the same time. The parallelization
-        is implemented across channels. Default 1.
+        The number of threads to use. The parallelization is implemented
+        across blocks of channels. Default 1.
     %(verbose)s
+    %(dtype_tfr)s
 
     Returns
     -------
@@ -1043,6 +1397,11 @@ def tfr_array_morlet(
     %(temporal_window_tfr_intro)s
     %(temporal_window_tfr_morlet_notes)s
 
+    With ``use_fft=True``, the wavelet spectra of the last 10 sets of wavelets
+    are cached in memory and reused by later calls with the same wavelets,
+    number of samples and ``decim``. Use :func:`mne.utils.clear_caches` to
+    free them.
+
     .. versionadded:: 0.14.0
 
     References
@@ -1061,6 +1420,7 @@ def tfr_array_morlet(
         decim=decim,
         output=output,
         n_jobs=n_jobs,
+        dtype=dtype,
         verbose=verbose,
     )
 
@@ -1078,6 +1438,7 @@ def tfr_multitaper(
     picks=None,
     average=True,
     *,
+    dtype="float64",
     verbose=None,
 ):
     """Compute Time-Frequency Representation (TFR) using DPSS tapers.
@@ -1102,6 +1463,7 @@ def tfr_multitaper(
     %(n_jobs)s
     %(picks_good_data)s
     %(average_tfr)s
+    %(dtype_tfr)s
     %(verbose)s
 
     Returns
@@ -1134,12 +1496,131 @@ def tfr_multitaper(
         use_fft=use_fft,
         zero_mean=True,
         time_bandwidth=time_bandwidth,
+        dtype=dtype,
     )
     return _tfr_aux(
         "multitaper", inst, freqs, decim, return_itc, picks, average, **tfr_params
     )
 
 
+@verbose
+def tfr_average(
+    epochs,
+    freqs,
+    n_cycles,
+    *,
+    method="morlet",
+    zero_mean=None,
+    time_bandwidth=None,
+    use_fft=True,
+    return_itc=True,
+    return_var=False,
+    by_event_type=False,
+    decim=1,
+    picks=None,
+    batch_size=32,
+    n_jobs=None,
+    dtype="float64",
+    verbose=None,
+):
+    """Average the TFR of epochs, streaming them in blocks.
+
+    Same average power and ITC as `~mne.time_frequency.tfr_morlet` and
+    `~mne.time_frequency.tfr_multitaper` with ``average=True``, but the epochs
+    are loaded and transformed ``batch_size`` at a time and only sums across
+    epochs are kept, so the memory used does not depend on the number of
+    epochs.
+
+    Parameters
+    ----------
+    epochs : Epochs
+        The epochs. They do not need to be preloaded.
+    %(freqs_tfr)s
+    %(n_cycles_tfr)s
+    method : 'morlet' | 'multitaper'
+        Use Morlet wavelets or DPSS tapers.
+    zero_mean : bool | None
+        If True, make sure the wavelets have a mean of zero. None (default)
+        means True for ``method='multitaper'`` and False otherwise.
+    time_bandwidth : float | None
+        Only used with ``method='multitaper'``, see
+        `~mne.time_frequency.tfr_multitaper`. None (default) means 4.0.
+    use_fft : bool
+        Use the FFT for convolutions or not. Default True.
+    return_itc : bool
+        Return the inter-trial coherence (ITC) as well as the average power.
+        Default True.
+    return_var : bool
+        Return the variance of the single-trial power across epochs, computed
+        with Welford's online algorithm. Default False.
+    by_event_type : bool
+        When ``False`` (the default) all epochs are averaged together. When
+        ``True``, the epochs are averaged by event type (as specified using the
+        ``event_id`` parameter) in a single pass, and lists are returned with
+        one `~mne.time_frequency.AverageTFR` for each event type (in the order
+        of ``event_id``), with the ``.comment`` attribute set to the event
+        type.
+    %(decim_tfr)s
+    %(picks_good_data)s
+    batch_size : int
+        The number of epochs transformed at once. Default 32.
+    %(n_jobs)s
+        The parallelization is implemented across blocks of channels.
+    %(dtype_tfr)s
+    %(verbose)s
+
+    Returns
+    -------
+    power : AverageTFR | list of AverageTFR
+        The average power.
+    itc : AverageTFR | list of AverageTFR
+        The inter-trial coherence. Only returned if ``return_itc`` is True.
+    var : AverageTFR | list of AverageTFR
+        The variance of the power across epochs. Only returned if
+        ``return_var`` is True.
+
+    See Also
+    --------
+    mne.time_frequency.tfr_morlet
+    mne.time_frequency.tfr_multitaper
+
+    Notes
+    -----
+    Bad epochs of non-preloaded epochs are dropped as they are read, as in
+    :meth:`mne.Epochs.average`, so ``epochs`` is not modified.
+
+    .. versionadded:: 1.7
+    """
+    from ..epochs import BaseEpochs
+
+    _validate_type(epochs, BaseEpochs, "epochs")
+    _check_option("method", method, ["morlet", "multitaper"])
+    out = _tfr_average_epochs(
+        method,
+        epochs,
+        freqs,
+        decim,
+        picks,
+        return_itc,
+        return_var,
+        by_event_type,
+        batch_size,
+        n_cycles=n_cycles,
+        zero_mean=zero_mean,
+        time_bandwidth=time_bandwidth,
+        use_fft=use_fft,
+        n_jobs=n_jobs,
+        dtype=dtype,
+    )
+    keep = [True, return_itc, return_var]
+    out = [[tfr for tfr, k in zip(tfrs, keep) if k] for tfrs in out]
+    if not by_event_type:
+        out = out[0]
+    else:
+        out = [list(tfrs) for tfrs in zip(*out)]
+    return tuple(out) if len(out) > 1 else out[0]
+
+
 # TFR(s) class
 
 
@@ -3029,6 +3510,13 @@ def _check_decim(decim):
     return decim
 
 
+def _check_tfr_dtype(dtype):
+    """Get the real and complex dtypes of the requested TFR precision."""
+    dtype = np.dtype(dtype)
+    _check_option("dtype", dtype.name, ("float64", "float32"))
+    return dtype, np.result_type(dtype, np.complex64)
+
+
 # i/o
 
 
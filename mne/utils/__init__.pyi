@@ -131,6 +131,7 @@ __all__ = [
     "check_fname",
     "check_random_state",
     "check_version",
+    "clear_caches",
     "compute_corr",
     "copy_base_doc_to_subclass_doc",
     "copy_doc",
@@ -372,6 +373,7 @@ from .numerics import (
     _undo_scaling_array,
     _undo_scaling_cov,
     array_split_idx,
+    clear_caches,
     compute_corr,
     create_slices,
     grand_average,
@@ -170,6 +170,10 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_FILTER_BLOCK_SIZE": (
+        "int, the number of channels to FIR filter at once with batched FFTs "
+        "(default chooses it from the signal length)"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
@@ -180,6 +184,16 @@ _known_config_types = {
         "str, threshold on the minimum size of arrays passed to the workers that "
         "triggers automated memory mapping, e.g., 1M or 0.5G"
     ),
+    "MNE_PARALLEL_BACKEND": (
+        'str, either "joblib" (default) or "shared_memory". The latter runs '
+        "process-based parallel jobs in a persistent pool and shares large "
+        "arrays with the workers via shared memory"
+    ),
+    "MNE_PSD_MEDIAN_BLOCK_SIZE": (
+        "int, the number of spectral values kept in memory for the median Welch "
+        "PSD of Raw data that are not preloaded. If set, longer recordings use "
+        "an approximate median (default computes the exact median)"
+    ),
     "MNE_REPR_HTML": (
         "bool, represent some of our objects with rich HTML in a notebook "
         "environment"
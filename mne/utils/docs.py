@@ -554,6 +554,16 @@ buffer_size : int | None
     a small block of locations at a time.
 """
 
+docdict[
+    "buffer_size_sec_stream"
+] = """
+buffer_size_sec : float | None
+    The length of the chunks (in seconds) that are read, processed, and
+    written at a time when ``out_fname`` is used. This controls the peak
+    memory usage. If None (default), the buffer size of the original file
+    is used.
+"""
+
 docdict[
     "by_event_type"
 ] = """
@@ -694,6 +704,28 @@ check_disjoint : bool
     the second dimension of ``X`` (usually the "time" dimension) is large.
 """
 
+_checkpoint = """
+checkpoint : path-like | list of path-like | None
+    File in which to save the progress of the permutations, so that an
+    interrupted run can be resumed by calling the function again with the same
+    arguments. The H0 values computed so far, the state of the random number
+    generator used to draw the permutations, and the observed statistics (to
+    make sure that the file matches the test) are written every few hundred
+    permutations. A list of the files written by all shards of a test (see
+    ``shard``) merges their results without computing any permutation.{}
+    Default is ``None`` (no checkpoint).
+
+    When resuming or merging, the permutations are drawn with the random state
+    stored in the file, so ``seed`` must be ``None`` or the seed the file was
+    written with, otherwise an error is raised.
+
+    .. versionadded:: 1.7
+"""
+docdict["checkpoint_clust"] = _checkpoint.format(
+    "\n    Cannot be used with ``step_down_p > 0``."
+)
+docdict["checkpoint_perm"] = _checkpoint.format("")
+
 docdict[
     "chpi_amplitudes"
 ] = """
@@ -1140,6 +1172,20 @@ dtype : numpy.dtype
     (default) the data type is not modified.
 """
 
+docdict[
+    "dtype_tfr"
+] = """
+dtype : str
+    The floating-point precision of the output, ``'float64'`` (default) or
+    ``'float32'``. Complex outputs are ``complex128`` or ``complex64``,
+    respectively. Single precision halves the memory used. Relative to the
+    largest magnitude of the output, the errors are then typically about
+    ``1e-7``, and below ``1e-4`` for phase and inter-trial coherence, but
+    smaller values can have larger relative errors.
+
+    .. versionadded:: 1.7
+"""
+
 # %%
 # E
 
@@ -2643,6 +2689,21 @@ docdict["method_plot_psd_auto"] = _method_psd.format(
 docdict["method_psd"] = _method_psd.format("", "")
 docdict["method_psd_auto"] = _method_psd.format(" | ``'auto'``", "")
 
+docdict[
+    "method_resample"
+] = """
+method : str
+    Resampling method to use. Can be ``"fft"`` (default) or ``"polyphase"``
+    to use FFT-based or polyphase FIR resampling, respectively. These wrap
+    :func:`scipy.signal.resample` and :func:`scipy.signal.resample_poly`,
+    respectively.
+    With ``"polyphase"``, ``npad`` is ignored, and the resampling ratio is
+    approximated by a fraction ``up / down`` with ``up`` and ``down`` at most
+    1000 (the anti-aliasing filter has ``20 * max(up, down) + 1`` taps). An
+    error is raised if this approximation would shift the last sample by
+    half a sample or more, in which case ``"fft"`` should be used.
+"""
+
 docdict[
     "mode_eltc"
 ] = """
@@ -2767,6 +2828,21 @@ docdict[
 n_jobs : int | str
     Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
     is installed properly and ``method='fir'``.
+
+    .. versionchanged:: 1.7
+       FIR and IIR filtering use threads that filter the channels in place
+       instead of worker processes, regardless of the joblib backend and of
+       the ``MNE_PARALLEL_BACKEND`` config value.
+"""
+
+docdict[
+    "n_jobs_read"
+] = """
+n_jobs : int | None
+    The number of threads to use to read data that span several files (e.g.,
+    split files or concatenated raw instances) concurrently. Each thread
+    reads one file into its own part of the output. This can speed up
+    reading from slow (e.g., network) file systems.
 """
 
 docdict[
@@ -2915,6 +2991,18 @@ of :class:`~mne.io.Raw`, :class:`~mne.Epochs`, or :class:`~mne.Evoked`).
 docdict["notes_plot_*_psd_func"] = _notes_plot_psd.format("function")
 docdict["notes_plot_psd_meth"] = _notes_plot_psd.format("method")
 
+docdict[
+    "notes_psd_raw_not_preloaded"
+] = """\
+When the data are not preloaded and Welch's method is used with
+``average='mean'`` or ``average='median'``, the data are read a few
+segments at a time instead of all at once. The median is exact, which
+requires keeping the spectra of all segments in memory. To bound that
+memory, set the ``MNE_PSD_MEDIAN_BLOCK_SIZE`` config value to the number of
+spectral values to keep: longer recordings then use an approximate median
+(a remedian, i.e., a median of the medians of blocks of segments).
+"""
+
 docdict[
     "notes_spectrum_array"
 ] = """
@@ -2940,7 +3028,8 @@ docdict[
 npad : int | str
     Amount to pad the start and end of the data.
     Can also be ``"auto"`` to use a padding that will result in
-    a power-of-two size (can be much faster).
+    a power-of-two size (can be much faster). Only used when
+    ``method="fft"``.
 """
 
 docdict[
@@ -3142,6 +3231,15 @@ origin : array-like, shape (3,) | str
     options or specifying the origin manually.
 """
 
+docdict[
+    "out_fname_stream"
+] = """
+out_fname : path-like | None
+    If not None, the data are processed in chunks and written directly to
+    this FIF file instead of being modified in memory, so the data do not
+    need to be preloaded. Only supported for Raw instances.
+"""
+
 docdict[
     "out_type_clust"
 ] = """
@@ -3208,6 +3306,25 @@ docdict["pad_fir"] = (
 """
 )
 
+docdict["pad_resample"] = (
+    _pad_base
+    + """
+    When ``method="polyphase"``, this is the ``padtype`` of
+    :func:`scipy.signal.resample_poly`, and ``"reflect_limited"`` is not
+    supported.
+"""
+)
+
+docdict["pad_resample_auto"] = (
+    _pad_base.replace("pad : str", 'pad : str | "auto"')
+    + """
+    When ``method="polyphase"``, this is the ``padtype`` of
+    :func:`scipy.signal.resample_poly`, and ``"reflect_limited"`` is not
+    supported. The default ``"auto"`` uses ``"reflect_limited"`` when
+    ``method="fft"`` and ``"reflect"`` when ``method="polyphase"``.
+"""
+)
+
 docdict[
     "pca_vars_pctf"
 ] = """
@@ -4082,6 +4199,21 @@ References
 .. footbibliography::
 """
 
+docdict[
+    "shard_perm"
+] = """
+shard : tuple of int | None
+    A tuple ``(index, n_shards)`` to only compute the permutations ``index,
+    index + n_shards, index + 2 * n_shards, ...`` out of ``n_permutations``,
+    e.g., in separate jobs on several compute nodes. Requires ``checkpoint``
+    and an int ``seed``, so that all shards draw the same permutations. The
+    returned ``H0`` and p-values only use the permutations of this shard;
+    passing the checkpoint files of all shards as ``checkpoint`` gives the
+    result of the full test.
+
+    .. versionadded:: 1.7
+"""
+
 docdict[
     "show"
 ] = """\
@@ -4300,7 +4432,12 @@ _stat_fun_clust_base = """
 stat_fun : callable | None
     Function called to calculate the test statistic. Must accept 1D-array as
     input and return a 1D array. If ``None`` (the default), uses
-    `mne.stats.{}`.
+    `mne.stats.{}`, whose values are computed for blocks of permutations at
+    once, which is much faster than calling ``stat_fun`` once per
+    permutation.
+
+    .. versionchanged:: 1.7
+       The default statistic is computed for blocks of permutations.
 """
 
 docdict["stat_fun_clust_f"] = _stat_fun_clust_base.format("f_oneway")
@@ -4750,6 +4887,19 @@ tmin : float
     Start time of the raw data to use in seconds (must be >= 0).
 """
 
+docdict[
+    "tmin_tmax_csd_morlet"
+] = """
+tmin, tmax : float | array-like of float | None
+    Minimum and maximum time instants to consider, in seconds. ``None`` starts
+    at the first sample or ends at the last sample. If array-like, one CSD is
+    computed for each time window ``(tmin[i], tmax[i])`` in a single pass over
+    the data (a float or ``None`` is used for all the windows).
+
+    .. versionchanged:: 1.7
+       Support for array-like values to compute several time windows.
+"""
+
 docdict[
     "tmin_tmax_psd"
 ] = """\
@@ -5093,8 +5243,13 @@ docdict[
     "window_resample"
 ] = """
 window : str | tuple
-    Frequency-domain window to use in resampling.
-    See :func:`scipy.signal.resample`.
+    When ``method="fft"``, this is the *frequency-domain* window to use in
+    resampling, and should be the same length as the signal; see
+    :func:`scipy.signal.resample` for details. When ``method="polyphase"``,
+    this is the *time-domain* window used to design the anti-aliasing
+    filter; see :func:`scipy.signal.resample_poly` for details. The default
+    ``"auto"`` uses ``"boxcar"`` for ``method="fft"`` and
+    ``("kaiser", 5.0)`` for ``method="polyphase"``.
 """
 
 # %%
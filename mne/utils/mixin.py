@@ -228,9 +228,17 @@ class GetEpochsMixin:
             # will reset the index for us
             GetEpochsMixin.metadata.fset(inst, metadata, verbose=False)
         if inst.preload and select_data:
-            # ensure that each Epochs instance owns its own data so we can
-            # resize later if necessary
-            inst._data = np.require(inst._data[select], requirements=["O"])
+            if isinstance(inst._data, np.memmap):
+                from ..io.base import _convert_slice
+
+                # keep memory-mapped data on disk whenever possible
+                if isinstance(select, np.ndarray):
+                    select = _convert_slice(select)
+                inst._data = inst._data[select]
+            else:
+                # ensure that each Epochs instance owns its own data so we can
+                # resize later if necessary
+                inst._data = np.require(inst._data[select], requirements=["O"])
         if drop_event_id:
             # update event id to reflect new content of inst
             inst.event_id = {
@@ -633,7 +641,12 @@ class ExtendedTimeMixin(TimeMixin):
         self._set_times(self.times[mask])
         self._raw_times = self._raw_times[mask]
         self._update_first_last()
-        self._data = self._data[..., mask]
+        if isinstance(self._data, np.memmap):
+            # the mask is contiguous, so slice to avoid copying into memory
+            idx = np.where(mask)[0]
+            self._data = self._data[..., idx[0] : idx[-1] + 1]
+        else:
+            self._data = self._data[..., mask]
 
         return self
 
@@ -689,10 +702,13 @@ class ExtendedTimeMixin(TimeMixin):
             self.info["sfreq"] = new_sfreq
 
         if self.preload:
+            memmap = isinstance(self._data, np.memmap)
             if decim != 1:
-                self._data = self._data[..., decim_slice].copy()
+                self._data = self._data[..., decim_slice]
+                if not memmap:  # keep memory-mapped data on disk
+                    self._data = self._data.copy()
                 self._raw_times = self._raw_times[decim_slice].copy()
-            else:
+            elif not memmap:
                 self._data = np.ascontiguousarray(self._data)
             self._decim_slice = slice(None)
             self._decim = 1
@@ -1155,6 +1155,23 @@ def _custom_lru_cache(maxsize):
     return dec
 
 
+def clear_caches():
+    """Clear the results that MNE-Python keeps in memory to reuse them.
+
+    Some intermediate results are cached in memory so that later calls with
+    the same parameters can reuse them, for example the last 50 FIR and IIR
+    filter designs (and their ringing estimates), the spectra of the last 10
+    FIR filters applied with FFTs, the last 50 sets of DPSS tapers and the
+    spectra of the last 10 sets of wavelets used in time-frequency transforms.
+    They stay allocated for the lifetime of the process, unless they are
+    cleared with this function.
+
+    .. versionadded:: 1.7
+    """
+    for cache in _LRU_CACHES.values():
+        cache.clear()
+
+
 def _array_repr(x):
     """Produce compact info about float ndarray x."""
     assert isinstance(x, np.ndarray), type(x)
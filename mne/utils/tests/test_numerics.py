@@ -32,6 +32,7 @@ from mne.utils import (
     _time_mask,
     _undo_scaling_array,
     _undo_scaling_cov,
+    clear_caches,
     compute_corr,
     create_slices,
     grand_average,
@@ -607,3 +608,9 @@ def test_custom_lru_cache():
     with pytest.raises(RuntimeError, match="Unsupported sparse type"):
         my_fun_2(1, sparse.eye(1, format="coo"))
     assert n_calls == [2, 2]  # never did any computation
+    # clearing frees the cached values, which get recomputed
+    clear_caches()
+    assert len(_LRU_CACHES[fun_hash]) == 0
+    assert len(_LRU_CACHES[fun_2_hash]) == 0
+    assert my_fun(1, 2, 3) == "int, int, int"
+    assert n_calls == [3, 2]
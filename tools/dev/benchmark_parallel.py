@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Compare the parallel backends of mne.parallel.parallel_func.
+
+Each workload is run repeatedly with joblib's loky and threading backends and
+with MNE's shared memory backend (MNE_PARALLEL_BACKEND="shared_memory"), so
+that both the first-call (pool startup) and the steady-state cost are shown.
+
+Usage::
+
+    python tools/dev/benchmark_parallel.py [n_jobs] [n_repeats]
+"""
+
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import joblib
+import numpy as np
+
+import mne
+from mne.parallel import _shutdown_pool
+from mne.stats import permutation_cluster_1samp_test
+from mne.time_frequency import tfr_array_morlet
+
+n_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+n_repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+mne.set_log_level("error")
+rng = np.random.default_rng(0)
+
+info = mne.create_info(64, 1000.0, "eeg")
+raw = mne.io.RawArray(rng.standard_normal((64, 300_000)) * 1e-6, info)
+epochs_data = rng.standard_normal((50, 32, 2000))
+freqs = np.arange(8.0, 40.0, 2.0)
+stat_data = rng.standard_normal((20, 2000))
+
+workloads = {
+    "Raw.filter (64 ch x 300 s)": lambda: raw.copy().filter(1.0, 40.0, n_jobs=n_jobs),
+    "tfr_array_morlet (50 x 32 x 2 s)": lambda: tfr_array_morlet(
+        epochs_data, 1000.0, freqs, n_jobs=n_jobs, output="power"
+    ),
+    "permutation_cluster_1samp_test": lambda: permutation_cluster_1samp_test(
+        stat_data, n_permutations=1000, n_jobs=n_jobs, seed=0
+    ),
+}
+
+
+@contextmanager
+def _backend(name):
+    if name == "shared_memory":
+        os.environ["MNE_PARALLEL_BACKEND"] = "shared_memory"
+        try:
+            yield
+        finally:
+            del os.environ["MNE_PARALLEL_BACKEND"]
+            _shutdown_pool()
+    else:
+        with joblib.parallel_config(name):
+            yield
+
+
+print(f"n_jobs={n_jobs}, {n_repeats} repeats (first call, then mean of others)")
+for workload, func in workloads.items():
+    print(f"\n{workload}")
+    for backend in ("loky", "threading", "shared_memory"):
+        with _backend(backend):
+            times = list()
+            for _ in range(n_repeats):
+                t0 = time.perf_counter()
+                func()
+                times.append(time.perf_counter() - t0)
+        rest = f"{np.mean(times[1:]):7.3f} s" if len(times) > 1 else ""
+        print(f"    {backend:<14} {times[0]:7.3f} s  {rest}")